@@ -0,0 +1,168 @@
+"""Ambiente vetorizado com milhares de partidas simultâneas, para treinar e avaliar bots.
+
+O estado de todas as partidas fica em arrays do NumPy (placar, rodada e histórico
+recente de jogadas), e cada `passo` resolve uma rodada de todas elas de uma vez, com
+as mesmas tabelas de resultado e pesos de `JogoJokenpo.determinar_vencedor` e o placar
+limitado a zero. O agente joga no lugar do usuário; o computador sorteia ao acaso, ou
+segue uma `PoliticaOtima` do solver, a menos que as jogadas dele sejam informadas
+(p. ex. para um bot treinar contra si mesmo). A partida termina quando alguém atinge
+`pontos_para_vencer` e recomeça sozinha no mesmo passo.
+
+Exemplo:
+    ambiente = AmbienteVetorizado(4096, janela_historico=8, semente=0)
+    observacao = ambiente.reiniciar()
+    for _ in range(1000):
+        acoes = escolher(observacao)  # Um índice de item por partida
+        observacao, recompensas, terminados, truncados, info = ambiente.passo(acoes)
+"""
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from jogo import PONTOS_PARA_VENCER, REGRAS_PADRAO
+from regras import ConjuntoRegras
+from solver import PoliticaOtima
+from torneio import LIMITE_RODADAS
+
+# Marca as posições do histórico anteriores à primeira jogada da partida
+SEM_JOGADA: int = -1
+
+
+class AmbienteVetorizado:
+    """Várias partidas independentes avançadas juntas, uma rodada por passo.
+
+    Recompensas: +1 no passo em que o agente vence a partida, -1 quando perde e 0 nos
+    demais, inclusive quando a partida é truncada por `limite_rodadas`.
+    """
+
+    def __init__(self, jogos: int, regras: Optional[ConjuntoRegras] = None, pontos_para_vencer: int = PONTOS_PARA_VENCER,
+                 janela_historico: int = 0, oponente: Optional[PoliticaOtima] = None, limite_rodadas: int = LIMITE_RODADAS,
+                 semente: Optional[int] = None) -> None:
+        """Inicializa o ambiente; `reiniciar` começa as partidas.
+
+        Parâmetros:
+            jogos (int): O número de partidas simultâneas.
+            regras (Optional[ConjuntoRegras]): Os itens e quem vence quem (padrão: `REGRAS_PADRAO`).
+            pontos_para_vencer (int): A pontuação que encerra a partida.
+            janela_historico (int): Quantas rodadas recentes aparecem na observação (0 desativa).
+            oponente (Optional[PoliticaOtima]): A política do computador (padrão: escolha aleatória),
+                calculada para as mesmas regras e a mesma `pontos_para_vencer`.
+            limite_rodadas (int): O número de rodadas após o qual a partida é truncada.
+            semente (Optional[int]): A semente do gerador aleatório do computador.
+
+        Raises:
+            ValueError: Se a política do oponente é de outra pontuação final ou de outro número de itens.
+        """
+        self.jogos = jogos
+        self.regras = regras or REGRAS_PADRAO
+        self.pontos_para_vencer = pontos_para_vencer
+        self.janela_historico = janela_historico
+        self.limite_rodadas = limite_rodadas
+        self.rng = np.random.default_rng(semente)
+        self._acumuladas: Optional[np.ndarray] = None
+        if oponente is not None:
+            if oponente.pontos_para_vencer != pontos_para_vencer:
+                raise ValueError(f"A política do oponente foi calculada para {oponente.pontos_para_vencer} pontos, "
+                                 f"e as partidas vão até {pontos_para_vencer}.")
+            if oponente.estrategias.shape[2] != len(self.regras):
+                raise ValueError(f"A política do oponente tem {oponente.estrategias.shape[2]} itens, "
+                                 f"e as regras {self.regras.nome!r} têm {len(self.regras)}.")
+            acumuladas = np.cumsum(np.clip(oponente.estrategias, 0.0, None), axis=2)
+            self._acumuladas = acumuladas / acumuladas[:, :, -1:]
+
+        self.pontos_usuario = np.zeros(jogos, dtype=np.int16)
+        self.pontos_computador = np.zeros(jogos, dtype=np.int16)
+        self.rodadas = np.zeros(jogos, dtype=np.int32)
+        # historico[k, t] = (jogada do agente, jogada do computador), da mais antiga para a mais recente,
+        # no menor tipo inteiro que guarda SEM_JOGADA e todos os índices de item
+        self.historico = np.full((jogos, janela_historico, 2), SEM_JOGADA, dtype=np.min_scalar_type(-len(self.regras)))
+
+    def reiniciar(self) -> Dict[str, np.ndarray]:
+        """Começa todas as partidas do zero.
+
+        Retorna:
+            Dict[str, np.ndarray]: A observação inicial (veja `observar`).
+        """
+        self.pontos_usuario[:] = 0
+        self.pontos_computador[:] = 0
+        self.rodadas[:] = 0
+        self.historico[:] = SEM_JOGADA
+        return self.observar()
+
+    def observar(self) -> Dict[str, np.ndarray]:
+        """Retorna uma cópia do estado visível ao agente.
+
+        Retorna:
+            Dict[str, np.ndarray]: "pontos_proprios", "pontos_oponente" e "rodada", com uma
+            posição por partida, e, com `janela_historico`, "historico" com forma
+            (jogos, janela_historico, 2) e `SEM_JOGADA` antes da primeira rodada.
+        """
+        observacao = {
+            "pontos_proprios": self.pontos_usuario.copy(),
+            "pontos_oponente": self.pontos_computador.copy(),
+            "rodada": self.rodadas.copy(),
+        }
+        if self.janela_historico:
+            observacao["historico"] = self.historico.copy()
+        return observacao
+
+    def jogadas_oponente(self) -> np.ndarray:
+        """Sorteia a jogada do computador em cada partida, pela política do oponente.
+
+        Retorna:
+            np.ndarray: Um índice de item por partida.
+        """
+        if self._acumuladas is None:
+            return self.rng.integers(0, len(self.regras), self.jogos)
+        limite = self._acumuladas.shape[0] - 1
+        acumuladas = self._acumuladas[np.minimum(self.pontos_computador, limite), np.minimum(self.pontos_usuario, limite)]
+        sorteios = self.rng.random(self.jogos)
+        return (sorteios[:, None] >= acumuladas[:, :-1]).sum(axis=1)
+
+    def passo(self, acoes: np.ndarray, acoes_oponente: Optional[np.ndarray] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Joga uma rodada em todas as partidas; as que terminam recomeçam em seguida.
+
+        Parâmetros:
+            acoes (np.ndarray): A jogada do agente em cada partida, como índice de item.
+            acoes_oponente (Optional[np.ndarray]): As jogadas do computador (padrão: `jogadas_oponente`).
+
+        Retorna:
+            Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+            A observação seguinte, já com as partidas terminadas reiniciadas; as
+            recompensas; as partidas que alguém venceu; as truncadas por `limite_rodadas`;
+            e um dicionário com "resultados" (EMPATE, VITORIA ou DERROTA do agente), a
+            "jogadas_oponente" e o placar de cada partida antes do reinício, em
+            "pontos_finais" (forma (jogos, 2)).
+        """
+        acoes = np.asarray(acoes, dtype=np.intp)
+        acoes_oponente = self.jogadas_oponente() if acoes_oponente is None else np.asarray(acoes_oponente, dtype=np.intp)
+        regras = self.regras
+        resultados = regras.resultados[acoes, acoes_oponente]
+
+        # Como em `determinar_vencedor`: no empate as variações são zero, e o placar não fica negativo
+        np.maximum(self.pontos_usuario + regras.delta_usuario[acoes, acoes_oponente], 0, out=self.pontos_usuario)
+        np.maximum(self.pontos_computador + regras.delta_computador[acoes, acoes_oponente], 0, out=self.pontos_computador)
+        self.rodadas += 1
+        if self.janela_historico:
+            self.historico[:, :-1] = self.historico[:, 1:]
+            self.historico[:, -1, 0] = acoes
+            self.historico[:, -1, 1] = acoes_oponente
+
+        venceu = self.pontos_usuario >= self.pontos_para_vencer
+        perdeu = self.pontos_computador >= self.pontos_para_vencer
+        terminados = venceu | perdeu
+        truncados = ~terminados & (self.rodadas >= self.limite_rodadas)
+        recompensas = venceu.astype(np.float32) - perdeu.astype(np.float32)
+        info = {
+            "resultados": resultados,
+            "jogadas_oponente": acoes_oponente,
+            "pontos_finais": np.stack((self.pontos_usuario, self.pontos_computador), axis=1),
+        }
+
+        fim = terminados | truncados
+        if fim.any():
+            self.pontos_usuario[fim] = 0
+            self.pontos_computador[fim] = 0
+            self.rodadas[fim] = 0
+            self.historico[fim] = SEM_JOGADA
+        return self.observar(), recompensas, terminados, truncados, info
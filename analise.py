@@ -0,0 +1,523 @@
+"""Estatísticas de históricos de partidas longos, lidos por mapeamento em memória.
+
+Lê tanto o formato de texto do antigo jogadas.txt quanto os arquivos binários do
+registro de partidas (veja registro.py). Os arquivos são mapeados em memória e
+processados em blocos de tamanho fixo, com operações vetorizadas do NumPy, então a
+memória usada não depende do tamanho do histórico; as páginas já lidas são
+devolvidas ao sistema ao fim de cada bloco.
+
+As estatísticas são do jogador contra o computador (os arquivos não guardam o nome
+do jogador): frequência de cada item, resultados de cada confronto de itens,
+placar médio por rodada, maiores sequências de vitórias e de derrotas e rodadas
+médias até alguém atingir `PONTOS_PARA_VENCER`.
+
+Só entram as jogadas do conjunto de regras escolhido (--regras). Nos registros
+binários, o conjunto de cada sessão vem do arquivo de sessões da pasta (veja
+registro.py); no texto, que só tem os nomes dos itens, ficam de fora as linhas com
+itens de fora do conjunto. As jogadas deixadas de fora são contadas em `ignoradas`.
+
+Com --estado, os totais e a posição lida de cada arquivo são guardados, e uma nova
+execução processa só o que foi anexado desde a anterior. Um arquivo que encolheu ou
+cujo conteúdo já lido mudou (como o jogadas.txt, reescrito a cada sessão) é lido
+de novo desde o início, somando-se ao que já foi contado.
+
+Uso:
+    python analise.py [--estado .cache/analise.npz] [--regras sheldon] [--json] [arquivos ou pastas...]
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from jogo import PONTOS_PARA_VENCER, REGRAS_PADRAO, nomes_resultados
+from regras import DERROTA, EMPATE, VITORIA, ConjuntoRegras, carregar_regras
+from registro import DTYPE_REGISTRO, EXTENSAO_ARQUIVO, TAMANHO_REGISTRO, arquivos_registro, regras_sessoes
+
+# Tamanho dos blocos processados de cada vez
+REGISTROS_POR_BLOCO: int = 1 << 18
+BYTES_POR_BLOCO: int = 1 << 24
+
+# Rodadas acompanhadas no placar médio por rodada
+LIMITE_TRAJETORIA: int = 50
+
+# Bytes antes da posição lida cujo resumo identifica o conteúdo já processado
+_TAMANHO_ASSINATURA: int = 4096
+
+_LINHA_TEXTO = re.compile(rb"Jogada (\d+): (\S+) vs (\S+) - (\S+) \| Pontos: Voc\xc3\xaa (\d+), Computador (\d+)")
+_PREFIXO_PONTOS = len("| Pontos: Você ".encode("utf-8"))
+_PREFIXO_COMPUTADOR = len(", Computador ")
+
+# Tipo de cada byte que pode separar campos de uma linha de texto (0 para os demais)
+_SEPARADORES = np.zeros(256, dtype=np.uint8)
+for _tipo, _caractere in enumerate(b"\n:|,v-", 1):
+    _SEPARADORES[_caractere] = _tipo
+
+# Colunas extraídas de um bloco: rodada, jogador, computador, resultado e pontos
+Colunas = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class _FormatoInesperado(Exception):
+    """O bloco de texto não segue o formato exato esperado pelo caminho vetorizado."""
+
+
+def _tabela_nomes(nomes: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Monta uma tabela ordenada de nomes em UTF-8 e os códigos correspondentes, para `searchsorted`."""
+    codificados = np.array([nome.encode("utf-8") for nome in nomes])
+    ordem = np.argsort(codificados)
+    return codificados[ordem], ordem
+
+
+def _inteiros(a: np.ndarray, inicio: np.ndarray, fim: np.ndarray) -> np.ndarray:
+    """Converte os dígitos decimais em a[inicio:fim] de cada linha em inteiros."""
+    tamanhos = fim - inicio
+    maximo = int(tamanhos.max())
+    if int(tamanhos.min()) <= 0 or maximo > 18:
+        raise _FormatoInesperado
+    valores = np.zeros(len(inicio), dtype=np.int64)
+    for k in range(maximo):
+        ativo = k < tamanhos
+        digitos = a[np.where(ativo, inicio + k, 0)].astype(np.int64) - 48
+        if ((digitos < 0) | (digitos > 9))[ativo].any():
+            raise _FormatoInesperado
+        valores = np.where(ativo, valores * 10 + digitos, valores)
+    return valores
+
+
+def _nomes(a: np.ndarray, inicio: np.ndarray, fim: np.ndarray, tabela: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Identifica o nome em a[inicio:fim] de cada linha, retornando o seu código ou -1 se desconhecido."""
+    ordenados, codigos = tabela
+    largura = ordenados.dtype.itemsize
+    tamanhos = fim - inicio
+    if int(inicio.max()) + largura > len(a):
+        raise _FormatoInesperado
+    # Uma janela de `largura` bytes a partir de cada posição, sem cópia; só as linhas escolhidas são copiadas
+    janelas = np.lib.stride_tricks.as_strided(a, shape=(len(a) - largura + 1, largura), strides=(1, 1))
+    matriz = janelas[inicio]
+    matriz[np.arange(largura) >= tamanhos[:, None]] = 0
+    lidos = matriz.view(f"S{largura}").ravel()
+    posicoes = np.minimum(np.searchsorted(ordenados, lidos), len(ordenados) - 1)
+    conhecido = (ordenados[posicoes] == lidos) & (tamanhos > 0) & (tamanhos <= largura)
+    return np.where(conhecido, codigos[posicoes], -1)
+
+
+class Estatisticas:
+    """Totais acumulados do histórico, atualizados bloco a bloco."""
+
+    def __init__(self, quantidade_itens: int) -> None:
+        """Inicializa os totais zerados.
+
+        Parâmetros:
+            quantidade_itens (int): O número de itens do conjunto de regras.
+        """
+        n = quantidade_itens
+        self.jogadas = 0
+        self.frequencia_jogador = np.zeros(n, dtype=np.int64)
+        self.frequencia_computador = np.zeros(n, dtype=np.int64)
+        # Contagem de cada resultado por [jogador, computador, resultado % 3] (empate, vitória, derrota)
+        self.confrontos = np.zeros((n, n, 3), dtype=np.int64)
+        # Somas do placar e número de jogadas por número da rodada, até LIMITE_TRAJETORIA
+        self.soma_pontos_usuario = np.zeros(LIMITE_TRAJETORIA + 1, dtype=np.float64)
+        self.soma_pontos_computador = np.zeros(LIMITE_TRAJETORIA + 1, dtype=np.float64)
+        self.jogadas_por_rodada = np.zeros(LIMITE_TRAJETORIA + 1, dtype=np.int64)
+        self.partidas_concluidas = 0
+        self.partidas_vencidas = 0
+        self.soma_rodadas_concluidas = 0
+        self.maior_sequencia_vitorias = 0
+        self.maior_sequencia_derrotas = 0
+        # Sequência de resultados iguais em andamento no fim do que já foi lido
+        self.sequencia_resultado = EMPATE
+        self.sequencia_tamanho = 0
+
+    def acumular(self, nova_sessao: np.ndarray, rodada: np.ndarray, jogador: np.ndarray, computador: np.ndarray,
+                 resultado: np.ndarray, pontos_usuario: np.ndarray, pontos_computador: np.ndarray) -> None:
+        """Soma um bloco de jogadas consecutivas aos totais.
+
+        Parâmetros:
+            nova_sessao (np.ndarray): Se cada jogada começa uma sessão, o que interrompe as sequências.
+            rodada (np.ndarray): O número da jogada na sessão.
+            jogador (np.ndarray): O índice do item do jogador.
+            computador (np.ndarray): O índice do item do computador.
+            resultado (np.ndarray): O código do resultado (EMPATE, VITORIA ou DERROTA).
+            pontos_usuario (np.ndarray): A pontuação do jogador após a jogada.
+            pontos_computador (np.ndarray): A pontuação do computador após a jogada.
+        """
+        quantidade = len(rodada)
+        if quantidade == 0:
+            return
+        n = len(self.frequencia_jogador)
+        jogador = jogador.astype(np.intp)
+        computador = computador.astype(np.intp)
+        resultado = resultado.astype(np.int8)
+        rodada = rodada.astype(np.int64)
+
+        self.jogadas += quantidade
+        self.frequencia_jogador += np.bincount(jogador, minlength=n)
+        self.frequencia_computador += np.bincount(computador, minlength=n)
+        self.confrontos += np.bincount((jogador * n + computador) * 3 + resultado % 3, minlength=n * n * 3).reshape(n, n, 3)
+
+        na_trajetoria = rodada <= LIMITE_TRAJETORIA
+        rodadas_trajetoria = rodada[na_trajetoria]
+        self.soma_pontos_usuario += np.bincount(rodadas_trajetoria, weights=pontos_usuario[na_trajetoria], minlength=LIMITE_TRAJETORIA + 1)
+        self.soma_pontos_computador += np.bincount(rodadas_trajetoria, weights=pontos_computador[na_trajetoria], minlength=LIMITE_TRAJETORIA + 1)
+        self.jogadas_por_rodada += np.bincount(rodadas_trajetoria, minlength=LIMITE_TRAJETORIA + 1)
+
+        # A partida acaba na jogada em que alguém atinge a pontuação para vencer
+        final = np.maximum(pontos_usuario, pontos_computador) >= PONTOS_PARA_VENCER
+        self.partidas_concluidas += int(final.sum())
+        self.partidas_vencidas += int((pontos_usuario[final] >= PONTOS_PARA_VENCER).sum())
+        self.soma_rodadas_concluidas += int(rodada[final].sum())
+
+        # Sequências: trechos de resultados iguais, interrompidos também por uma nova sessão
+        quebra = np.empty(quantidade, dtype=bool)
+        quebra[0] = True
+        quebra[1:] = (resultado[1:] != resultado[:-1]) | nova_sessao[1:]
+        inicios = np.flatnonzero(quebra)
+        tamanhos = np.diff(np.append(inicios, quantidade))
+        tipos = resultado[inicios]
+        if not nova_sessao[0] and resultado[0] == self.sequencia_resultado:
+            tamanhos[0] += self.sequencia_tamanho
+        vitorias = tamanhos[tipos == VITORIA]
+        derrotas = tamanhos[tipos == DERROTA]
+        if vitorias.size:
+            self.maior_sequencia_vitorias = max(self.maior_sequencia_vitorias, int(vitorias.max()))
+        if derrotas.size:
+            self.maior_sequencia_derrotas = max(self.maior_sequencia_derrotas, int(derrotas.max()))
+        self.sequencia_resultado = int(tipos[-1])
+        self.sequencia_tamanho = int(tamanhos[-1])
+
+    def para_dict(self, nomes_itens: List[str]) -> dict:
+        """Resume as estatísticas em um dicionário serializável em JSON.
+
+        Parâmetros:
+            nomes_itens (List[str]): Os nomes dos itens, na ordem dos índices.
+
+        Retorna:
+            dict: Frequências, taxas de vitória por confronto, placar médio por rodada, sequências e partidas.
+        """
+        confrontos = {}
+        for i, jogador in enumerate(nomes_itens):
+            for j, computador in enumerate(nomes_itens):
+                total = int(self.confrontos[i, j].sum())
+                if total:
+                    confrontos[f"{jogador} x {computador}"] = {
+                        "jogadas": total,
+                        "vitorias": int(self.confrontos[i, j, VITORIA % 3]) / total,
+                        "empates": int(self.confrontos[i, j, EMPATE % 3]) / total,
+                        "derrotas": int(self.confrontos[i, j, DERROTA % 3]) / total,
+                    }
+        jogadas = np.maximum(self.jogadas_por_rodada, 1)
+        return {
+            "jogadas": self.jogadas,
+            "frequencia_jogador": dict(zip(nomes_itens, self.frequencia_jogador.tolist())),
+            "frequencia_computador": dict(zip(nomes_itens, self.frequencia_computador.tolist())),
+            "confrontos": confrontos,
+            "placar_medio_por_rodada": [
+                [rodada, usuario, computador] for rodada, usuario, computador, quantidade in zip(
+                    range(LIMITE_TRAJETORIA + 1), (self.soma_pontos_usuario / jogadas).round(3).tolist(),
+                    (self.soma_pontos_computador / jogadas).round(3).tolist(), self.jogadas_por_rodada.tolist())
+                if quantidade
+            ],
+            "maior_sequencia_vitorias": self.maior_sequencia_vitorias,
+            "maior_sequencia_derrotas": self.maior_sequencia_derrotas,
+            "partidas_concluidas": self.partidas_concluidas,
+            "partidas_vencidas": self.partidas_vencidas,
+            "rodadas_medias_por_partida": self.soma_rodadas_concluidas / self.partidas_concluidas if self.partidas_concluidas else None,
+        }
+
+
+class AnalisadorHistorico:
+    """Lê arquivos de histórico, de texto ou binários, acumulando `Estatisticas`."""
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None, caminho_estado: Optional[str] = None) -> None:
+        """Inicializa o analisador, retomando o estado salvo, se houver.
+
+        Parâmetros:
+            regras (Optional[ConjuntoRegras]): O conjunto de regras das jogadas (padrão: `REGRAS_PADRAO`).
+            caminho_estado (Optional[str]): Onde guardar os totais e as posições lidas entre execuções.
+        """
+        self.regras = regras or REGRAS_PADRAO
+        self.caminho_estado = caminho_estado
+        self.estatisticas = Estatisticas(len(self.regras))
+        # Posição já processada e assinatura do conteúdo anterior a ela, por caminho absoluto
+        self.arquivos: Dict[str, Dict[str, object]] = {}
+        self.ultima_sessao = b""
+        # Jogadas de outros conjuntos de regras, ou com itens desconhecidos, deixadas de fora
+        self.ignoradas = 0
+        self._tabela_itens = _tabela_nomes(list(self.regras.nomes_itens))
+        self._tabela_resultados = _tabela_nomes(list(nomes_resultados))
+        if caminho_estado is not None and os.path.exists(caminho_estado):
+            self._carregar_estado()
+
+    def _carregar_estado(self) -> None:
+        with np.load(self.caminho_estado, allow_pickle=False) as dados:
+            meta = json.loads(str(dados["meta"]))
+            if meta["itens"] != list(self.regras.nomes_itens):
+                raise ValueError(f"{self.caminho_estado}: estado gerado com outros itens ({', '.join(meta['itens'])})")
+            for nome, valor in vars(self.estatisticas).items():
+                if isinstance(valor, np.ndarray):
+                    setattr(self.estatisticas, nome, dados[nome].copy())
+        for nome, valor in meta["totais"].items():
+            setattr(self.estatisticas, nome, valor)
+        self.arquivos = meta["arquivos"]
+        self.ultima_sessao = bytes.fromhex(meta["ultima_sessao"])
+        self.ignoradas = meta.get("ignoradas", 0)
+
+    def salvar_estado(self) -> None:
+        """Grava os totais e as posições lidas em `caminho_estado`, de forma atômica."""
+        if self.caminho_estado is None:
+            return
+        matrizes = {nome: valor for nome, valor in vars(self.estatisticas).items() if isinstance(valor, np.ndarray)}
+        totais = {nome: valor for nome, valor in vars(self.estatisticas).items() if not isinstance(valor, np.ndarray)}
+        meta = {"itens": list(self.regras.nomes_itens), "totais": totais, "arquivos": self.arquivos,
+                "ultima_sessao": self.ultima_sessao.hex(), "ignoradas": self.ignoradas}
+        pasta = os.path.dirname(self.caminho_estado)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        temporario = f"{self.caminho_estado}.{os.getpid()}.tmp.npz"
+        np.savez(temporario, meta=np.array(json.dumps(meta)), **matrizes)
+        os.replace(temporario, self.caminho_estado)
+
+    def processar(self, caminho: str) -> int:
+        """Lê o que ainda não foi processado de um arquivo de histórico.
+
+        Arquivos com a extensão do registro binário são lidos como tal; os demais, como texto.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo.
+
+        Retorna:
+            int: O número de jogadas novas lidas.
+        """
+        chave = os.path.abspath(caminho)
+        tamanho = os.path.getsize(caminho)
+        if tamanho == 0:
+            return 0
+        binario = caminho.endswith(EXTENSAO_ARQUIVO)
+        lidas = 0
+        with open(caminho, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            inicio = self._posicao_inicial(chave, mm, tamanho)
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if binario:
+                blocos = self._blocos_binarios(mm, inicio, tamanho, *self._filtro_sessoes(os.path.dirname(chave)))
+            else:
+                blocos = self._blocos_texto(mm, inicio, tamanho)
+            for fim, nova_sessao, colunas in blocos:
+                self.estatisticas.acumular(nova_sessao, *colunas)
+                lidas += len(nova_sessao)
+                self._liberar(mm, inicio, fim)
+                inicio = fim
+            self.arquivos[chave] = {"posicao": inicio, "assinatura": self._assinatura(mm, inicio)}
+        return lidas
+
+    def _filtro_sessoes(self, pasta: str) -> Tuple[np.ndarray, bool]:
+        """Separa as sessões de uma pasta de registro pelo conjunto de regras.
+
+        Retorna:
+            Tuple[np.ndarray, bool]: Identificadores de sessões e se eles são as únicas
+            sessões aceitas (True) ou as recusadas (False). Sessões sem conjunto anotado
+            são do conjunto padrão.
+        """
+        sessoes = regras_sessoes(pasta)
+        proprias: Dict[str, bool] = {}
+        for origem in set(sessoes.values()):
+            try:
+                proprias[origem] = carregar_regras(origem) is self.regras
+            except (OSError, ValueError, KeyError):
+                proprias[origem] = False
+        padrao = self.regras is REGRAS_PADRAO
+        # Do conjunto padrão, recusa as sessões anotadas com outro; dos demais, aceita só as anotadas com ele
+        lista = [sessao for sessao, origem in sessoes.items() if proprias[origem] != padrao]
+        return np.array(lista, dtype="S16"), not padrao
+
+    @staticmethod
+    def _assinatura(mm: mmap.mmap, posicao: int) -> str:
+        return hashlib.sha1(mm[max(0, posicao - _TAMANHO_ASSINATURA):posicao]).hexdigest()
+
+    def _posicao_inicial(self, chave: str, mm: mmap.mmap, tamanho: int) -> int:
+        """A posição a partir da qual ler: a salva, se o conteúdo anterior a ela não mudou, ou zero."""
+        anterior = self.arquivos.get(chave)
+        if anterior is None:
+            return 0
+        posicao = int(anterior["posicao"])
+        if posicao > tamanho or self._assinatura(mm, posicao) != anterior["assinatura"]:
+            return 0
+        return posicao
+
+    @staticmethod
+    def _liberar(mm: mmap.mmap, inicio: int, fim: int) -> None:
+        """Devolve ao sistema as páginas de um trecho já processado, mantendo a memória constante."""
+        if not hasattr(mm, "madvise"):
+            return
+        inicio_pagina = inicio - inicio % mmap.PAGESIZE
+        fim_pagina = fim - fim % mmap.PAGESIZE
+        if fim_pagina > inicio_pagina:
+            mm.madvise(mmap.MADV_DONTNEED, inicio_pagina, fim_pagina - inicio_pagina)
+
+    def _blocos_binarios(self, mm: mmap.mmap, inicio: int, tamanho: int, filtro: np.ndarray, aceitas: bool) -> Iterator[Tuple[int, np.ndarray, Colunas]]:
+        """Percorre os registros completos do arquivo binário em blocos, sem copiá-los.
+
+        Parâmetros:
+            filtro (np.ndarray): Sessões aceitas ou recusadas, de `_filtro_sessoes`.
+            aceitas (bool): Se `filtro` lista as únicas sessões aceitas.
+        """
+        inicio -= inicio % TAMANHO_REGISTRO
+        total = tamanho // TAMANHO_REGISTRO
+        n = len(self.regras)
+        for primeiro in range(inicio // TAMANHO_REGISTRO, total, REGISTROS_POR_BLOCO):
+            quantidade = min(REGISTROS_POR_BLOCO, total - primeiro)
+            bloco = np.frombuffer(mm, dtype=DTYPE_REGISTRO, count=quantidade, offset=primeiro * TAMANHO_REGISTRO)
+            sessao = bloco["sessao"]
+            nova_sessao = np.empty(quantidade, dtype=bool)
+            nova_sessao[0] = sessao[0] != self.ultima_sessao
+            nova_sessao[1:] = sessao[1:] != sessao[:-1]
+            self.ultima_sessao = bytes(sessao[-1])
+            validas = (bloco["jogador"] < n) & (bloco["computador"] < n)
+            if aceitas or len(filtro):
+                validas &= np.isin(sessao, filtro) == aceitas
+            self.ignoradas += quantidade - int(validas.sum())
+            colunas = tuple(bloco[campo][validas] for campo in ("rodada", "jogador", "computador", "resultado", "pontos_usuario", "pontos_computador"))
+            yield (primeiro + quantidade) * TAMANHO_REGISTRO, nova_sessao[validas], colunas
+            del bloco, sessao  # Nenhuma visão do mapeamento pode sobreviver ao fechamento
+
+    def _blocos_texto(self, mm: mmap.mmap, inicio: int, tamanho: int) -> Iterator[Tuple[int, np.ndarray, Colunas]]:
+        """Percorre as linhas completas do arquivo de texto em blocos terminados em quebra de linha."""
+        while inicio < tamanho:
+            fim = mm.rfind(b"\n", inicio, min(inicio + BYTES_POR_BLOCO, tamanho)) + 1
+            if fim == 0:
+                if inicio + BYTES_POR_BLOCO < tamanho:
+                    raise ValueError(f"linha com mais de {BYTES_POR_BLOCO} bytes na posição {inicio}")
+                return  # Só resta uma linha incompleta, lida quando for terminada
+            try:
+                colunas = self._analisar_texto_vetorizado(mm, inicio, fim)
+            except _FormatoInesperado:
+                colunas = self._analisar_texto_expressao(mm, inicio, fim)
+            nova_sessao = colunas[0] == 1
+            if len(nova_sessao) and inicio == 0:
+                nova_sessao[0] = True
+            yield fim, nova_sessao, colunas
+            inicio = fim
+
+    def _analisar_texto_vetorizado(self, mm: mmap.mmap, inicio: int, fim: int) -> Colunas:
+        """Extrai as colunas de um bloco de texto localizando os separadores de todas as linhas de uma vez.
+
+        Raises:
+            _FormatoInesperado: Se alguma linha foge do formato exato (linhas vazias, nomes com
+                separadores etc.); o bloco é então lido pela expressão regular.
+        """
+        a = np.frombuffer(mm, dtype=np.uint8, count=fim - inicio, offset=inicio)
+        try:
+            # Uma única passada pelo bloco encontra todos os separadores; depois eles são separados por tipo
+            tipos = _SEPARADORES[a]
+            posicoes = np.flatnonzero(tipos)
+            tipos = tipos[posicoes]
+            quebras = posicoes[tipos == 1]
+            n = len(quebras)
+            inicios = np.empty(n, dtype=np.int64)
+            inicios[0] = 0
+            inicios[1:] = quebras[:-1] + 1
+            finais = quebras - (a[np.maximum(quebras - 1, 0)] == 13)  # Aceita CRLF
+
+            dois_pontos = posicoes[tipos == 2]
+            barras = posicoes[tipos == 3]
+            virgulas = posicoes[tipos == 4]
+            vs = posicoes[tipos == 5]
+            vs = vs[(vs > 0) & (vs + 2 < len(a))]
+            vs = vs[(a[vs - 1] == 32) & (a[vs + 1] == 115) & (a[vs + 2] == 32)]
+            hifens = posicoes[tipos == 6]
+            hifens = hifens[(hifens > 0) & (hifens + 1 < len(a))]
+            hifens = hifens[(a[hifens - 1] == 32) & (a[hifens + 1] == 32)]
+            if len(dois_pontos) != 2 * n or not (len(barras) == len(virgulas) == len(vs) == len(hifens) == n):
+                raise _FormatoInesperado
+            dois_pontos = dois_pontos[0::2]
+            if not ((inicios + 7 < dois_pontos) & (dois_pontos < vs) & (vs < hifens) & (hifens < barras)
+                    & (barras < virgulas) & (virgulas < finais)).all() or (a[inicios] != ord("J")).any():
+                raise _FormatoInesperado
+
+            rodada = _inteiros(a, inicios + len("Jogada "), dois_pontos)
+            jogador = _nomes(a, dois_pontos + 2, vs - 1, self._tabela_itens)
+            computador = _nomes(a, vs + 3, hifens - 1, self._tabela_itens)
+            resultado = _nomes(a, hifens + 2, barras - 1, self._tabela_resultados)
+            pontos_usuario = _inteiros(a, barras + _PREFIXO_PONTOS, virgulas)
+            pontos_computador = _inteiros(a, virgulas + _PREFIXO_COMPUTADOR, finais)
+        finally:
+            del a
+        validas = (jogador >= 0) & (computador >= 0) & (resultado >= 0)
+        self.ignoradas += len(validas) - int(validas.sum())
+        resultado = np.where(resultado == 2, DERROTA, resultado)  # Índice em `nomes_resultados` para o código
+        return rodada[validas], jogador[validas], computador[validas], resultado[validas], pontos_usuario[validas], pontos_computador[validas]
+
+    def _analisar_texto_expressao(self, mm: mmap.mmap, inicio: int, fim: int) -> Colunas:
+        """Extrai as colunas de um bloco de texto com a expressão regular, ignorando linhas em outro formato."""
+        itens = {nome.encode("utf-8"): i for i, nome in enumerate(self.regras.nomes_itens)}
+        resultados = {nomes_resultados[codigo].encode("utf-8"): codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+        encontradas = _LINHA_TEXTO.findall(mm, inicio, fim)
+        linhas = [(int(rodada), itens[jogador], itens[computador], resultados[resultado], int(pontos_usuario), int(pontos_computador))
+                  for rodada, jogador, computador, resultado, pontos_usuario, pontos_computador in encontradas
+                  if jogador in itens and computador in itens and resultado in resultados]
+        self.ignoradas += len(encontradas) - len(linhas)
+        colunas = np.array(linhas, dtype=np.int64).reshape(-1, 6)
+        return tuple(colunas[:, k] for k in range(6))
+
+
+def formatar_relatorio(resumo: dict) -> str:
+    """Formata o resumo de `Estatisticas.para_dict` como texto para o terminal."""
+    linhas = [f"Jogadas: {resumo['jogadas']:,}"]
+    if not resumo["jogadas"]:
+        return linhas[0]
+    total = resumo["jogadas"]
+    linhas.append("\nFrequência dos itens (jogador / computador):")
+    for item, vezes in resumo["frequencia_jogador"].items():
+        linhas.append(f"  {item:<12} {vezes / total:7.2%}  {resumo['frequencia_computador'][item] / total:7.2%}")
+    linhas.append("\nConfrontos (vitórias / empates / derrotas do jogador):")
+    for confronto, dados in resumo["confrontos"].items():
+        linhas.append(f"  {confronto:<24} {dados['vitorias']:7.2%} {dados['empates']:7.2%} {dados['derrotas']:7.2%}  ({dados['jogadas']:,})")
+    linhas.append("\nPlacar médio por rodada (jogador x computador):")
+    for rodada, usuario, computador in resumo["placar_medio_por_rodada"]:
+        if rodada in (1, 2, 3, 5, 10, 15, 20, 30, 40, 50):
+            linhas.append(f"  rodada {rodada:>2}: {usuario:6.2f} x {computador:6.2f}")
+    linhas.append(f"\nMaior sequência de vitórias: {resumo['maior_sequencia_vitorias']}, de derrotas: {resumo['maior_sequencia_derrotas']}")
+    if resumo["partidas_concluidas"]:
+        linhas.append(f"Partidas concluídas: {resumo['partidas_concluidas']:,}, vencidas pelo jogador: "
+                      f"{resumo['partidas_vencidas'] / resumo['partidas_concluidas']:.2%}, "
+                      f"rodadas médias até {PONTOS_PARA_VENCER} pontos: {resumo['rodadas_medias_por_partida']:.2f}")
+    return "\n".join(linhas)
+
+
+def main() -> None:
+    """Processa os históricos indicados e exibe as estatísticas."""
+    parser = argparse.ArgumentParser(description="Estatísticas do histórico de partidas.")
+    parser.add_argument("caminhos", nargs="*", default=["registros", "jogadas.txt"],
+                        help="Arquivos de texto ou binários, ou pastas de registro (padrão: registros e jogadas.txt).")
+    parser.add_argument("--estado", help="Arquivo onde guardar o progresso, para processar só o que for anexado depois.")
+    parser.add_argument("--regras", default="sheldon", help="O conjunto de regras das jogadas (padrão: sheldon).")
+    parser.add_argument("--json", action="store_true", help="Exibe as estatísticas em JSON.")
+    args = parser.parse_args()
+
+    analisador = AnalisadorHistorico(carregar_regras(args.regras), args.estado)
+    novas = 0
+    for caminho in args.caminhos:
+        if os.path.isdir(caminho):
+            for arquivo in arquivos_registro(caminho):
+                novas += analisador.processar(arquivo)
+        elif os.path.exists(caminho):
+            novas += analisador.processar(caminho)
+    analisador.salvar_estado()
+
+    resumo = analisador.estatisticas.para_dict(list(analisador.regras.nomes_itens))
+    if args.json:
+        print(json.dumps(resumo, ensure_ascii=False, indent=2))
+    else:
+        print(f"{novas:,} jogadas novas processadas")
+        if analisador.ignoradas:
+            print(f"{analisador.ignoradas:,} jogadas de outros conjuntos de regras ou com itens desconhecidos ignoradas")
+        print(formatar_relatorio(resumo))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Reprodução dos efeitos sonoros com pouca latência.
+
+O mixer é pré-inicializado com um buffer pequeno (o padrão do SDL, de 512 a 4096
+amostras conforme a versão, atrasa cada som em dezenas de milissegundos) e os
+efeitos tocam em canais reservados: um para os cliques e outro para os sons de
+resultado, que nunca disputam canal com outros sons nem esperam um ficar livre. Os
+sons já ficam decodificados na memória, no formato do mixer, desde o carregamento.
+
+Cliques sobrepostos são agrupados: um clique que chega pouco depois do anterior é
+descartado, e os demais reiniciam o som no mesmo canal em vez de empilhar cópias.
+Para cada som tocado é medido o tempo desde o evento que o causou até o som entrar
+no mixer. O atraso do mixer até a saída não é medido, pois o pygame não informa
+quando o som chega à placa; o tempo de um buffer (`atraso_buffer`), que é o mínimo
+desse atraso, é mostrado à parte como estimativa. Funciona também com o driver de
+áudio "dummy" do SDL, sem placa de som.
+"""
+import collections
+import time
+from typing import Deque, Dict, Optional, Sequence
+
+import pygame
+
+from recursos import GerenciadorRecursos
+
+FREQUENCIA_PADRAO: int = 44100
+TAMANHO_BUFFER_PADRAO: int = 256  # Amostras por canal: ~5,8 ms a 44,1 kHz
+
+CLIQUE = "clique"
+RESULTADOS = ("vitoria", "derrota", "empate")
+
+# Canais reservados, fora da escolha automática de `Sound.play`
+CANAL_CLIQUE: int = 0
+CANAL_RESULTADO: int = 1
+
+
+def pre_inicializar(tamanho_buffer: int = TAMANHO_BUFFER_PADRAO, frequencia: int = FREQUENCIA_PADRAO) -> None:
+    """Configura o mixer antes de `pygame.init`, que o inicializa com os valores dados aqui.
+
+    Parâmetros:
+        tamanho_buffer (int): O tamanho do buffer de áudio, em amostras (potência de 2).
+        frequencia (int): A taxa de amostragem, em Hz.
+    """
+    pygame.mixer.pre_init(frequencia, -16, 2, tamanho_buffer)
+
+
+class SistemaAudio:
+    """Toca os efeitos sonoros do jogo nos canais reservados e mede quanto demoram a chegar ao mixer."""
+
+    def __init__(self, recursos: GerenciadorRecursos, tamanho_buffer: int = TAMANHO_BUFFER_PADRAO, intervalo_cliques: float = 0.05, capacidade: int = 1000) -> None:
+        """Reserva os canais dos efeitos; o mixer já deve estar inicializado.
+
+        Parâmetros:
+            recursos (GerenciadorRecursos): De onde vêm os sons carregados.
+            tamanho_buffer (int): O buffer passado a `pre_inicializar` (o pygame não informa o obtido).
+            intervalo_cliques (float): Cliques mais próximos que isto, em segundos, são descartados.
+            capacidade (int): Quantas medições guardar.
+        """
+        self.recursos = recursos
+        self.intervalo_cliques = intervalo_cliques
+        frequencia, _, _ = pygame.mixer.get_init()
+        self.tamanho_buffer = tamanho_buffer
+        # Estimativa, calculada a partir do buffer pedido: o atraso mínimo do mixer até a saída
+        self.atraso_buffer = tamanho_buffer / frequencia
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), CANAL_RESULTADO + 3))
+        pygame.mixer.set_reserved(CANAL_RESULTADO + 1)
+        self.canal_clique = pygame.mixer.Channel(CANAL_CLIQUE)
+        self.canal_resultado = pygame.mixer.Channel(CANAL_RESULTADO)
+        self._ultimo_clique = float("-inf")
+        self.cliques_descartados = 0
+        self.latencias: Deque[float] = collections.deque(maxlen=capacidade)
+
+    @property
+    def sons(self) -> Dict[str, pygame.mixer.Sound]:
+        """Os efeitos sonoros, indexados pelo nome."""
+        return self.recursos.sons()
+
+    def tocar(self, nome: str, instante_evento: Optional[float] = None) -> bool:
+        """Toca um efeito no canal reservado a ele.
+
+        Parâmetros:
+            nome (str): O nome do som (o clique, um dos resultados ou outro som carregado).
+            instante_evento (Optional[float]): O `time.perf_counter()` do evento que causou o som,
+                de onde começa a medição do tempo até o mixer (padrão: agora).
+
+        Retorna:
+            bool: False se o som foi descartado por ser um clique sobreposto.
+        """
+        agora = time.perf_counter()
+        som = self.sons[nome]
+        if nome == CLIQUE:
+            if agora - self._ultimo_clique < self.intervalo_cliques:
+                self.cliques_descartados += 1
+                return False
+            self._ultimo_clique = agora
+            self.canal_clique.play(som)  # Interrompe o clique anterior, se ainda estiver tocando
+        elif nome in RESULTADOS:
+            self.canal_resultado.play(som)
+        else:
+            som.play()
+        inicio = agora if instante_evento is None else instante_evento
+        self.latencias.append(time.perf_counter() - inicio)
+        return True
+
+    def percentis(self, pontos: Sequence[float] = (50, 95, 99)) -> Dict[float, float]:
+        """Calcula percentis do tempo medido do evento até o mixer, em milissegundos.
+
+        O atraso do buffer não está incluído (veja `atraso_buffer`).
+
+        Parâmetros:
+            pontos (Sequence[float]): Os percentis desejados, entre 0 e 100.
+
+        Retorna:
+            Dict[float, float]: O valor de cada percentil (vazio se nada foi tocado).
+        """
+        latencias = sorted(self.latencias)
+        if not latencias:
+            return {}
+        return {p: latencias[min(len(latencias) - 1, int(len(latencias) * p / 100))] * 1000 for p in pontos}
+
+    def resumo(self) -> Optional[str]:
+        """Retorna uma linha com os percentis medidos, a estimativa do buffer e os cliques descartados, ou None sem medições."""
+        percentis = self.percentis()
+        if not percentis:
+            return None
+        return ("áudio: do evento ao mixer "
+                + "  ".join(f"p{p:g} {v:.2f}" for p, v in percentis.items())
+                + f" ms (medido); buffer de {self.tamanho_buffer} amostras, mais {self.atraso_buffer * 1000:.1f} ms "
+                f"até a saída (estimativa, não medido); {self.cliques_descartados} cliques descartados")
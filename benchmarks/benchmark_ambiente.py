@@ -0,0 +1,63 @@
+"""Mede passos por segundo do ambiente vetorizado contra o laço com `JogoJokenpo`.
+
+Um passo é uma rodada de uma partida. O agente joga ao acaso, e o computador ao acaso
+ou pela política ótima do solver (--otima). A referência joga as mesmas rodadas em
+objetos `JogoJokenpo`, uma chamada de `escolher_jogada` por vez.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_ambiente [--jogos 1 100 10000] [--passos 1000] [--janela 8] [--otima]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ambiente import AmbienteVetorizado
+from jogo import JogoJokenpo, PONTOS_PARA_VENCER, nomes_itens
+from solver import carregar_politica
+
+
+def medir_referencia(passos: int, semente: int) -> float:
+    """Retorna os passos por segundo de uma partida após a outra em um `JogoJokenpo`."""
+    rng = np.random.default_rng(semente)
+    acoes = [nomes_itens[i] for i in rng.integers(0, len(nomes_itens), passos)]
+    jogo = JogoJokenpo(semente=semente)
+    inicio = time.perf_counter()
+    for acao in acoes:
+        jogo.escolher_jogada(acao)
+        if max(jogo.pontos_usuario, jogo.pontos_computador) >= PONTOS_PARA_VENCER:
+            jogo.pontos_usuario = jogo.pontos_computador = 0
+    return passos / (time.perf_counter() - inicio)
+
+
+def medir(jogos: int, passos: int, janela: int, otima: bool, semente: int) -> None:
+    ambiente = AmbienteVetorizado(jogos, janela_historico=janela, oponente=carregar_politica() if otima else None, semente=semente)
+    rng = np.random.default_rng(semente + 1)  # Outra sequência, para o agente não copiar o computador
+    acoes = rng.integers(0, len(ambiente.regras), (passos, jogos))
+    ambiente.reiniciar()
+    partidas = 0
+    inicio = time.perf_counter()
+    for linha in acoes:
+        _, _, terminados, _, _ = ambiente.passo(linha)
+        partidas += int(terminados.sum())
+    duracao = time.perf_counter() - inicio
+    print(f"{jogos:>7} jogos: {passos * jogos / duracao:14,.0f} passos/s  {partidas / duracao:12,.0f} partidas/s  "
+          f"({duracao / passos * 1e6:8.1f} µs por chamada de passo)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jogos", type=int, nargs="+", default=[1, 100, 10000], help="Partidas simultâneas.")
+    parser.add_argument("--passos", type=int, default=1000, help="Chamadas de passo por medição.")
+    parser.add_argument("--janela", type=int, default=8, help="Rodadas do histórico na observação.")
+    parser.add_argument("--otima", action="store_true", help="O computador joga a política ótima em vez de ao acaso.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"JogoJokenpo, uma rodada por vez: {medir_referencia(100_000, args.semente):,.0f} passos/s")
+    for jogos in args.jogos:
+        medir(jogos, args.passos, args.janela, args.otima, args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Mede a leitura de históricos grandes pelo módulo de análise.
+
+Gera, em uma pasta temporária, um registro binário e um arquivo no formato de texto
+do antigo jogadas.txt, repetindo um bloco de partidas simuladas com identificadores
+de sessão novos. Mede o processamento completo de cada formato, em MB/s e jogadas/s,
+e uma execução incremental depois de anexar mais partidas ao fim dos arquivos.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_analise [--mb-binario 512] [--mb-texto 256]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from analise import AnalisadorHistorico
+from jogo import JogoJokenpo, PONTOS_PARA_VENCER, REGRAS_PADRAO, nomes_resultados
+from registro import DTYPE_REGISTRO, Jogada, formatar_jogada
+from regras import DERROTA, EMPATE, VITORIA
+
+
+def simular(partidas: int, semente: int) -> np.ndarray:
+    """Joga partidas aleatórias completas e retorna as jogadas como registros binários."""
+    rng = random.Random(semente)
+    codigos = {nomes_resultados[codigo]: codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+    linhas = []
+    for partida in range(partidas):
+        jogo = JogoJokenpo(semente=rng.getrandbits(63))
+        rodada = 0
+        while max(jogo.pontos_usuario, jogo.pontos_computador) < PONTOS_PARA_VENCER:
+            rodada += 1
+            jogador = rng.randrange(len(REGRAS_PADRAO))
+            computador, resultado = jogo.escolher_jogada(REGRAS_PADRAO.nomes_itens[jogador])
+            linhas.append((partida.to_bytes(16, "little"), rodada, jogador, REGRAS_PADRAO.indice[computador], codigos[resultado],
+                           b"\0", jogo.pontos_usuario, jogo.pontos_computador, 0.0))
+    return np.array(linhas, dtype=DTYPE_REGISTRO)
+
+
+def gravar_binario(caminho: str, base: np.ndarray, megabytes: float, deslocamento_sessao: int = 0) -> None:
+    """Anexa cópias de `base` ao arquivo até `megabytes`, cada cópia com sessões novas."""
+    copias = max(1, int(megabytes * 2**20 // base.nbytes))
+    sessoes = np.frombuffer(base["sessao"].tobytes(), dtype="<u8").reshape(-1, 2)[:, 0]
+    with open(caminho, "ab") as arquivo:
+        for copia in range(copias):
+            bloco = base.copy()
+            novas = np.zeros((len(bloco), 2), dtype="<u8")
+            novas[:, 0] = sessoes + (deslocamento_sessao + copia) * (int(sessoes.max()) + 1)
+            bloco["sessao"] = novas.view("S16").ravel()
+            arquivo.write(bloco.tobytes())
+
+
+def gravar_texto(caminho: str, base: np.ndarray, megabytes: float) -> None:
+    """Anexa cópias do texto de `base` ao arquivo até `megabytes`."""
+    texto = "".join(formatar_jogada(Jogada(sessao, rodada, jogador, computador, resultado, pontos_usuario, pontos_computador, instante)) + "\n"
+                    for sessao, rodada, jogador, computador, resultado, _, pontos_usuario, pontos_computador, instante in base.tolist()).encode("utf-8")
+    copias = max(1, int(megabytes * 2**20 // len(texto)))
+    with open(caminho, "ab") as arquivo:
+        for _ in range(copias):
+            arquivo.write(texto)
+
+
+def medir(analisador: AnalisadorHistorico, caminho: str, rotulo: str) -> None:
+    tamanho = os.path.getsize(caminho) - int(analisador.arquivos.get(os.path.abspath(caminho), {}).get("posicao", 0))
+    inicio = time.perf_counter()
+    jogadas = analisador.processar(caminho)
+    duracao = time.perf_counter() - inicio
+    print(f"{rotulo:<22} {tamanho / 2**20:9.1f} MB {jogadas:>12,} jogadas  {duracao:7.2f}s  "
+          f"{tamanho / 2**20 / duracao:8.1f} MB/s  {jogadas / duracao:13,.0f} jogadas/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb-binario", type=float, default=512, help="Tamanho do registro binário gerado, em MB.")
+    parser.add_argument("--mb-texto", type=float, default=256, help="Tamanho do arquivo de texto gerado, em MB.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    base = simular(2000, args.semente)
+    with tempfile.TemporaryDirectory() as pasta:
+        binario = os.path.join(pasta, "partidas-000001.bin")
+        texto = os.path.join(pasta, "jogadas.txt")
+        gravar_binario(binario, base, args.mb_binario)
+        gravar_texto(texto, base, args.mb_texto)
+
+        estado = os.path.join(pasta, "estado.npz")
+        analisador = AnalisadorHistorico(caminho_estado=estado)
+        medir(analisador, binario, "binário, completo")
+        medir(analisador, texto, "texto, completo")
+        analisador.salvar_estado()
+
+        gravar_binario(binario, base, 0, deslocamento_sessao=10**6)
+        gravar_texto(texto, base, 0)
+        analisador = AnalisadorHistorico(caminho_estado=estado)
+        medir(analisador, binario, "binário, incremental")
+        medir(analisador, texto, "texto, incremental")
+        print(f"Total: {analisador.estatisticas.jogadas:,} jogadas, "
+              f"{analisador.estatisticas.partidas_concluidas:,} partidas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Mede quanto os efeitos sonoros demoram do evento até o mixer, com diferentes buffers.
+
+Roda com o driver de áudio "dummy" do SDL, sem placa de som, com a música de fundo
+tocando. Para cada buffer, simula uma sequência de cliques (alguns tão próximos que
+são agrupados) e de sons de resultado, e informa os percentis do tempo medido entre
+o evento e a entrada do som no mixer. O atraso do mixer até a saída não é medido (sem
+placa de som não há saída, e o pygame não informa quando ela acontece); o tempo de um
+buffer aparece ao lado apenas como estimativa, calculada, e não como comparação medida
+entre os buffers (veja audio.py).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_audio [--eventos 200] [--buffers 4096 1024 256]
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from audio import CLIQUE, RESULTADOS, SistemaAudio, pre_inicializar
+from recursos import GerenciadorRecursos
+
+SONS = {nome: f"sons/{nome}.wav" for nome in (CLIQUE, *RESULTADOS)}
+
+
+def medir(tamanho_buffer: int, eventos: int, rng: random.Random) -> SistemaAudio:
+    """Reinicia o mixer com o buffer indicado e toca a sequência de eventos."""
+    pygame.mixer.quit()
+    pre_inicializar(tamanho_buffer)
+    pygame.mixer.init()
+    recursos = GerenciadorRecursos(pasta_cache=None)
+    recursos.carregar_sons_em_segundo_plano(SONS)
+    recursos.tocar_musica_em_segundo_plano("sons/musica_fundo.mp3", 0.19)
+    audio = SistemaAudio(recursos, tamanho_buffer)
+    audio.sons  # Aguarda o carregamento
+
+    for _ in range(eventos):
+        time.sleep(rng.uniform(0.0, 0.04))
+        instante = time.perf_counter()
+        audio.tocar(CLIQUE if rng.random() < 0.8 else rng.choice(RESULTADOS), instante)
+    return audio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--eventos", type=int, default=200, help="Sons pedidos por tamanho de buffer.")
+    parser.add_argument("--buffers", type=int, nargs="+", default=[4096, 1024, 256], help="Tamanhos de buffer, em amostras.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    for tamanho in args.buffers:
+        print(medir(tamanho, args.eventos, random.Random(args.semente)).resumo())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Mede a latência por jogada das estratégias adaptativas em sessões longas.
+
+A sessão é dividida em janelas; se a atualização e a previsão custam O(1), a
+latência média de cada janela permanece estável do início ao fim.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_estrategias [jogadas] [janelas]
+"""
+import random
+import sys
+import time
+
+from estrategias import criar_estrategia
+from jogo import nomes_itens
+
+ESTRATEGIAS_MEDIDAS = ("frequencia", "frequencia_20", "contra_frequente", "markov1", "markov2", "markov3")
+
+
+def medir(nome: str, jogadas: int, janelas: int) -> list:
+    """Retorna a latência média, em microssegundos, de cada janela da sessão."""
+    estrategia = criar_estrategia(nome)
+    rng = random.Random(0)
+    oponente = [rng.randrange(len(nomes_itens)) for _ in range(jogadas)]
+    por_janela = jogadas // janelas
+    latencias = []
+    for janela in range(janelas):
+        inicio = time.perf_counter()
+        for k in range(janela * por_janela, (janela + 1) * por_janela):
+            propria = estrategia.escolher(rng, 0, 0)
+            estrategia.observar(propria, oponente[k])
+        latencias.append((time.perf_counter() - inicio) / por_janela * 1e6)
+    return latencias
+
+
+def main() -> None:
+    jogadas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    janelas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    print(f"Latência por jogada (µs) em {janelas} janelas de {jogadas // janelas:,} jogadas")
+    for nome in ESTRATEGIAS_MEDIDAS:
+        latencias = medir(nome, jogadas, janelas)
+        print(f"{nome:<18} " + " ".join(f"{l:5.2f}" for l in latencias) + f"  (máx/mín {max(latencias) / min(latencias):.2f})")
+
+
+if __name__ == "__main__":
+    main()
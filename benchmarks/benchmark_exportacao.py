@@ -0,0 +1,107 @@
+"""Mede quantos quadros por segundo cada sessão sem janela desenha e exporta.
+
+Roda várias interfaces no mesmo processo, cada uma desenhando na sua própria
+superfície, sem abrir janela (drivers "dummy" do SDL). A cada quadro a fila de eventos
+é lida uma única vez e repassada a todas as sessões, junto com a entrada simulada de
+cada uma: um clique em um item a cada 4 quadros e movimentos do mouse nos demais, que
+não mudam a tela. Cada exportador é medido com e sem pular os quadros repetidos; o
+vídeo bruto vai para os.devnull (ou para o ffmpeg, com --ffmpeg) e os PNG para uma
+pasta temporária.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_exportacao [--sessoes 4] [--quadros 500] [--ffmpeg pasta]
+"""
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from exportacao import ExportadorBruto, ExportadorPNG, ExportadorQuadros, comando_ffmpeg
+from gravacao import GravadorSessoes
+from interface import InterfaceJogo
+from jogo import itens
+from ranking import Ranking
+from registro import RegistroPartidas
+from rodada import DURACOES_PADRAO
+
+
+def roteiro(sessao: int, quadro: int) -> List[pygame.event.Event]:
+    """Clica em um item a cada 4 quadros; nos demais, move o mouse sobre o fundo."""
+    if quadro % 4 == 0:
+        pos = (120 + (quadro // 4 + sessao) % len(itens) * 150, 525)
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)]
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=(400, 300 + quadro % 2), rel=(0, 0), buttons=(0, 0, 0))]
+
+
+def medir(rotulo: str, criar_exportador: Callable[[int, pygame.Surface], Optional[ExportadorQuadros]], sessoes: int, quadros: int, pasta: str) -> None:
+    """Roda `sessoes` partidas simultâneas por `quadros` quadros e imprime as taxas."""
+    registro = RegistroPartidas(os.path.join(pasta, "registros"))
+    interfaces = []
+    for k in range(sessoes):
+        tela = pygame.Surface((800, 600))
+        interface = InterfaceJogo(fps_alvo=0, duracoes_fases=dict.fromkeys(DURACOES_PADRAO, 0), ranking=Ranking(":memory:"),
+                                  registro=registro, gravador=GravadorSessoes(os.path.join(pasta, "gravacoes")),
+                                  tela=tela, exportador=criar_exportador(k, tela))
+        interface.iniciar_partida(f"sessao{k}")
+        interface.invalidar_tela(interface.camada_jogo)
+        interfaces.append(interface)
+
+    inicio = time.perf_counter()
+    for quadro in range(quadros):
+        eventos = pygame.event.get()
+        for k, interface in enumerate(interfaces):
+            if interface.passo_jogo(eventos + roteiro(k, quadro)):
+                interface.iniciar_partida(f"sessao{k}")
+                interface.invalidar_tela(interface.camada_jogo)
+            interface.exportar_quadro()
+    duracao = time.perf_counter() - inicio
+
+    gravados = quadros
+    for interface in interfaces:
+        if interface.exportador is not None:
+            gravados = interface.exportador.gravados
+            interface.exportador.fechar()
+    registro.fechar()
+    print(f"{rotulo:<24} {sessoes} sessões x {quadros} quadros em {duracao:6.2f}s: "
+          f"{quadros / duracao:8.1f} quadros/s por sessão, {gravados} gravados por sessão")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessoes", type=int, default=4, help="Sessões simultâneas.")
+    parser.add_argument("--quadros", type=int, default=500, help="Quadros por sessão.")
+    parser.add_argument("--ffmpeg", help="Pasta onde gravar um vídeo por sessão com o ffmpeg, em vez de os.devnull.")
+    args = parser.parse_args()
+
+    pygame.init()
+    with tempfile.TemporaryDirectory() as pasta:
+        def bruto(pular_repetidos: bool) -> Callable[[int, pygame.Surface], ExportadorQuadros]:
+            def criar(k: int, tela: pygame.Surface) -> ExportadorQuadros:
+                if args.ffmpeg:
+                    os.makedirs(args.ffmpeg, exist_ok=True)
+                    processo = subprocess.Popen(comando_ffmpeg(tela, 60, os.path.join(args.ffmpeg, f"sessao{k}.mp4")), stdin=subprocess.PIPE)
+                    return ExportadorBruto(processo.stdin, pular_repetidos)
+                return ExportadorBruto(open(os.devnull, "wb"), pular_repetidos)
+            return criar
+
+        def png(pular_repetidos: bool) -> Callable[[int, pygame.Surface], ExportadorQuadros]:
+            return lambda k, tela: ExportadorPNG(os.path.join(pasta, f"png{int(pular_repetidos)}", f"sessao{k}"), pular_repetidos)
+
+        medir("sem exportação", lambda k, tela: None, args.sessoes, args.quadros, pasta)
+        medir("bruto, todos", bruto(False), args.sessoes, args.quadros, pasta)
+        medir("bruto, pulando iguais", bruto(True), args.sessoes, args.quadros, pasta)
+        medir("PNG, todos", png(False), args.sessoes, args.quadros, pasta)
+        medir("PNG, pulando iguais", png(True), args.sessoes, args.quadros, pasta)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Mede o tempo de inicialização até o primeiro quadro do menu.
+
+Cada medição roda em um processo novo, com os drivers "dummy" do SDL:
+    - sem cache: imagens decodificadas e redimensionadas, sons carregados antes da tela;
+    - frio: cache de imagens vazio;
+    - quente: cache de imagens já preenchido pela execução anterior.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_inicializacao [repeticoes]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Tuple
+
+FILHO = r"""
+import os, sys, time
+inicio = time.perf_counter()
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+from interface import InterfaceJogo
+from main import criar_menu, desenhar_menu
+from recursos import GerenciadorRecursos
+importado = time.perf_counter()
+pasta = sys.argv[1] or None
+recursos = GerenciadorRecursos(pasta)
+interface = InterfaceJogo(recursos=recursos)
+if pasta is None:
+    interface.sons  # Sem cache, reproduz o carregamento síncrono original
+desenhar_menu(interface, criar_menu(interface))
+interface.apresentar()
+fim = time.perf_counter()
+print(fim - inicio, fim - importado)
+"""
+
+
+def medir(pasta: str) -> Tuple[float, float]:
+    """Roda um processo novo e retorna o tempo até o primeiro quadro, em milissegundos.
+
+    O segundo valor desconta o tempo de importação do pygame e dos módulos do jogo.
+    """
+    saida = subprocess.run([sys.executable, "-c", FILHO, pasta], capture_output=True, text=True,
+                           env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"})
+    if saida.returncode != 0:
+        sys.stderr.write(saida.stderr)
+        raise SystemExit(f"A medição falhou (código {saida.returncode}).")
+    total, sem_importacao = saida.stdout.strip().splitlines()[-1].split()
+    return float(total) * 1000, float(sem_importacao) * 1000
+
+
+def main() -> None:
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pasta = tempfile.mkdtemp(prefix="jokenpo-cache-")
+    try:
+        sem_cache, frio, quente = [], [], []
+        for _ in range(repeticoes):
+            sem_cache.append(medir(""))
+            shutil.rmtree(pasta, ignore_errors=True)
+            frio.append(medir(pasta))
+            quente.append(medir(pasta))
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+    print(f"{'':<10} {'total':>10} {'sem importações':>16}  (mínimo de {repeticoes})")
+    for nome, tempos in (("sem cache", sem_cache), ("frio", frio), ("quente", quente)):
+        print(f"{nome:<10} {min(t[0] for t in tempos):7.1f} ms {min(t[1] for t in tempos):13.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
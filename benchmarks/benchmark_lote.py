@@ -0,0 +1,42 @@
+"""Mede a vazão da resolução de jogadas, uma a uma e em lote.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_lote [quantidade]
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+from jogo import JogoJokenpo, nomes_itens
+
+
+def medir_individual(quantidade: int) -> float:
+    """Retorna quantas chamadas de `determinar_vencedor` são feitas por segundo."""
+    jogo = JogoJokenpo()
+    pares = [(random.choice(nomes_itens), random.choice(nomes_itens)) for _ in range(quantidade)]
+    inicio = time.perf_counter()
+    for jogador, computador in pares:
+        jogo.determinar_vencedor(jogador, computador)
+    return quantidade / (time.perf_counter() - inicio)
+
+
+def medir_lote(quantidade: int) -> float:
+    """Retorna quantas jogadas por segundo `determinar_vencedor_lote` resolve."""
+    gerador = np.random.default_rng(0)
+    jogador = gerador.integers(0, len(nomes_itens), quantidade, dtype=np.int8)
+    computador = gerador.integers(0, len(nomes_itens), quantidade, dtype=np.int8)
+    inicio = time.perf_counter()
+    JogoJokenpo.determinar_vencedor_lote(jogador, computador)
+    return quantidade / (time.perf_counter() - inicio)
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    print(f"Individual: {medir_individual(min(quantidade, 1_000_000)):,.0f} jogadas/s")
+    print(f"Lote:       {medir_lote(quantidade):,.0f} jogadas/s")
+
+
+if __name__ == "__main__":
+    main()
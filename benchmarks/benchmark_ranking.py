@@ -0,0 +1,45 @@
+"""Mede inserções e leituras do ranking SQLite com um histórico grande.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_ranking [entradas]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from ranking import Ranking
+
+
+def main() -> None:
+    entradas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as pasta:
+        ranking = Ranking(os.path.join(pasta, "ranking.db"))
+
+        inicio = time.perf_counter()
+        for base in range(0, entradas, 100_000):
+            ranking.inserir_varios((f"jogador{rng.randrange(50_000)}", rng.randrange(0, 16)) for _ in range(min(100_000, entradas - base)))
+        duracao = time.perf_counter() - inicio
+        print(f"Carga de {len(ranking):,} entradas: {duracao:.2f}s ({entradas / duracao:,.0f} inserções/s)")
+
+        inicio = time.perf_counter()
+        for _ in range(1000):
+            ranking.inserir(f"jogador{rng.randrange(50_000)}", rng.randrange(0, 16))
+        print(f"Inserção individual (com commit): {(time.perf_counter() - inicio) / 1000 * 1e6:.0f} µs")
+
+        for nome, consulta in (
+            ("Topo 15", lambda: ranking.topo(15)),
+            ("Topo 15 por jogador", lambda: ranking.topo_jogadores(15)),
+            ("Melhor de um jogador", lambda: ranking.melhor(f"jogador{rng.randrange(50_000)}")),
+        ):
+            inicio = time.perf_counter()
+            for _ in range(1000):
+                consulta()
+            print(f"{nome}: {(time.perf_counter() - inicio) / 1000 * 1e6:.0f} µs")
+        ranking.fechar()
+
+
+if __name__ == "__main__":
+    main()
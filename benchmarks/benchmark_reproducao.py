@@ -0,0 +1,61 @@
+"""Mede a reprodução de sessões gravadas em um processo e em um pool de processos.
+
+Gera sessões sintéticas como a interface as gravaria (semente aleatória, jogadas do
+usuário ao acaso até alguém atingir `PONTOS_PARA_VENCER`), alternando entre todas as
+estratégias de `ESTRATEGIAS` e o computador ao acaso, e as reproduz com `gravacao.reproduzir_em_lote`, que deve encontrar zero
+divergências.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_reproducao [--sessoes 5000] [--processos 4]
+"""
+import argparse
+import os
+import random
+import time
+from typing import List
+
+from estrategias import ESTRATEGIAS, criar_estrategia
+from gravacao import Sessao, reproduzir_em_lote
+from jogo import JogoJokenpo, PONTOS_PARA_VENCER, REGRAS_PADRAO, nomes_resultados
+from regras import DERROTA, EMPATE, VITORIA
+
+NOMES_ESTRATEGIAS = (None, *ESTRATEGIAS)
+
+
+def gerar_sessoes(quantidade: int, semente: int) -> List[str]:
+    """Joga `quantidade` partidas e retorna as sessões serializadas."""
+    rng = random.Random(semente)
+    codigos = {nomes_resultados[codigo]: codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+    linhas = []
+    for k in range(quantidade):
+        nome_estrategia = NOMES_ESTRATEGIAS[k % len(NOMES_ESTRATEGIAS)]
+        estrategia = criar_estrategia(nome_estrategia) if nome_estrategia else None
+        # Grava o nome da própria estratégia, como o `GravadorSessoes`
+        sessao = Sessao(f"{k:08x}", rng.getrandbits(63), "sheldon", estrategia.nome if estrategia else None)
+        jogo = JogoJokenpo(estrategia, semente=sessao.semente)
+        while max(jogo.pontos_usuario, jogo.pontos_computador) < PONTOS_PARA_VENCER:
+            jogador = rng.randrange(len(REGRAS_PADRAO))
+            computador, resultado = jogo.escolher_jogada(REGRAS_PADRAO.nomes_itens[jogador])
+            sessao.jogadas.append((0.0, jogador, REGRAS_PADRAO.indice[computador], codigos[resultado], jogo.pontos_usuario, jogo.pontos_computador))
+        linhas.append(sessao.para_json())
+    return linhas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessoes", type=int, default=5000, help="Sessões geradas e reproduzidas.")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="Processos do pool.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    linhas = gerar_sessoes(args.sessoes, args.semente)
+    for processos in sorted({1, args.processos}):
+        inicio = time.perf_counter()
+        sessoes, jogadas, divergencias = reproduzir_em_lote(iter(linhas), processos)
+        duracao = time.perf_counter() - inicio
+        print(f"{processos} processo(s): {sessoes} sessões, {jogadas} jogadas em {duracao:.2f}s "
+              f"({sessoes / duracao:,.0f} sessões/s), {len(divergencias)} divergências")
+
+
+if __name__ == "__main__":
+    main()
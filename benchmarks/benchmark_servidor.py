@@ -0,0 +1,120 @@
+"""Gerador de carga para o servidor de partidas em rede.
+
+Abre muitas conexões simultâneas, que entram na fila, são pareadas entre si e jogam
+partidas seguidas com jogadas aleatórias. Ao final, informa as jogadas resolvidas por
+segundo e os percentis do tempo entre enviar uma jogada e receber o resultado da
+rodada (que inclui esperar a jogada do oponente, também gerada aqui).
+
+Sem --porta, um servidor é iniciado em outro processo, em uma porta livre do loopback.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_servidor [--conexoes 2000] [--duracao 10] [--host 127.0.0.1 --porta 5050]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+from typing import List, Optional
+
+from jogo import nomes_itens
+from servidor import ENTRAR, FIM, INICIO, JOGADA, RODADA, codificar, decodificar, servir
+
+
+def _executar_servidor(fila: "multiprocessing.Queue[int]") -> None:
+    asyncio.run(servir("127.0.0.1", 0, fila.put))
+
+
+class Medicoes:
+    def __init__(self) -> None:
+        self.latencias: List[float] = []
+        self.jogadas = 0
+        self.partidas = 0
+        self.medindo = False
+
+
+async def jogador(leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter, numero: int, rng: random.Random, medicoes: Medicoes) -> None:
+    """Joga partidas seguidas até ser cancelado."""
+    def jogar() -> float:
+        escritor.write(codificar({"tipo": JOGADA, "item": rng.choice(nomes_itens)}))
+        return time.perf_counter()
+
+    escritor.write(codificar({"tipo": ENTRAR, "nome": f"carga{numero}"}))
+    pontos_para_vencer = 0
+    enviada = 0.0
+    while True:
+        linha = await leitor.readline()
+        if not linha:
+            return
+        mensagem = decodificar(linha)
+        tipo = mensagem["tipo"]
+        if tipo == INICIO:
+            pontos_para_vencer = mensagem["pontos_para_vencer"]
+            enviada = jogar()
+        elif tipo == RODADA:
+            if medicoes.medindo:
+                medicoes.latencias.append(time.perf_counter() - enviada)
+                medicoes.jogadas += 1
+            if max(mensagem["pontos"], mensagem["pontos_oponente"]) < pontos_para_vencer:
+                enviada = jogar()
+        elif tipo == FIM:
+            medicoes.partidas += medicoes.medindo
+            escritor.write(codificar({"tipo": ENTRAR, "nome": f"carga{numero}"}))
+
+
+async def gerar_carga(host: str, porta: int, conexoes: int, duracao: float, semente: int) -> Medicoes:
+    """Conecta os jogadores, deixa-os jogar por `duracao` segundos e retorna as medições."""
+    abertas = []
+    for inicio in range(0, conexoes, 500):  # Em blocos, para não estourar a fila de conexões pendentes
+        abertas += await asyncio.gather(*(asyncio.open_connection(host, porta) for _ in range(min(500, conexoes - inicio))))
+
+    medicoes = Medicoes()
+    rng = random.Random(semente)
+    tarefas = [asyncio.create_task(jogador(leitor, escritor, i, random.Random(rng.getrandbits(64)), medicoes))
+               for i, (leitor, escritor) in enumerate(abertas)]
+    await asyncio.sleep(min(1.0, duracao / 10))  # Aquecimento: pareamento das primeiras partidas
+    medicoes.medindo = True
+    await asyncio.sleep(duracao)
+    medicoes.medindo = False
+
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+    for _, escritor in abertas:
+        escritor.close()
+    return medicoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conexoes", type=int, default=2000, help="Conexões simultâneas (duas por partida).")
+    parser.add_argument("--duracao", type=float, default=10.0, help="Duração da medição, em segundos.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, help="Porta de um servidor já em execução.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    processo: Optional[multiprocessing.Process] = None
+    porta = args.porta
+    if porta is None:
+        fila: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+        processo = multiprocessing.Process(target=_executar_servidor, args=(fila,), daemon=True)
+        processo.start()
+        porta = fila.get(timeout=10)
+
+    try:
+        medicoes = asyncio.run(gerar_carga(args.host, porta, args.conexoes, args.duracao, args.semente))
+    finally:
+        if processo is not None:
+            processo.terminate()
+
+    latencias = sorted(medicoes.latencias)
+    print(f"{args.conexoes} conexões, {args.conexoes // 2} partidas simultâneas, {args.duracao:.0f}s")
+    print(f"Jogadas resolvidas: {medicoes.jogadas:,} ({medicoes.jogadas / args.duracao:,.0f}/s), partidas concluídas: {medicoes.partidas // 2:,}")
+    if latencias:
+        percentis = "  ".join(f"p{p} {latencias[min(len(latencias) - 1, len(latencias) * p // 100)] * 1000:.2f}" for p in (50, 95, 99))
+        print(f"Tempo até o resultado da rodada (ms): {percentis}  máx {latencias[-1] * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Mede o tempo de quadro do menu, das regras e do jogo sem janela, com entrada simulada.
+
+Roda com os drivers "dummy" de vídeo e áudio do SDL. Os movimentos e cliques do mouse
+são postados na fila de eventos a cada quadro, e o jogo usa fases de duração zero.
+Com --limite-p95, termina com erro se o p95 de alguma tela passar do limite, para
+acusar regressões de desempenho em uma máquina Linux sem monitor.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_telas [--quadros 2000] [--csv pasta] [--limite-p95 ms]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, Iterator, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from gravacao import GravadorSessoes
+from interface import InterfaceJogo
+from jogo import itens
+from main import criar_menu, passo_menu
+from perfil import PerfilQuadros
+from ranking import Ranking
+from registro import RegistroPartidas
+from rodada import DURACOES_PADRAO
+
+
+def mover(x: int, y: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+
+
+def clicar(x: int, y: int) -> List[pygame.event.Event]:
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(x, y), button=1)]
+
+
+def roteiro_menu(quadro: int) -> Iterator[pygame.event.Event]:
+    """Passa o mouse sobre cada botão do menu, sem clicar."""
+    yield mover(400, (200, 335, 435, 700)[quadro % 4])
+
+
+def roteiro_regras(quadro: int) -> Iterator[pygame.event.Event]:
+    """Alterna o mouse entre o botão de menu e o texto das regras."""
+    yield mover(60, 35) if quadro % 2 else mover(400, 300)
+
+
+def roteiro_jogo(quadro: int) -> Iterator[pygame.event.Event]:
+    """Clica em um item a cada 4 quadros e movimenta o mouse nos demais."""
+    x = 120 + (quadro // 4 % len(itens)) * 150
+    if quadro % 4 == 0:
+        yield from clicar(x, 525)
+    else:
+        yield mover(x, 300 + quadro % 2)
+
+
+def executar(interface: InterfaceJogo, passo: Callable[[List[pygame.event.Event]], object], roteiro: Callable[[int], Iterator[pygame.event.Event]], quadros: int) -> None:
+    """Roda `quadros` iterações do laço de uma tela, postando os eventos do roteiro.
+
+    A tela só é desenhada nos quadros em que algo muda, como no jogo, então o perfil
+    conta apenas os quadros desenhados.
+    """
+    interface.invalidar_tela()
+    for quadro in range(quadros):
+        for evento in roteiro(quadro):
+            pygame.event.post(evento)
+        passo(interface.obter_eventos())
+        interface.aguardar_quadro()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quadros", type=int, default=2000, help="Quadros simulados por tela.")
+    parser.add_argument("--csv", help="Pasta onde gravar os tempos de cada tela em CSV.")
+    parser.add_argument("--limite-p95", type=float, help="Falha se o p95 de alguma tela passar deste valor (ms).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta_registros:
+        registro = RegistroPartidas(pasta_registros)
+
+        def nova_interface() -> InterfaceJogo:
+            return InterfaceJogo(fps_alvo=0, duracoes_fases=dict.fromkeys(DURACOES_PADRAO, 0), ranking=Ranking(":memory:"),
+                                 registro=registro, perfil=PerfilQuadros(capacidade=args.quadros),
+                                 gravador=GravadorSessoes(os.path.join(pasta_registros, "gravacoes")))
+
+        def passo_jogo(eventos: List[pygame.event.Event]) -> None:
+            if interface.passo_jogo(eventos):
+                interface.iniciar_partida("benchmark")
+                interface.invalidar_tela()
+
+        falhou = False
+        for nome in ("menu", "regras", "jogo"):
+            interface = nova_interface()
+            if nome == "menu":
+                camada = criar_menu(interface)
+                executar(interface, lambda eventos: passo_menu(interface, camada, eventos), roteiro_menu, args.quadros)
+            elif nome == "regras":
+                executar(interface, interface.passo_regras, roteiro_regras, args.quadros)
+            else:
+                interface.iniciar_partida("benchmark")
+                executar(interface, passo_jogo, roteiro_jogo, args.quadros)
+
+            print(f"{nome:<7} {interface.perfil.resumo()}")
+            if args.csv:
+                os.makedirs(args.csv, exist_ok=True)
+                interface.perfil.salvar_csv(os.path.join(args.csv, f"{nome}.csv"))
+            if args.limite_p95 is not None and interface.perfil.percentis()[95] > args.limite_p95:
+                print(f"{nome}: p95 acima de {args.limite_p95} ms")
+                falhou = True
+        registro.fechar()
+    sys.exit(1 if falhou else 0)
+
+
+if __name__ == "__main__":
+    main()
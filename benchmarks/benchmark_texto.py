@@ -0,0 +1,74 @@
+"""Compara o tempo por quadro das telas com e sem o cache de textos.
+
+Roda com os drivers de vídeo e áudio "dummy" do SDL, sem abrir janela. Além do tempo
+de CPU do quadro inteiro, mede o tempo gasto apenas em `exibir_texto`, que é a parte
+que o cache afeta; nas telas em que o texto é uma fração pequena do quadro (o menu,
+cujos botões já são pré-renderizados), o ganho no quadro inteiro também é pequeno.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_texto [quadros]
+"""
+import os
+import sys
+import time
+from typing import Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from interface import InterfaceJogo
+from main import criar_menu, desenhar_menu
+
+
+def quadro_jogo(interface: InterfaceJogo) -> None:
+    """Desenha um quadro da tela do jogo com uma jogada já revelada."""
+    interface.desenhar_tabuleiro("Spock", "Pedra", "Vitória")
+    interface.desenhar_widgets(interface.camada_jogo)
+
+
+def medir(interface: InterfaceJogo, desenhar, quadros: int) -> Tuple[float, float]:
+    """Retorna o tempo de CPU médio por quadro e o tempo médio em `exibir_texto`, em milissegundos."""
+    interface.cache_texto.limpar()
+    exibir_texto = interface.exibir_texto
+    tempo_texto = 0.0
+
+    def exibir_texto_medido(*args, **kwargs) -> None:
+        nonlocal tempo_texto
+        inicio = time.perf_counter()
+        exibir_texto(*args, **kwargs)
+        tempo_texto += time.perf_counter() - inicio
+
+    interface.exibir_texto = exibir_texto_medido
+    try:
+        inicio = time.process_time()
+        for _ in range(quadros):
+            desenhar()
+        duracao = time.process_time() - inicio
+    finally:
+        del interface.exibir_texto
+    return duracao / quadros * 1000, tempo_texto / quadros * 1000
+
+
+def main() -> None:
+    quadros = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    interface = InterfaceJogo()
+    menu = criar_menu(interface)
+    telas = {
+        "menu": lambda: desenhar_menu(interface, menu),
+        "regras": interface.desenhar_regras,
+        "jogo": lambda: quadro_jogo(interface),
+    }
+    capacidade = interface.cache_texto.capacidade
+    print(f"{'':<7} {'quadro (ms)':>23}  {'exibir_texto (ms)':>23}")
+    print(f"{'':<7} {'sem cache':>11} {'com cache':>11}  {'sem cache':>11} {'com cache':>11}")
+    for nome, desenhar in telas.items():
+        interface.cache_texto.capacidade = 0
+        quadro_sem, texto_sem = medir(interface, desenhar, quadros)
+        interface.cache_texto.capacidade = capacidade
+        quadro_com, texto_com = medir(interface, desenhar, quadros)
+        print(f"{nome:<7} {quadro_sem:11.3f} {quadro_com:11.3f}  {texto_sem:11.3f} {texto_com:11.3f}  "
+              f"acertos {interface.cache_texto.taxa_acertos:.1%}")
+
+
+if __name__ == "__main__":
+    main()
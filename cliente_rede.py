@@ -0,0 +1,112 @@
+import queue
+import socket
+import threading
+from typing import Callable, List, Optional
+
+from servidor import ENTRAR, JOGADA, SAIR, codificar, decodificar
+
+# Mensagem local entregue quando a conexão com o servidor termina
+DESCONECTADO = "desconectado"
+
+
+class ClienteRede:
+    """Conexão com o `ServidorJokenpo` para a interface, que roda fora de um laço asyncio.
+
+    Uma thread lê as mensagens do servidor e as entrega para `ao_receber`, se definido,
+    ou as guarda até a próxima chamada de `mensagens`; outra thread escreve no socket as
+    mensagens postas na fila por `enviar`, então o laço de quadros nunca espera pela rede.
+    Se a conexão cai, a mensagem DESCONECTADO é entregue uma vez, e as mensagens enviadas
+    depois disso são descartadas, entregando DESCONECTADO de novo.
+    """
+
+    def __init__(self, host: str, porta: int, tempo_limite: float = 5.0) -> None:
+        """Conecta ao servidor e começa a ler as mensagens.
+
+        Parâmetros:
+            host (str): O endereço do servidor.
+            porta (int): A porta do servidor.
+            tempo_limite (float): Quanto tempo, em segundos, esperar pela conexão.
+        """
+        self.socket = socket.create_connection((host, porta), timeout=tempo_limite)
+        self.socket.settimeout(None)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.ao_receber: Optional[Callable[[dict], None]] = None
+        self._mensagens: "queue.Queue[dict]" = queue.Queue()
+        self._envios: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self.conectado = True
+        self._thread = threading.Thread(target=self._ler, name="cliente-rede", daemon=True)
+        self._thread.start()
+        self._thread_envio = threading.Thread(target=self._escrever, name="cliente-rede-envio", daemon=True)
+        self._thread_envio.start()
+
+    def _ler(self) -> None:
+        """Laço da thread de leitura."""
+        try:
+            with self.socket.makefile("rb") as arquivo:
+                for linha in arquivo:
+                    self._entregar(decodificar(linha))
+        except (OSError, ValueError):
+            pass
+        self.conectado = False
+        self._entregar({"tipo": DESCONECTADO})
+
+    def _escrever(self) -> None:
+        """Laço da thread de envio; termina ao receber None ou se a conexão falhar."""
+        while True:
+            dados = self._envios.get()
+            if dados is None:
+                return
+            try:
+                self.socket.sendall(dados)
+            except OSError:
+                # Encerra a leitura também, que então entrega DESCONECTADO
+                self._encerrar_socket()
+                return
+
+    def _encerrar_socket(self) -> None:
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _entregar(self, mensagem: dict) -> None:
+        if self.ao_receber is not None:
+            self.ao_receber(mensagem)
+        else:
+            self._mensagens.put(mensagem)
+
+    def enviar(self, mensagem: dict) -> None:
+        """Põe uma mensagem do protocolo na fila de envio ao servidor, sem bloquear."""
+        if not self.conectado:
+            self._entregar({"tipo": DESCONECTADO})
+            return
+        self._envios.put(codificar(mensagem))
+
+    def entrar(self, nome: str) -> None:
+        """Entra na fila de pareamento do servidor."""
+        self.enviar({"tipo": ENTRAR, "nome": nome})
+
+    def jogar(self, item: str) -> None:
+        """Envia a jogada lacrada da rodada atual."""
+        self.enviar({"tipo": JOGADA, "item": item})
+
+    def mensagens(self) -> List[dict]:
+        """Retira as mensagens recebidas desde a última chamada, sem bloquear."""
+        recebidas = []
+        while True:
+            try:
+                recebidas.append(self._mensagens.get_nowait())
+            except queue.Empty:
+                return recebidas
+
+    def sair(self) -> None:
+        """Abandona a partida em andamento ou a fila, mantendo a conexão."""
+        self.enviar({"tipo": SAIR})
+
+    def fechar(self) -> None:
+        """Encerra a conexão com o servidor."""
+        self._envios.put(None)
+        self._thread_envio.join()
+        self._encerrar_socket()
+        self._thread.join()
+        self.socket.close()
@@ -0,0 +1,313 @@
+import random
+from typing import Callable, Dict, List, Optional
+
+from jogo import REGRAS_PADRAO, nomes_itens
+from regras import ConjuntoRegras
+from solver import PoliticaOtima, carregar_politica
+
+
+class Estrategia:
+    """Política de escolha de jogadas de um oponente controlado pelo computador.
+
+    As jogadas são codificadas como índices dos itens de `regras`. O gerador aleatório é
+    fornecido por quem conduz a partida, para que os resultados sejam reproduzíveis.
+    """
+
+    # Com que nome `criar_estrategia` recria a estratégia, p. ex. ao reproduzir uma sessão gravada
+    nome: str = "estrategia"
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None) -> None:
+        """Inicializa a estratégia.
+
+        Parâmetros:
+            regras (Optional[ConjuntoRegras]): O conjunto de regras da partida (padrão: `REGRAS_PADRAO`).
+        """
+        self.regras = regras or REGRAS_PADRAO
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        """Escolhe a próxima jogada.
+
+        Parâmetros:
+            rng (random.Random): O gerador de números aleatórios da partida.
+            pontos_proprios (int): A pontuação atual de quem usa a estratégia.
+            pontos_oponente (int): A pontuação atual do oponente.
+
+        Retorna:
+            int: O índice do item escolhido.
+        """
+        raise NotImplementedError
+
+    def observar(self, jogada_propria: int, jogada_oponente: int) -> None:
+        """Registra as jogadas da rodada que acabou de ser resolvida.
+
+        Parâmetros:
+            jogada_propria (int): O índice do item jogado pela estratégia.
+            jogada_oponente (int): O índice do item jogado pelo oponente.
+        """
+
+    def reiniciar(self) -> None:
+        """Descarta o que foi aprendido, preparando a estratégia para uma nova partida."""
+
+
+class EstrategiaAleatoria(Estrategia):
+    """Escolhe um item uniformemente, como o computador original do jogo."""
+
+    nome = "aleatoria"
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        return rng.randrange(len(self.regras))
+
+
+class EstrategiaFixa(Estrategia):
+    """Joga sempre o mesmo item."""
+
+    def __init__(self, item: int, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(regras)
+        self.item = item
+        self.nome = f"sempre_{self.regras.nomes_itens[item].lower()}"
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        return self.item
+
+
+class EstrategiaCiclica(Estrategia):
+    """Percorre os itens em ordem, um por rodada."""
+
+    nome = "ciclica"
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(regras)
+        self.proxima = 0
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        return self.proxima
+
+    def observar(self, jogada_propria: int, jogada_oponente: int) -> None:
+        self.proxima = (jogada_propria + 1) % len(self.regras)
+
+    def reiniciar(self) -> None:
+        self.proxima = 0
+
+
+class EstrategiaImitadora(Estrategia):
+    """Repete a última jogada do oponente."""
+
+    nome = "imitadora"
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(regras)
+        self.ultima_oponente = -1
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        if self.ultima_oponente < 0:
+            return rng.randrange(len(self.regras))
+        return self.ultima_oponente
+
+    def observar(self, jogada_propria: int, jogada_oponente: int) -> None:
+        self.ultima_oponente = jogada_oponente
+
+    def reiniciar(self) -> None:
+        self.ultima_oponente = -1
+
+
+class EstrategiaOtima(Estrategia):
+    """Joga a estratégia mista ótima do placar atual, calculada por `solver`.
+
+    A política é lida do cache em disco (ou calculada na primeira vez); cada jogada é
+    só uma consulta à tabela do placar e um sorteio.
+    """
+
+    nome = "otima"
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None, politica: Optional[PoliticaOtima] = None) -> None:
+        super().__init__(regras)
+        self.politica = politica or carregar_politica(self.regras)
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        return self.politica.sortear(rng, pontos_proprios, pontos_oponente)
+
+
+class BufferCircular:
+    """Guarda as últimas `capacidade` jogadas em um vetor de tamanho fixo."""
+
+    def __init__(self, capacidade: int) -> None:
+        self.capacidade = capacidade
+        self.dados: List[int] = [0] * capacidade
+        self.inicio = 0
+        self.tamanho = 0
+
+    def adicionar(self, valor: int) -> int:
+        """Insere um valor, descartando o mais antigo se o buffer estiver cheio.
+
+        Parâmetros:
+            valor (int): O valor a ser inserido.
+
+        Retorna:
+            int: O valor descartado, ou -1 se nenhum foi descartado.
+        """
+        if self.tamanho < self.capacidade:
+            self.dados[(self.inicio + self.tamanho) % self.capacidade] = valor
+            self.tamanho += 1
+            return -1
+        descartado = self.dados[self.inicio]
+        self.dados[self.inicio] = valor
+        self.inicio = (self.inicio + 1) % self.capacidade
+        return descartado
+
+    def limpar(self) -> None:
+        """Esvazia o buffer."""
+        self.inicio = 0
+        self.tamanho = 0
+
+
+class LinhaContagem:
+    """Contagens das jogadas do oponente em um contexto e o saldo esperado de cada resposta.
+
+    `valores[i]` acumula o saldo de pontos de responder com `i` a cada jogada contada,
+    sendo atualizado junto com as contagens para que a previsão não precise de laços.
+    """
+
+    __slots__ = ("contagens", "valores", "total", "saldo_contra")
+
+    def __init__(self, regras: ConjuntoRegras) -> None:
+        n = len(regras)
+        self.contagens: List[int] = [0] * n
+        self.valores: List[int] = [0] * n
+        self.total = 0
+        self.saldo_contra = regras.saldo_contra
+
+    def somar(self, jogada: int, quantidade: int = 1) -> None:
+        """Soma `quantidade` (que pode ser negativa) às ocorrências de `jogada`."""
+        self.contagens[jogada] += quantidade
+        self.total += quantidade
+        valores = self.valores
+        for i, saldo in enumerate(self.saldo_contra[jogada]):
+            valores[i] += saldo * quantidade
+
+
+class EstrategiaPreditiva(Estrategia):
+    """Base das estratégias adaptativas: prevê a jogada do oponente e a contra-ataca.
+
+    As subclasses mantêm tabelas de contagem atualizadas em tempo constante a cada
+    rodada e informam, em `linha_prevista`, a linha do contexto atual. Com `ponderada`,
+    a resposta maximiza o saldo de pontos esperado usando os pesos dos itens; sem ela,
+    vence o item mais provável com o item mais pesado possível.
+    """
+
+    def __init__(self, ponderada: bool = True, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(regras)
+        self.ponderada = ponderada
+
+    def linha_prevista(self) -> Optional[LinhaContagem]:
+        """Retorna as contagens do contexto atual, ou None se ainda não há contexto."""
+        raise NotImplementedError
+
+    def escolher(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        linha = self.linha_prevista()
+        if linha is None or not linha.total:
+            return rng.randrange(len(self.regras))
+        if self.ponderada:
+            valores = linha.valores
+            return valores.index(max(valores))
+        contagens = linha.contagens
+        return self.regras.vencedores[contagens.index(max(contagens))][0]
+
+
+class EstrategiaFrequencia(EstrategiaPreditiva):
+    """Prevê o oponente pela frequência de cada item, em todo o histórico ou em uma janela."""
+
+    def __init__(self, janela: int = 0, ponderada: bool = True, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(ponderada, regras)
+        self.janela = BufferCircular(janela) if janela else None
+        self.linha = LinhaContagem(self.regras)
+        self.nome = f"frequencia_{janela}" if janela else "frequencia"
+        if not ponderada:
+            self.nome = f"contra_{self.nome}"
+
+    def linha_prevista(self) -> Optional[LinhaContagem]:
+        return self.linha
+
+    def observar(self, jogada_propria: int, jogada_oponente: int) -> None:
+        self.linha.somar(jogada_oponente)
+        if self.janela is not None:
+            descartada = self.janela.adicionar(jogada_oponente)
+            if descartada >= 0:
+                self.linha.somar(descartada, -1)
+
+    def reiniciar(self) -> None:
+        self.linha = LinhaContagem(self.regras)
+        if self.janela is not None:
+            self.janela.limpar()
+
+
+class EstrategiaMarkov(EstrategiaPreditiva):
+    """Prevê o oponente por uma cadeia de Markov de ordem `ordem` sobre as jogadas dele.
+
+    O contexto (as últimas `ordem` jogadas) é mantido como um número na base
+    `len(regras)`, então cada atualização custa O(1) qualquer que seja o histórico.
+    """
+
+    def __init__(self, ordem: int = 1, ponderada: bool = True, regras: Optional[ConjuntoRegras] = None) -> None:
+        super().__init__(ponderada, regras)
+        self.ordem = ordem
+        self.nome = f"markov{ordem}" if ponderada else f"contra_markov{ordem}"
+        self.total_contextos = len(self.regras) ** ordem
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self.tabela: List[LinhaContagem] = [LinhaContagem(self.regras) for _ in range(self.total_contextos)]
+        self.contexto = 0
+        self.observadas = 0
+
+    def linha_prevista(self) -> Optional[LinhaContagem]:
+        if self.observadas < self.ordem:
+            return None
+        return self.tabela[self.contexto]
+
+    def observar(self, jogada_propria: int, jogada_oponente: int) -> None:
+        if self.observadas >= self.ordem:
+            self.tabela[self.contexto].somar(jogada_oponente)
+        else:
+            self.observadas += 1
+        self.contexto = (self.contexto * len(self.regras) + jogada_oponente) % self.total_contextos
+
+
+# Estratégias disponíveis por nome; cada entrada cria uma instância nova para o conjunto de regras
+# informado. As entradas sempre_<item> listam os itens de `REGRAS_PADRAO`.
+ESTRATEGIAS: Dict[str, Callable[[Optional[ConjuntoRegras]], Estrategia]] = {
+    "aleatoria": EstrategiaAleatoria,
+    "ciclica": EstrategiaCiclica,
+    "imitadora": EstrategiaImitadora,
+    "otima": EstrategiaOtima,
+    "frequencia": lambda regras: EstrategiaFrequencia(regras=regras),
+    "frequencia_20": lambda regras: EstrategiaFrequencia(janela=20, regras=regras),
+    "contra_frequente": lambda regras: EstrategiaFrequencia(janela=20, ponderada=False, regras=regras),
+    "markov1": lambda regras: EstrategiaMarkov(1, regras=regras),
+    "markov2": lambda regras: EstrategiaMarkov(2, regras=regras),
+    "markov3": lambda regras: EstrategiaMarkov(3, regras=regras),
+    **{f"sempre_{item.lower()}": (lambda regras, i=i: EstrategiaFixa(i, regras)) for i, item in enumerate(nomes_itens)},
+}
+
+
+def criar_estrategia(nome: str, regras: Optional[ConjuntoRegras] = None) -> Estrategia:
+    """Cria uma estratégia a partir do seu nome.
+
+    Parâmetros:
+        nome (str): O nome registrado em `ESTRATEGIAS`, ou sempre_<item> para qualquer item de `regras`.
+        regras (Optional[ConjuntoRegras]): O conjunto de regras da partida (padrão: `REGRAS_PADRAO`).
+
+    Retorna:
+        Estrategia: Uma nova instância da estratégia, com `nome` igual ao informado.
+    """
+    regras = regras or REGRAS_PADRAO
+    if nome.startswith("sempre_"):
+        itens_minusculos = [item.lower() for item in regras.nomes_itens]
+        if nome[len("sempre_"):] in itens_minusculos:
+            return EstrategiaFixa(itens_minusculos.index(nome[len("sempre_"):]), regras)
+    try:
+        estrategia = ESTRATEGIAS[nome](regras)
+    except KeyError:
+        raise ValueError(f"Estratégia desconhecida: {nome!r}. Opções: {', '.join(ESTRATEGIAS)}") from None
+    # Entradas diferentes podem criar a mesma classe com o mesmo nome (p. ex. frequencia_20 e contra_frequente)
+    estrategia.nome = nome
+    return estrategia
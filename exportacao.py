@@ -0,0 +1,156 @@
+"""Exportação dos quadros desenhados pela interface, sem janela.
+
+A `InterfaceJogo` pode desenhar em uma superfície própria em vez da janela (parâmetro
+`tela`), e a cada quadro entrega essa superfície ao exportador configurado. Os
+exportadores leem os pixels direto da memória da superfície, sem copiá-los:
+`ExportadorBruto` escreve o buffer dela em um arquivo ou pipe, no formato aceito pelo
+ffmpeg como vídeo bruto, e `ExportadorPNG` grava uma sequência de imagens. Quadros
+iguais ao anterior podem ser pulados. Sem janela, o registro de partidas é obrigatório
+e deve ser o mesmo para todas as interfaces do processo.
+
+Exemplo, gravando um vídeo com o ffmpeg:
+    tela = pygame.Surface((800, 600))
+    ffmpeg = subprocess.Popen(comando_ffmpeg(tela, 60, "partida.mp4"), stdin=subprocess.PIPE)
+    interface = InterfaceJogo(tela=tela, registro=RegistroPartidas("registros"), exportador=ExportadorBruto(ffmpeg.stdin))
+"""
+import os
+import sys
+from typing import BinaryIO, List
+
+import numpy as np
+import pygame
+
+
+def formato_pixels(tela: pygame.Surface) -> str:
+    """Descreve a ordem dos bytes de cada pixel da superfície, no formato do ffmpeg.
+
+    Parâmetros:
+        tela (pygame.Surface): Uma superfície de 32 bits.
+
+    Retorna:
+        str: O `pix_fmt` do ffmpeg, como "bgr0" ou "rgba".
+    """
+    if tela.get_bytesize() != 4:
+        raise ValueError(f"Apenas superfícies de 32 bits podem ser exportadas (esta tem {tela.get_bitsize()}).")
+    canais = ["0"] * 4
+    for canal, mascara, deslocamento in zip("rgba", tela.get_masks(), tela.get_shifts()):
+        if mascara:
+            canais[deslocamento // 8] = canal
+    if sys.byteorder == "big":
+        canais.reverse()
+    return "".join(canais)
+
+
+def comando_ffmpeg(tela: pygame.Surface, fps: float, saida: str) -> List[str]:
+    """Monta o comando do ffmpeg que lê da entrada padrão os quadros de um `ExportadorBruto`.
+
+    Parâmetros:
+        tela (pygame.Surface): A superfície exportada.
+        fps (float): A taxa de quadros do vídeo.
+        saida (str): O arquivo de vídeo a ser gerado.
+
+    Retorna:
+        List[str]: Os argumentos para o `subprocess.Popen`.
+    """
+    largura, altura = tela.get_size()
+    return ["ffmpeg", "-loglevel", "error", "-y", "-f", "rawvideo", "-pix_fmt", formato_pixels(tela),
+            "-s", f"{largura}x{altura}", "-r", str(fps), "-i", "-", "-pix_fmt", "yuv420p", saida]
+
+
+def pixels(tela: pygame.Surface) -> np.ndarray:
+    """Retorna os pixels RGB da superfície como um array (largura, altura, 3), sem cópia.
+
+    A superfície fica travada enquanto o array existir, então ele deve ser descartado
+    antes do próximo quadro. Útil para comparar telas em testes automáticos.
+
+    Parâmetros:
+        tela (pygame.Surface): A superfície.
+
+    Retorna:
+        np.ndarray: Uma vista da memória da superfície.
+    """
+    return pygame.surfarray.pixels3d(tela)
+
+
+class ExportadorQuadros:
+    """Base dos exportadores: conta os quadros e decide quais são gravados."""
+
+    def __init__(self, pular_repetidos: bool) -> None:
+        """Inicializa o exportador.
+
+        Parâmetros:
+            pular_repetidos (bool): Se quadros iguais ao anterior não devem ser gravados.
+        """
+        self.pular_repetidos = pular_repetidos
+        self.quadros = 0
+        self.gravados = 0
+
+    def exportar(self, tela: pygame.Surface, alterado: bool) -> None:
+        """Recebe um quadro da interface.
+
+        Parâmetros:
+            tela (pygame.Surface): A superfície com o quadro.
+            alterado (bool): Se algum pixel mudou desde o quadro anterior.
+        """
+        if alterado or not self.pular_repetidos or self.gravados == 0:
+            self.gravar(tela)
+            self.gravados += 1
+        self.quadros += 1
+
+    def gravar(self, tela: pygame.Surface) -> None:
+        raise NotImplementedError
+
+    def fechar(self) -> None:
+        """Libera os recursos do exportador."""
+
+
+class ExportadorBruto(ExportadorQuadros):
+    """Escreve os pixels de cada quadro, em sequência, em um arquivo ou pipe binário.
+
+    O buffer da superfície vai direto para `destino.write`; não há conversão para RGB
+    nem cópia intermediária. O formato dos pixels é o de `formato_pixels`. Por padrão
+    todo quadro é escrito, para manter a taxa de quadros constante no vídeo.
+    """
+
+    def __init__(self, destino: BinaryIO, pular_repetidos: bool = False) -> None:
+        """Inicializa o exportador.
+
+        Parâmetros:
+            destino (BinaryIO): Onde os quadros são escritos, como a entrada do ffmpeg.
+            pular_repetidos (bool): Se quadros iguais ao anterior não devem ser escritos.
+        """
+        super().__init__(pular_repetidos)
+        self.destino = destino
+
+    def gravar(self, tela: pygame.Surface) -> None:
+        vista = tela.get_view("0")
+        try:
+            self.destino.write(vista)
+        finally:
+            del vista  # Destrava a superfície
+
+    def fechar(self) -> None:
+        """Envia os quadros pendentes e fecha o destino."""
+        self.destino.close()
+
+
+class ExportadorPNG(ExportadorQuadros):
+    """Grava cada quadro como `quadro-NNNNNN.png` em uma pasta.
+
+    O número no nome é o do quadro, e não o da imagem, então os quadros pulados por
+    serem repetidos aparecem como lacunas na sequência.
+    """
+
+    def __init__(self, pasta: str, pular_repetidos: bool = True) -> None:
+        """Inicializa o exportador, criando a pasta se preciso.
+
+        Parâmetros:
+            pasta (str): A pasta das imagens.
+            pular_repetidos (bool): Se quadros iguais ao anterior não devem ser gravados.
+        """
+        super().__init__(pular_repetidos)
+        self.pasta = pasta
+        os.makedirs(pasta, exist_ok=True)
+
+    def gravar(self, tela: pygame.Surface) -> None:
+        pygame.image.save(tela, os.path.join(self.pasta, f"quadro-{self.quadros:06d}.png"))
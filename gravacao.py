@@ -0,0 +1,303 @@
+"""Gravação e reprodução determinística de sessões de jogo.
+
+Cada partida contra o computador é gravada com a semente do gerador aleatório, o
+conjunto de regras, a estratégia do computador e, para cada jogada, o instante (em
+segundos desde o início da partida), as escolhas, o resultado e o placar. As sessões
+ficam em arquivos JSON Lines, uma por linha, em `gravacoes/sessoes-AAAAMMDD.jsonl`:
+    {"sessao": "…", "semente": 123, "regras": "sheldon", "estrategia": null,
+     "jogadas": [[0.84, 2, 4, -1, 0, 5], ...]}
+com as jogadas no formato [instante, jogador, computador, resultado, pontos do
+jogador, pontos do computador] e os itens como índices das regras.
+
+A reprodução roda cada sessão de novo em um `JogoJokenpo` com a mesma semente, sem
+interface e sem esperas, e confere as escolhas do computador, os resultados e o
+placar; muitas sessões podem ser reproduzidas em paralelo em um pool de processos.
+Sessões sem semente, como as importadas do antigo jogadas.txt, reproduzem as
+escolhas gravadas do computador e conferem só os resultados e o placar.
+
+Uso:
+    python gravacao.py [--processos 4] [--texto jogadas.txt] [arquivos ou pastas...]
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from estrategias import Estrategia, criar_estrategia
+from jogo import JogoJokenpo, REGRAS_PADRAO, nomes_resultados
+from regras import DERROTA, EMPATE, VITORIA, ConjuntoRegras, carregar_regras
+
+PREFIXO_ARQUIVO = "sessoes-"
+EXTENSAO_ARQUIVO = ".jsonl"
+
+# Linha do antigo jogadas.txt
+_LINHA_TEXTO = re.compile(r"Jogada (\d+): (\S+) vs (\S+) - (\S+) \| Pontos: Você (-?\d+), Computador (-?\d+)")
+
+_codigos_resultado: Dict[str, int] = {nomes_resultados[codigo]: codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+
+# [instante, jogador, computador, resultado, pontos do jogador, pontos do computador]
+JogadaGravada = Tuple[float, int, int, int, int, int]
+
+
+@dataclass
+class Sessao:
+    """Uma partida gravada."""
+
+    sessao: str
+    semente: Optional[int]
+    regras: str = "sheldon"
+    estrategia: Optional[str] = None
+    jogadas: List[JogadaGravada] = field(default_factory=list)
+
+    def para_json(self) -> str:
+        """Serializa a sessão como uma linha de JSON, sem a quebra de linha."""
+        return json.dumps({"sessao": self.sessao, "semente": self.semente, "regras": self.regras,
+                           "estrategia": self.estrategia, "jogadas": self.jogadas}, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def de_json(cls, linha: str) -> "Sessao":
+        """Lê uma sessão serializada por `para_json`."""
+        dados = json.loads(linha)
+        return cls(dados["sessao"], dados["semente"], dados["regras"], dados["estrategia"], [tuple(jogada) for jogada in dados["jogadas"]])
+
+
+class GravadorSessoes:
+    """Grava as partidas da interface, uma sessão por linha, ao fim de cada partida."""
+
+    def __init__(self, pasta: str = "gravacoes") -> None:
+        """Inicializa o gravador.
+
+        Parâmetros:
+            pasta (str): A pasta dos arquivos de sessões, criada na primeira gravação.
+        """
+        self.pasta = pasta
+        self.atual: Optional[Sessao] = None
+        self._inicio = 0.0
+
+    def iniciar(self, sessao: bytes, semente: int, regras: ConjuntoRegras, estrategia: Optional[Estrategia]) -> None:
+        """Começa a gravar uma partida, descartando outra que não tenha sido concluída.
+
+        Parâmetros:
+            sessao (bytes): O identificador da sessão, o mesmo usado no registro de jogadas.
+            semente (int): A semente com que o gerador do jogo foi reiniciado.
+            regras (ConjuntoRegras): O conjunto de regras da partida, carregado de um arquivo.
+            estrategia (Optional[Estrategia]): A estratégia do computador, se houver. Ela é
+                gravada pelo `nome`; uma estratégia criada fora de `ESTRATEGIAS` é gravada
+                assim mesmo, e a reprodução recusa a sessão (veja `reproduzir`).
+        """
+        if regras.origem is None:
+            raise ValueError(f"{regras.nome}: só conjuntos carregados com carregar_regras podem ser gravados")
+        self.atual = Sessao(sessao.hex(), semente, regras.origem, estrategia.nome if estrategia is not None else None)
+        self._inicio = time.perf_counter()
+
+    def registrar(self, jogador: int, computador: int, resultado: int, pontos_usuario: int, pontos_computador: int) -> None:
+        """Acrescenta uma jogada à partida em gravação, se houver uma.
+
+        Parâmetros:
+            jogador (int): O índice do item escolhido pelo jogador.
+            computador (int): O índice do item escolhido pelo computador.
+            resultado (int): O código do resultado (EMPATE, VITORIA ou DERROTA).
+            pontos_usuario (int): A pontuação do jogador após a jogada.
+            pontos_computador (int): A pontuação do computador após a jogada.
+        """
+        if self.atual is not None:
+            instante = round(time.perf_counter() - self._inicio, 3)
+            self.atual.jogadas.append((instante, jogador, computador, resultado, pontos_usuario, pontos_computador))
+
+    def concluir(self) -> None:
+        """Anexa a partida em gravação ao arquivo do dia; partidas sem jogadas são descartadas."""
+        sessao, self.atual = self.atual, None
+        if sessao is None or not sessao.jogadas:
+            return
+        os.makedirs(self.pasta, exist_ok=True)
+        caminho = os.path.join(self.pasta, f"{PREFIXO_ARQUIVO}{time.strftime('%Y%m%d')}{EXTENSAO_ARQUIVO}")
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.write(sessao.para_json() + "\n")
+
+
+def arquivos_sessoes(pasta: str) -> List[str]:
+    """Lista os arquivos de sessões de uma pasta, do mais antigo ao mais recente."""
+    return sorted(glob.glob(os.path.join(pasta, f"{PREFIXO_ARQUIVO}*{EXTENSAO_ARQUIVO}")))
+
+
+def ler_sessoes(caminho: str) -> Iterator[str]:
+    """Lê as linhas de sessões de um arquivo, ignorando linhas vazias e uma última linha incompleta."""
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            if linha.endswith("\n") and linha.strip():
+                yield linha
+
+
+def importar_texto(caminho: str, regras: ConjuntoRegras = REGRAS_PADRAO) -> List[Sessao]:
+    """Converte um arquivo no formato do antigo jogadas.txt em sessões sem semente.
+
+    Uma nova sessão começa a cada "Jogada 1"; linhas em outro formato são ignoradas.
+
+    Parâmetros:
+        caminho (str): O caminho do arquivo de texto.
+        regras (ConjuntoRegras): O conjunto de regras com que as jogadas foram feitas.
+
+    Retorna:
+        List[Sessao]: As sessões, na ordem do arquivo.
+    """
+    sessoes: List[Sessao] = []
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        for numero_linha, linha in enumerate(arquivo, 1):
+            encontrado = _LINHA_TEXTO.match(linha)
+            if encontrado is None:
+                continue
+            rodada, jogador, computador, resultado, pontos_usuario, pontos_computador = encontrado.groups()
+            if rodada == "1" or not sessoes:
+                sessoes.append(Sessao(f"{os.path.basename(caminho)}:{numero_linha}", None, regras.origem or "sheldon"))
+            sessoes[-1].jogadas.append((0.0, regras.indice[jogador], regras.indice[computador], _codigos_resultado[resultado],
+                                        int(pontos_usuario), int(pontos_computador)))
+    return sessoes
+
+
+# Estratégias já criadas neste processo, reiniciadas a cada sessão
+_estrategias: Dict[Tuple[str, str], Estrategia] = {}
+
+
+def reproduzir(sessao: Sessao) -> Optional[str]:
+    """Roda a sessão de novo no motor do jogo e a compara com a gravação.
+
+    Parâmetros:
+        sessao (Sessao): A sessão gravada.
+
+    Retorna:
+        Optional[str]: A descrição da primeira divergência, ou None se tudo confere. Uma
+        sessão cuja estratégia não pode ser recriada pelo nome, como uma criada fora de
+        `ESTRATEGIAS`, é recusada com uma descrição que diz isso.
+    """
+    regras = carregar_regras(sessao.regras)
+    estrategia = None
+    if sessao.estrategia is not None:
+        chave = (sessao.regras, sessao.estrategia)
+        if chave not in _estrategias:
+            try:
+                _estrategias[chave] = criar_estrategia(sessao.estrategia, regras)
+            except ValueError:
+                return f"estratégia {sessao.estrategia!r} não registrada; a sessão não pode ser reproduzida"
+        estrategia = _estrategias[chave]
+        estrategia.reiniciar()
+    jogo = JogoJokenpo(estrategia, regras, semente=sessao.semente)
+
+    nomes = regras.nomes_itens
+    for rodada, (_, jogador, computador, resultado, pontos_usuario, pontos_computador) in enumerate(sessao.jogadas, 1):
+        if sessao.semente is None:
+            obtido = jogo.determinar_vencedor(nomes[jogador], nomes[computador])
+        else:
+            escolha_computador, obtido = jogo.escolher_jogada(nomes[jogador])
+            if escolha_computador != nomes[computador]:
+                return f"rodada {rodada}: computador jogou {escolha_computador}, gravado {nomes[computador]}"
+        if obtido != nomes_resultados[resultado]:
+            return f"rodada {rodada}: resultado {obtido}, gravado {nomes_resultados[resultado]}"
+        if (jogo.pontos_usuario, jogo.pontos_computador) != (pontos_usuario, pontos_computador):
+            return (f"rodada {rodada}: placar {jogo.pontos_usuario} x {jogo.pontos_computador}, "
+                    f"gravado {pontos_usuario} x {pontos_computador}")
+    return None
+
+
+def _reproduzir_lote(linhas: List[str]) -> Tuple[int, List[Tuple[str, str]]]:
+    """Reproduz, em um processo do pool, um lote de sessões serializadas.
+
+    Retorna:
+        Tuple[int, List[Tuple[str, str]]]: As jogadas reproduzidas e as divergências (sessão, descrição).
+    """
+    jogadas = 0
+    divergencias = []
+    for linha in linhas:
+        sessao = Sessao.de_json(linha)
+        jogadas += len(sessao.jogadas)
+        divergencia = reproduzir(sessao)
+        if divergencia is not None:
+            divergencias.append((sessao.sessao, divergencia))
+    return jogadas, divergencias
+
+
+def _lotes(linhas: Iterator[str], tamanho_lote: int) -> Iterator[List[str]]:
+    lote: List[str] = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) == tamanho_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def reproduzir_em_lote(linhas: Iterator[str], processos: Optional[int] = None, tamanho_lote: int = 500) -> Tuple[int, int, List[Tuple[str, str]]]:
+    """Reproduz muitas sessões serializadas, distribuídas em lotes por um pool de processos.
+
+    Parâmetros:
+        linhas (Iterator[str]): As sessões, uma linha de JSON cada.
+        processos (Optional[int]): O número de processos (padrão: núcleos disponíveis; 1 reproduz neste processo).
+        tamanho_lote (int): Quantas sessões cada tarefa enviada a um processo contém.
+
+    Retorna:
+        Tuple[int, int, List[Tuple[str, str]]]: O total de sessões, o total de jogadas e as divergências.
+    """
+    sessoes = jogadas = 0
+    divergencias: List[Tuple[str, str]] = []
+
+    def acumular(lote: List[str], resultado: Tuple[int, List[Tuple[str, str]]]) -> None:
+        nonlocal sessoes, jogadas
+        sessoes += len(lote)
+        jogadas += resultado[0]
+        divergencias.extend(resultado[1])
+
+    if processos == 1:
+        for lote in _lotes(linhas, tamanho_lote):
+            acumular(lote, _reproduzir_lote(lote))
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            lotes = list(_lotes(linhas, tamanho_lote))
+            for lote, resultado in zip(lotes, executor.map(_reproduzir_lote, lotes)):
+                acumular(lote, resultado)
+    return sessoes, jogadas, divergencias
+
+
+def main() -> None:
+    """Reproduz as sessões gravadas e informa as divergências; termina com erro se houver alguma."""
+    parser = argparse.ArgumentParser(description="Reproduz sessões gravadas e confere resultados e placares.")
+    parser.add_argument("caminhos", nargs="*", default=["gravacoes"], help="Arquivos ou pastas de sessões (padrão: gravacoes).")
+    parser.add_argument("--texto", action="append", default=[], help="Arquivo no formato do antigo jogadas.txt (pode repetir).")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="Número de processos.")
+    parser.add_argument("--lote", type=int, default=500, help="Sessões por tarefa enviada a um processo.")
+    args = parser.parse_args()
+
+    arquivos: List[str] = []
+    for caminho in args.caminhos:
+        if os.path.isdir(caminho):
+            arquivos.extend(arquivos_sessoes(caminho))
+        elif os.path.exists(caminho) or not args.texto:
+            arquivos.append(caminho)
+
+    def linhas() -> Iterator[str]:
+        for caminho in args.texto:
+            for sessao in importar_texto(caminho):
+                yield sessao.para_json()
+        for arquivo in arquivos:
+            yield from ler_sessoes(arquivo)
+
+    inicio = time.perf_counter()
+    sessoes, jogadas, divergencias = reproduzir_em_lote(linhas(), args.processos, args.lote)
+    duracao = time.perf_counter() - inicio
+
+    for sessao, divergencia in divergencias[:20]:
+        print(f"{sessao}: {divergencia}")
+    if len(divergencias) > 20:
+        print(f"... e mais {len(divergencias) - 20} divergências")
+    print(f"{sessoes} sessões, {jogadas} jogadas em {duracao:.2f}s ({jogadas / max(duracao, 1e-9):,.0f} jogadas/s), "
+          f"{len(divergencias)} divergências")
+    sys.exit(1 if divergencias else 0)
+
+
+if __name__ == "__main__":
+    main()
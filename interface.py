@@ -2,12 +2,64 @@ import pygame
 import sys
 import os
 import time
-from jogo import JogoJokenpo, itens
-from typing import Tuple, Dict
+from audio import TAMANHO_BUFFER_PADRAO, SistemaAudio, pre_inicializar
+from cliente_rede import DESCONECTADO, ClienteRede
+from estrategias import Estrategia
+from exportacao import ExportadorQuadros
+from gravacao import GravadorSessoes
+from jogo import JogoJokenpo, nomes_resultados, DERROTA, EMPATE, PONTOS_PARA_VENCER, REGRAS_PADRAO, VITORIA
+from perfil import PerfilQuadros
+from ranking import Ranking
+from recursos import GerenciadorRecursos
+from regras import ConjuntoRegras
+from registro import RegistroPartidas, nova_sessao
+from renderizacao import CacheTexto, RastreadorSujo, posicionar
+from rodada import ENCERRADA, ESCOLHA, EVENTO_FASE, FINAL, PONTUACAO, RANKING, REINICIO, RESULTADO, MaquinaRodada
+from servidor import ABANDONO, ERRO, INICIO, RODADA
+from widgets import EVENTOS_PONTEIRO, Botao, CamadaWidgets
+from typing import Callable, List, Optional, Tuple, Dict
+
+# Código de cada resultado, o inverso de `nomes_resultados`
+_codigos_resultado: Dict[str, int] = {nomes_resultados[codigo]: codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+
+# Evento que traz para o laço da tela uma mensagem recebida do servidor
+EVENTO_REDE: int = pygame.event.custom_type()
 
 class InterfaceJogo:
-    def __init__(self) -> None:
-        """Inicializa a interface do jogo Jokenpô."""
+    def __init__(self, fps_alvo: int = 60, retangulos_sujos: bool = True, recursos: Optional[GerenciadorRecursos] = None, duracoes_fases: Optional[Dict[str, float]] = None, ranking: Optional[Ranking] = None, registro: Optional[RegistroPartidas] = None, perfil: Optional[PerfilQuadros] = None, cliente: Optional[ClienteRede] = None, conjunto_regras: Optional[ConjuntoRegras] = None, estrategia: Optional[Estrategia] = None, buffer_audio: int = TAMANHO_BUFFER_PADRAO, gravador: Optional[GravadorSessoes] = None, tela: Optional[pygame.Surface] = None, exportador: Optional[ExportadorQuadros] = None) -> None:
+        """Inicializa a interface do jogo Jokenpô.
+
+        Parâmetros:
+            fps_alvo (int): A taxa máxima de quadros por segundo (0 para não limitar).
+            retangulos_sujos (bool): Se apenas as regiões alteradas devem ser enviadas à tela.
+            recursos (Optional[GerenciadorRecursos]): O carregador de imagens e sons.
+            duracoes_fases (Optional[Dict[str, float]]): Durações, em segundos, das fases da partida
+                (veja `rodada.DURACOES_PADRAO`); zero avança a fase imediatamente.
+            ranking (Optional[Ranking]): O banco do ranking (padrão: ranking.db, importando o ranking.txt antigo).
+            registro (Optional[RegistroPartidas]): Onde as jogadas são registradas (padrão: pasta registros).
+                Obrigatório com `tela`: as sessões sem janela do processo devem compartilhar um só registro.
+            perfil (Optional[PerfilQuadros]): Se informado, mede o tempo gasto em cada parte dos quadros.
+            cliente (Optional[ClienteRede]): Se informado, as partidas são jogadas contra outro jogador,
+                pelo servidor, em vez de contra o computador.
+            conjunto_regras (Optional[ConjuntoRegras]): Os itens e as regras do jogo (padrão: `REGRAS_PADRAO`);
+                os botões dos itens e a tela de regras são gerados a partir dele.
+            estrategia (Optional[Estrategia]): Como o computador escolhe as jogadas (padrão: ao acaso).
+            buffer_audio (int): O buffer do mixer, em amostras; menor é mais rápido, mas pode falhar em máquinas lentas.
+            gravador (Optional[GravadorSessoes]): Onde as partidas contra o computador são gravadas para
+                reprodução (padrão: pasta gravacoes).
+            tela (Optional[pygame.Surface]): Uma superfície de 800x600 onde desenhar, em vez de abrir
+                a janela; permite rodar várias sessões sem janela no mesmo processo. Nesse caso, quem
+                roda as sessões lê a fila de eventos uma vez e repassa os eventos aos métodos passo_*.
+            exportador (Optional[ExportadorQuadros]): Recebe a tela a cada quadro (veja exportacao.py).
+
+        Raises:
+            ValueError: Se `tela` é informada sem `registro`.
+        """
+        if tela is not None and registro is None:
+            # Cada registro tem a sua thread de escrita; vários na mesma pasta anexariam,
+            # trocariam e truncariam os mesmos arquivos ao mesmo tempo
+            raise ValueError("Sem janela, informe o registro de partidas, compartilhado pelas sessões do processo.")
+        pre_inicializar(buffer_audio)
         pygame.init()
         pygame.mixer.init()
         
@@ -22,54 +74,167 @@ class InterfaceJogo:
         self.AZUL = (0, 102, 204)
         self.CINZA = (169, 169, 169)
 
-        self.tela = pygame.display.set_mode((self.LARGURA_TELA, self.ALTURA_TELA))
-        pygame.display.set_caption("JOKENPÔ DO SHELDON")
+        self.janela = tela is None
+        if self.janela:
+            self.tela = pygame.display.set_mode((self.LARGURA_TELA, self.ALTURA_TELA))
+            pygame.display.set_caption("JOKENPÔ DO SHELDON")
+        else:
+            self.tela = tela
+        # Sem janela pode haver várias interfaces no processo, cada uma com o seu temporizador
+        self.evento_fase = EVENTO_FASE if self.janela else pygame.event.custom_type()
+        self.exportador = exportador
+        self._quadro_alterado = False
         self.fonte_grande = pygame.font.Font(None, 64)
         self.fonte_media = pygame.font.Font(None, 48)
         self.fonte_pequena = pygame.font.Font(None, 32)
-        self.jogo = JogoJokenpo()
+        self.cache_texto = CacheTexto()
+        self.fps_alvo = fps_alvo
+        self.retangulos_sujos = retangulos_sujos
+        self.relogio = pygame.time.Clock()
+        self.rastreador = RastreadorSujo(self.tela.get_rect())
+        self._redesenho_pendente = True
+        self.duracoes_fases = duracoes_fases
+        if ranking is None:
+            ranking = Ranking("ranking.db")
+            ranking.importar_texto("ranking.txt")
+        self.banco_ranking = ranking
+        self.registro = registro or RegistroPartidas("registros")
+        self.gravador = gravador or GravadorSessoes("gravacoes")
+        self.posicao_mouse: Tuple[int, int] = (-1, -1)
+        self.instante_eventos = time.perf_counter()
+        self.perfil = perfil
+        if perfil is not None:
+            perfil.instrumentar(self)
+        self.cliente = cliente
+        self.nome_oponente = "Computador"
+        # Aviso da última partida pela rede (regras diferentes, oponente que saiu, erro do servidor)
+        self.aviso: Optional[str] = None
+        if cliente is not None:
+            # Chamado na thread do cliente; o laço da tela recebe a mensagem como um evento
+            cliente.ao_receber = lambda mensagem: pygame.event.post(pygame.event.Event(EVENTO_REDE, mensagem=mensagem))
+        self.conjunto_regras = conjunto_regras or REGRAS_PADRAO
+        self.jogo = JogoJokenpo(estrategia, self.conjunto_regras)
+        self.botoes_itens = self.posicionar_botoes_itens()
+        self.camada_jogo = CamadaWidgets()
+        for item, x, y, largura, altura in self.botoes_itens:
+            self.camada_jogo.adicionar(self.criar_botao(item, x, y, largura, altura, self.VERDE, self.AZUL, lambda item=item: self.escolher_item(item)))
+        self.botao_menu_jogo = self.camada_jogo.adicionar(self.criar_botao_menu())
+        self.camada_regras = CamadaWidgets()
+        self.camada_regras.adicionar(self.criar_botao_menu())
+        self.camada_referencias = CamadaWidgets()
+        self.camada_referencias.adicionar(self.criar_botao_menu())
+        self.fonte_regras, self.espacamento_regras, self.linhas_regras = self.montar_texto_regras()
+        self.recursos = recursos or GerenciadorRecursos()
+        self.carregar_sons()
+        self.audio = SistemaAudio(self.recursos, buffer_audio)
         self.imagens = self.carregar_imagens()
-        self.sons = self.carregar_sons()
 
     def carregar_imagens(self) -> Dict[str, pygame.Surface]:
-        """Carrega e redimensiona as imagens dos itens do jogo.
+        """Carrega as imagens dos itens do jogo, já redimensionadas e convertidas para a tela.
 
         Retorna:
             Dict[str, pygame.Surface]: Dicionário contendo as imagens dos itens do jogo.
         """
         caminho_imagens = "imagens"
         imagens = {}
-        for item in itens:
-            imagens[item] = pygame.image.load(os.path.join(caminho_imagens, f"{item.lower()}.png"))
-            imagens[item] = pygame.transform.scale(imagens[item], (120, 120))
-        imagens["vitoria"] = pygame.transform.scale(pygame.image.load(os.path.join(caminho_imagens, "sheldon_feliz.png")), (200, 200))
-        imagens["derrota"] = pygame.transform.scale(pygame.image.load(os.path.join(caminho_imagens, "sheldon_decepcionado.png")), (200, 200))
+        for i, item in enumerate(self.conjunto_regras.nomes_itens):
+            if item in self.conjunto_regras.imagens:
+                imagens[item] = self.recursos.carregar_imagem(self.conjunto_regras.imagens[item], (120, 120))
+            else:
+                imagens[item] = self.criar_imagem_item(item, i)
+        imagens["vitoria"] = self.recursos.carregar_imagem(os.path.join(caminho_imagens, "sheldon_feliz.png"), (200, 200))
+        imagens["derrota"] = self.recursos.carregar_imagem(os.path.join(caminho_imagens, "sheldon_decepcionado.png"), (200, 200))
         return imagens
 
-    def carregar_sons(self) -> Dict[str, pygame.mixer.Sound]:
-        """Carrega os efeitos sonoros do jogo.
+    def criar_imagem_item(self, item: str, indice: int) -> pygame.Surface:
+        """Desenha uma imagem para um item sem arquivo de imagem: um círculo com o nome dele.
+
+        Parâmetros:
+            item (str): O nome do item.
+            indice (int): A posição do item no conjunto de regras, que define a cor.
+
+        Retorna:
+            pygame.Surface: A imagem de 120x120 pixels.
+        """
+        imagem = pygame.Surface((120, 120), pygame.SRCALPHA)
+        cor = pygame.Color(0)
+        cor.hsva = (indice * 360 / len(self.conjunto_regras), 60, 85, 100)
+        pygame.draw.circle(imagem, cor, (60, 60), 58)
+        texto = self.fonte_pequena.render(item, True, self.PRETO)
+        imagem.blit(texto, texto.get_rect(center=(60, 60)))
+        if pygame.display.get_surface() is None:
+            return imagem
+        return imagem.convert_alpha()
+
+    def posicionar_botoes_itens(self) -> List[Tuple[str, int, int, int, int]]:
+        """Distribui os botões dos itens em até cinco colunas, de baixo para cima.
+
+        Retorna:
+            List[Tuple[str, int, int, int, int]]: O item, x, y, largura e altura de cada botão.
+        """
+        nomes = self.conjunto_regras.nomes_itens
+        colunas = min(len(nomes), 5)
+        linhas = -(-len(nomes) // colunas)
+        passo_x = (self.LARGURA_TELA - 50) // colunas
+        altura = 50 if linhas == 1 else 32
+        passo_y = altura + 6
+        topo = 550 - linhas * passo_y + 6
+        return [(item, 50 + (i % colunas) * passo_x, topo + (i // colunas) * passo_y, passo_x - 10, altura) for i, item in enumerate(nomes)]
+
+    def montar_texto_regras(self) -> Tuple[pygame.font.Font, int, List[str]]:
+        """Quebra o texto das regras em linhas que cabem na tela, usando a maior fonte possível.
 
         Retorna:
-            Dict[str, pygame.mixer.Sound]: Dicionário contendo os sons utilizados no jogo.
+            Tuple[pygame.font.Font, int, List[str]]: A fonte, o espaçamento entre linhas e as linhas.
         """
-        return {
-            "vitoria": pygame.mixer.Sound("sons/vitoria.wav"),
-            "derrota": pygame.mixer.Sound("sons/derrota.wav"),
-            "empate": pygame.mixer.Sound("sons/empate.wav"),
-            "clique": pygame.mixer.Sound("sons/clique.wav"),
-        }
+        largura_maxima = self.LARGURA_TELA - 40
+        for fonte, espacamento in ((self.fonte_pequena, 30), (pygame.font.Font(None, 24), 22), (pygame.font.Font(None, 20), 18)):
+            linhas: List[str] = []
+            for linha in self.conjunto_regras.linhas_texto(PONTOS_PARA_VENCER):
+                atual = ""
+                for palavra in linha.split(" "):
+                    candidata = f"{atual} {palavra}" if atual else palavra
+                    if atual and fonte.size(candidata)[0] > largura_maxima:
+                        linhas.append(atual)
+                        candidata = palavra
+                    atual = candidata
+                linhas.append(atual)
+            if 120 + len(linhas) * espacamento <= self.ALTURA_TELA:
+                break
+        return fonte, espacamento, linhas
+
+    def carregar_sons(self) -> None:
+        """Começa a carregar os efeitos sonoros do jogo em segundo plano.
+
+        Os sons ficam disponíveis em `sons` assim que o carregamento termina.
+        """
+        self.recursos.carregar_sons_em_segundo_plano({
+            "vitoria": "sons/vitoria.wav",
+            "derrota": "sons/derrota.wav",
+            "empate": "sons/empate.wav",
+            "clique": "sons/clique.wav",
+        })
+
+    @property
+    def sons(self) -> Dict[str, pygame.mixer.Sound]:
+        """Os efeitos sonoros do jogo, indexados pelo nome."""
+        return self.recursos.sons()
 
-    def tocar_som(self, som: pygame.mixer.Sound) -> None:
-        """Reproduz um efeito sonoro específico.
+    def tocar_som(self, nome: str) -> None:
+        """Reproduz um efeito sonoro no canal reservado a ele (veja `audio`).
+
+        O tempo até o mixer é medido a partir da leitura dos eventos do quadro atual.
 
         Parâmetros:
-            som (pygame.mixer.Sound): O som a ser reproduzido.
+            nome (str): O nome do som em `sons`.
         """
-        som.play()
+        self.audio.tocar(nome, self.instante_eventos)
 
     def exibir_texto(self, texto: str, fonte: pygame.font.Font, cor: Tuple[int, int, int], x: int, y: int, alinhamento: str = 'centro') -> None:
         """Exibe um texto na tela com o alinhamento especificado.
 
+        O texto renderizado é reaproveitado de `cache_texto` sempre que possível.
+
         Parâmetros:
             texto (str): O texto a ser exibido.
             fonte (pygame.font.Font): A fonte a ser utilizada para o texto.
@@ -78,17 +243,102 @@ class InterfaceJogo:
             y (int): A posição y na tela.
             alinhamento (str): O alinhamento do texto ('centro', 'esquerda', 'direita').
         """
-        texto_renderizado: pygame.Surface = fonte.render(texto, True, cor)
-        if alinhamento == 'esquerda':
-            texto_rect = texto_renderizado.get_rect(midleft=(x, y))
-        elif alinhamento == 'direita':
-            texto_rect = texto_renderizado.get_rect(midright=(x, y))
-        else:
-            texto_rect = texto_renderizado.get_rect(center=(x, y))
+        texto_renderizado = self.cache_texto.obter(texto, fonte, cor, True)
+        texto_rect = posicionar(texto_renderizado, alinhamento, x, y)
         self.tela.blit(texto_renderizado, texto_rect)
+        self.rastreador.registrar(("texto", texto, fonte, cor, alinhamento, x, y), texto_rect)
+
+    def desenhar_imagem(self, nome: str, x: float, y: float) -> None:
+        """Desenha uma das imagens carregadas na posição indicada.
+
+        Parâmetros:
+            nome (str): A chave da imagem em `imagens`.
+            x (float): A posição x do canto superior esquerdo.
+            y (float): A posição y do canto superior esquerdo.
+        """
+        rect = self.tela.blit(self.imagens[nome], (x, y))
+        self.rastreador.registrar(("imagem", nome, x, y), rect)
+
+    def obter_eventos(self) -> List[pygame.event.Event]:
+        """Retira os eventos pendentes da fila, acompanhando a posição do mouse.
+
+        A posição vem dos eventos, e não de `pygame.mouse`, então entradas simuladas com
+        `pygame.event.post` funcionam mesmo sem janela; ela é usada para destacar o botão
+        sob o ponteiro ao entrar em uma tela.
+
+        Retorna:
+            List[pygame.event.Event]: Os eventos recebidos desde a última chamada.
+        """
+        eventos = pygame.event.get()
+        self.instante_eventos = time.perf_counter()
+        for evento in eventos:
+            if evento.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.posicao_mouse = evento.pos
+        return eventos
+
+    def invalidar_tela(self, camada: Optional[CamadaWidgets] = None) -> None:
+        """Força o redesenho completo no próximo quadro, usado ao trocar de tela.
+
+        Parâmetros:
+            camada (Optional[CamadaWidgets]): Os botões da tela que está sendo aberta,
+                destacados conforme a posição atual do mouse.
+        """
+        self.rastreador.invalidar()
+        self._redesenho_pendente = True
+        if camada is not None:
+            camada.apontar(self.posicao_mouse)
+
+    def precisa_redesenhar(self, eventos: List[pygame.event.Event], animando: bool = False, camada: Optional[CamadaWidgets] = None) -> bool:
+        """Indica se o quadro atual deve ser desenhado.
+
+        No modo ocioso, a tela só é redesenhada quando chega algum evento, quando há
+        uma animação em andamento, quando algum botão mudou de estado ou quando ela foi
+        invalidada. Os eventos do mouse sozinhos não contam: eles só mudam a tela por
+        meio dos botões, que já informam a mudança.
+
+        Parâmetros:
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+            animando (bool): Se o conteúdo da tela muda com o tempo, sem depender de eventos.
+            camada (Optional[CamadaWidgets]): Os botões da tela, já atualizados com os eventos.
+
+        Retorna:
+            bool: True se o quadro deve ser desenhado.
+        """
+        pendente = self._redesenho_pendente
+        self._redesenho_pendente = False
+        if camada is not None and camada.alterada:
+            return True
+        return pendente or animando or any(evento.type not in EVENTOS_PONTEIRO for evento in eventos)
+
+    def apresentar(self) -> None:
+        """Envia o quadro desenhado para a tela.
+
+        Com `retangulos_sujos`, apenas as regiões que mudaram desde o último quadro são
+        atualizadas; se nada mudou, a tela não é tocada. Sem janela, apenas anota se o
+        quadro mudou, para o exportador.
+        """
+        sujos = self.rastreador.concluir()
+        self._quadro_alterado = self._quadro_alterado or bool(sujos) or not self.retangulos_sujos
+        if not self.janela:
+            return
+        if not self.retangulos_sujos:
+            pygame.display.flip()
+        elif sujos:
+            pygame.display.update(sujos)
+
+    def exportar_quadro(self) -> None:
+        """Entrega a tela ao exportador, informando se ela mudou desde o quadro anterior."""
+        if self.exportador is not None:
+            self.exportador.exportar(self.tela, self._quadro_alterado)
+        self._quadro_alterado = False
 
-    def desenhar_botao(self, texto: str, x: int, y: int, largura: int, altura: int, cor_inativa: Tuple[int, int, int], cor_ativa: Tuple[int, int, int]) -> bool:
-        """Desenha um botão interativo na tela e gerencia sua interação.
+    def aguardar_quadro(self) -> None:
+        """Exporta o quadro, se houver exportador, e limita a taxa de quadros a `fps_alvo`."""
+        self.exportar_quadro()
+        self.relogio.tick(self.fps_alvo)
+
+    def criar_botao(self, texto: str, x: int, y: int, largura: int, altura: int, cor_inativa: Tuple[int, int, int], cor_ativa: Tuple[int, int, int], acao: Optional[Callable[[], None]] = None) -> Botao:
+        """Cria um botão no estilo do jogo, com o texto em `fonte_pequena`.
 
         Parâmetros:
             texto (str): O texto a ser exibido no botão.
@@ -98,70 +348,95 @@ class InterfaceJogo:
             altura (int): A altura do botão.
             cor_inativa (Tuple[int, int, int]): A cor do botão quando não está ativo.
             cor_ativa (Tuple[int, int, int]): A cor do botão quando está ativo.
+            acao (Optional[Callable[[], None]]): Chamada quando o botão é clicado.
 
         Retorna:
-            bool: True se o botão foi clicado, False caso contrário.
+            Botao: O botão, já renderizado.
         """
-        mouse = pygame.mouse.get_pos()
-        clique = pygame.mouse.get_pressed()[0]
-        
-        if x < mouse[0] < x + largura and y < mouse[1] < y + altura:
-            pygame.draw.rect(self.tela, cor_ativa, (x, y, largura, altura), border_radius=15)
-            if clique:
-                self.tocar_som(self.sons["clique"])
-                return True
-        else:
-            pygame.draw.rect(self.tela, cor_inativa, (x, y, largura, altura), border_radius=15)
-        
-        self.exibir_texto(texto, self.fonte_pequena, self.BRANCO, x + largura/2, y + altura/2)
-        return False
+        return Botao(texto, pygame.Rect(x, y, largura, altura), self.fonte_pequena, cor_inativa, cor_ativa, self.BRANCO, acao)
+
+    def criar_botao_menu(self) -> Botao:
+        """Cria o botão de voltar ao menu, no canto superior esquerdo das telas."""
+        return self.criar_botao("Menu", 20, 20, 80, 30, self.AZUL, (100, 150, 255))
+
+    def tratar_cliques(self, camada: CamadaWidgets, eventos: List[pygame.event.Event]) -> List[Botao]:
+        """Repassa os eventos aos botões de uma tela e executa as ações dos botões clicados.
 
-    def inicializar_jogo(self) -> Tuple[str, str, str, bool, float, bool, int]:
-        """Inicializa as variáveis do jogo.
+        Cada clique toca o som de clique uma única vez, ao soltar o botão do mouse.
+
+        Parâmetros:
+            camada (CamadaWidgets): Os botões da tela.
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
 
         Retorna:
-            Tuple[str, str, str, bool, float, bool, int]: Variáveis iniciais do jogo.
-        """
-        escolha_jogador = None
-        escolha_computador = None
-        resultado = None
-        mostrando_resultado = False
-        tempo_espera = 0
-        pontuacao_atualizada = False
-        jogada_numero = 1
-        return escolha_jogador, escolha_computador, resultado, mostrando_resultado, tempo_espera, pontuacao_atualizada, jogada_numero
-
-    def exibir_escolhas(self, escolha_jogador: str, escolha_computador: str, tempo_espera: float) -> None:
+            List[Botao]: Os botões clicados.
+        """
+        clicados = camada.tratar_eventos(eventos)
+        for botao in clicados:
+            self.tocar_som("clique")
+            if botao.acao is not None:
+                botao.acao()
+        return clicados
+
+    def desenhar_widgets(self, camada: CamadaWidgets) -> None:
+        """Desenha os botões de uma tela.
+
+        Parâmetros:
+            camada (CamadaWidgets): Os botões da tela.
+        """
+        camada.desenhar(self.tela, self.rastreador)
+
+    def exibir_escolhas(self, escolha_jogador: str, escolha_computador: Optional[str]) -> None:
         """Exibe as escolhas do jogador e do computador na tela.
 
         Parâmetros:
             escolha_jogador (str): A escolha do jogador.
-            escolha_computador (str): A escolha do computador.
-            tempo_espera (float): O tempo de espera para exibir as escolhas.
+            escolha_computador (Optional[str]): A escolha do computador, ou None se ainda não foi revelada.
         """
         self.exibir_texto("Sua escolha:", self.fonte_pequena, self.PRETO, self.LARGURA_TELA/4, 200)
-        self.tela.blit(self.imagens[escolha_jogador], (self.LARGURA_TELA/4 - 60, 230))
+        self.desenhar_imagem(escolha_jogador, self.LARGURA_TELA/4 - 60, 230)
         
-        if escolha_computador and time.time() - tempo_espera > 1:
-            self.exibir_texto("Escolha do computador:", self.fonte_pequena, self.PRETO, 3*self.LARGURA_TELA/4, 200)
-            self.tela.blit(self.imagens[escolha_computador], (3*self.LARGURA_TELA/4 - 60, 230))
+        if escolha_computador:
+            rotulo = "Escolha do computador:" if self.cliente is None else f"Escolha de {self.nome_oponente}:"
+            self.exibir_texto(rotulo, self.fonte_pequena, self.PRETO, 3*self.LARGURA_TELA/4, 200)
+            self.desenhar_imagem(escolha_computador, 3*self.LARGURA_TELA/4 - 60, 230)
 
-    def exibir_resultado(self, resultado: str, tempo_espera: float) -> None:
+    def exibir_resultado(self, resultado: Optional[str]) -> None:
         """Exibe o resultado da jogada na tela.
 
         Parâmetros:
-            resultado (str): O resultado da jogada.
-            tempo_espera (float): O tempo de espera para exibir o resultado.
+            resultado (Optional[str]): O resultado da jogada, ou None se ainda não foi revelado.
         """
-        if resultado and time.time() - tempo_espera > 2:
+        if resultado:
             cor_resultado = self.VERMELHO if resultado == "Derrota" else self.VERDE
             self.exibir_texto(resultado, self.fonte_media, cor_resultado, self.LARGURA_TELA/2, 420)
 
-    def atualizar_pontuacao(self, arquivo, jogada_numero: int, escolha_jogador: str, escolha_computador: str, resultado: str) -> int:
-        """Atualiza a pontuação e salva a jogada no arquivo.
+    def desenhar_tabuleiro(self, escolha_jogador: Optional[str], escolha_computador: Optional[str], resultado: Optional[str]) -> None:
+        """Desenha o título, o placar e a jogada em andamento na tela do jogo.
+
+        Parâmetros:
+            escolha_jogador (Optional[str]): A escolha do jogador, ou None se ainda não escolheu.
+            escolha_computador (Optional[str]): A escolha do computador, se já revelada.
+            resultado (Optional[str]): O resultado da jogada, se já revelado.
+        """
+        self.tela.fill(self.FUNDO)
+
+        self.exibir_texto("JOKENPÔ DO SHELDON", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
+        self.exibir_texto(f"Você: {self.jogo.pontos_usuario}", self.fonte_media, self.VERDE, 150, 120, 'esquerda')
+        self.exibir_texto(f"{self.nome_oponente}: {self.jogo.pontos_computador}", self.fonte_media, self.VERMELHO, self.LARGURA_TELA - 150, 120, 'direita')
+
+        if escolha_jogador:
+            self.exibir_escolhas(escolha_jogador, escolha_computador)
+            self.exibir_resultado(resultado)
+
+    def atualizar_pontuacao(self, jogada_numero: int, escolha_jogador: str, escolha_computador: str, resultado: str) -> int:
+        """Registra a jogada e a pontuação resultante no registro de partidas.
+
+        A jogada só é enfileirada; a escrita no disco acontece na thread do registro. Com um
+        conjunto de regras que não veio de `carregar_regras`, nada é registrado, pois os
+        índices dos itens não poderiam ser lidos de volta.
 
         Parâmetros:
-            arquivo: O arquivo onde as jogadas são registradas.
             jogada_numero (int): O número da jogada.
             escolha_jogador (str): A escolha do jogador.
             escolha_computador (str): A escolha do computador.
@@ -170,20 +445,20 @@ class InterfaceJogo:
         Retorna:
             int: O número da próxima jogada.
         """
-        arquivo.write(f"Jogada {jogada_numero}: {escolha_jogador} vs {escolha_computador} - {resultado} | Pontos: Você {self.jogo.pontos_usuario}, Computador {self.jogo.pontos_computador}\n")
+        if self.conjunto_regras.origem is not None:
+            self.registro.registrar(self.sessao, jogada_numero, self.conjunto_regras.indice[escolha_jogador], self.conjunto_regras.indice[escolha_computador],
+                                    _codigos_resultado[resultado], self.jogo.pontos_usuario, self.jogo.pontos_computador)
         return jogada_numero + 1
 
     def solicitar_nome_jogador(self) -> str:
         """Solicita o nome do jogador e retorna-o."""
         nome = ""
         digitando = True
+        self.invalidar_tela()
         while digitando:
-            self.tela.fill(self.FUNDO)
-            self.exibir_texto("Digite seu nome:", self.fonte_media, self.AZUL, self.LARGURA_TELA/2, self.ALTURA_TELA/2 - 50)
-            self.exibir_texto(nome, self.fonte_media, self.PRETO, self.LARGURA_TELA/2, self.ALTURA_TELA/2)
-            pygame.display.flip()
-            
-            for evento in pygame.event.get():
+            eventos = self.obter_eventos()
+            # Os eventos são aplicados antes do desenho, para a tecla aparecer no mesmo quadro
+            for evento in eventos:
                 if evento.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -195,187 +470,344 @@ class InterfaceJogo:
                         nome = nome[:-1]
                     else:
                         nome += evento.unicode
+
+            if self.precisa_redesenhar(eventos):
+                self.tela.fill(self.FUNDO)
+                self.exibir_texto("Digite seu nome:", self.fonte_media, self.AZUL, self.LARGURA_TELA/2, self.ALTURA_TELA/2 - 50)
+                self.exibir_texto(nome, self.fonte_media, self.PRETO, self.LARGURA_TELA/2, self.ALTURA_TELA/2)
+                self.apresentar()
+            self.aguardar_quadro()
         return nome
 
     def salvar_ranking(self, nome: str, pontos: int) -> None:
-        """Salva a pontuação do jogador no arquivo de ranking."""
-        with open("ranking.txt", "a") as arquivo:
-            arquivo.write(f"{nome}: {pontos}\n")
+        """Salva a pontuação do jogador no ranking."""
+        self.banco_ranking.inserir(nome, pontos)
+
+    def carregar_ranking(self) -> Optional[List[Tuple[str, int]]]:
+        """Lê as maiores pontuações do ranking, quantas couberem na tela.
+
+        Retorna:
+            Optional[List[Tuple[str, int]]]: Pares (nome, pontos), ou None se não há ranking.
+        """
+        return self.banco_ranking.topo((self.ALTURA_TELA - 120) // 30) or None
 
     def exibir_ranking(self) -> None:
-        """Exibe o ranking dos jogadores em ordem decrescente de pontuação."""
+        """Desenha o ranking lido por `carregar_ranking` ao entrar na fase de ranking."""
         self.tela.fill(self.FUNDO)
         self.exibir_texto("RANKING", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
         
-        try:
-            with open("ranking.txt", "r") as arquivo:
-                ranking = []
-                for linha in arquivo:
-                    nome, pontos = linha.strip().split(": ")
-                    ranking.append((nome, int(pontos)))  # Armazena como tupla (nome, pontos)
-
-                # Classifica o ranking em ordem decrescente de pontos
-                ranking.sort(key=lambda x: x[1], reverse=True)
-
-                # Exibe o ranking
-                for i, (nome, pontos) in enumerate(ranking):
-                    self.exibir_texto(f"{i + 1}º: {nome} - {pontos} pontos", self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 120 + i*30)
-        except FileNotFoundError:
+        if self.ranking is None:
             self.exibir_texto("Nenhum ranking disponível.", self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 120)
-        
-        pygame.display.flip()
-        time.sleep(5)  # Exibe o ranking por 5 segundos
+            return
+
+        for i, (nome, pontos) in enumerate(self.ranking):
+            self.exibir_texto(f"{i + 1}º: {nome} - {pontos} pontos", self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 120 + i*30)
+
+    def iniciar_partida(self, nome_jogador: str) -> None:
+        """Prepara uma nova partida, com a máquina de estados na fase de escolha.
+
+        Parâmetros:
+            nome_jogador (str): O nome do jogador, usado no ranking.
+        """
+        self.nome_jogador = nome_jogador
+        self.sessao = nova_sessao()
+        self.maquina = MaquinaRodada(self.duracoes_fases, self.evento_fase)
+        self.escolha_jogador: Optional[str] = None
+        self.escolha_computador: Optional[str] = None
+        self.resultado: Optional[str] = None
+        self.jogada_numero = 1
+        self.ranking: Optional[List[Tuple[str, int]]] = None
+        self.aguardando_oponente = self.cliente is not None
+        self.aviso = None
+        if self.jogo.estrategia is not None:
+            self.jogo.estrategia.reiniciar()
+        if self.conjunto_regras.origem is not None:
+            self.registro.iniciar_sessao(self.sessao, self.conjunto_regras)
+        if self.cliente is not None:
+            self.cliente.entrar(nome_jogador)
+        else:
+            # Uma semente nova por partida, gravada para que a partida possa ser reproduzida
+            semente = int.from_bytes(os.urandom(8), "little")
+            self.jogo.semear(semente)
+            if self.conjunto_regras.origem is not None:
+                self.gravador.iniciar(self.sessao, semente, self.conjunto_regras, self.jogo.estrategia)
+
+    def escolher_item(self, item: str) -> None:
+        """Registra a escolha do jogador, se a partida estiver aguardando uma.
+
+        Parâmetros:
+            item (str): O item escolhido pelo jogador.
+        """
+        if self.maquina.fase != ESCOLHA:
+            return
+        if self.cliente is not None:
+            # A rodada só avança quando o servidor devolver as duas jogadas
+            if not self.aguardando_oponente and self.escolha_jogador is None:
+                self.escolha_jogador = item
+                self.cliente.jogar(item)
+            return
+        self.escolha_jogador = item
+        self.escolha_computador, self.resultado = self.jogo.escolher_jogada(item)
+        self.gravador.registrar(self.conjunto_regras.indice[item], self.conjunto_regras.indice[self.escolha_computador],
+                                _codigos_resultado[self.resultado], self.jogo.pontos_usuario, self.jogo.pontos_computador)
+        self.avancar_fase()
+
+    def tratar_mensagem(self, mensagem: dict) -> None:
+        """Aplica à partida uma mensagem recebida do servidor.
+
+        O placar vem sempre do servidor; a máquina de estados só cuida da apresentação.
+        Avisos do servidor ficam em `aviso`, mostrado na tela do jogo e no menu.
+
+        Parâmetros:
+            mensagem (dict): A mensagem do protocolo (veja `servidor`).
+        """
+        tipo = mensagem.get("tipo")
+        if tipo == INICIO and mensagem.get("itens", list(self.conjunto_regras.nomes_itens)) != list(self.conjunto_regras.nomes_itens):
+            # As jogadas enviadas pelo servidor seriam de itens que esta interface não conhece
+            self.aviso = f"O servidor usa as regras {mensagem.get('regras')!r}, e não {self.conjunto_regras.nome!r}."
+            self.cliente.sair()
+            self.maquina.cancelar()
+            self.maquina.entrar(ENCERRADA)
+        elif tipo == INICIO:
+            self.nome_oponente = mensagem["oponente"]
+            self.aguardando_oponente = False
+            self.jogo.pontos_usuario = self.jogo.pontos_computador = 0
+        elif tipo == RODADA and self.maquina.fase == ESCOLHA:
+            self.escolha_jogador = mensagem["jogada"]
+            self.escolha_computador = mensagem["oponente"]
+            self.resultado = mensagem["resultado"]
+            self.jogo.pontos_usuario = mensagem["pontos"]
+            self.jogo.pontos_computador = mensagem["pontos_oponente"]
+            self.avancar_fase()
+        elif tipo in (ABANDONO, DESCONECTADO) and self.maquina.fase not in (FINAL, RANKING, ENCERRADA):
+            self.aviso = "O oponente saiu da partida." if tipo == ABANDONO else "Conexão com o servidor perdida."
+            self.maquina.cancelar()
+            self.maquina.entrar(ENCERRADA)
+            self.jogo.zerar_pontos()
+        elif tipo == ERRO:
+            self.aviso = f"Servidor: {mensagem.get('mensagem')}"
+
+    def avancar_fase(self) -> None:
+        """Passa para a próxima fase da partida, executando as ações de entrada de cada uma.
+
+        Fases com duração zero são atravessadas imediatamente, então a partida pode ser
+        jogada sem nenhuma espera.
+        """
+        while True:
+            fim_de_jogo = self.jogo.pontos_usuario >= PONTOS_PARA_VENCER or self.jogo.pontos_computador >= PONTOS_PARA_VENCER
+            fase = self.maquina.proxima_fase(fim_de_jogo)
+            duracao = self.maquina.entrar(fase)
+            if fase == ESCOLHA:
+                self.escolha_jogador = None
+                self.escolha_computador = None
+                self.resultado = None
+            elif fase == PONTUACAO:
+                if self.resultado == "Vitória":
+                    self.tocar_som("vitoria")
+                elif self.resultado == "Derrota":
+                    self.tocar_som("derrota")
+                else:
+                    self.tocar_som("empate")
+            elif fase == REINICIO:
+                self.jogada_numero = self.atualizar_pontuacao(self.jogada_numero, self.escolha_jogador, self.escolha_computador, self.resultado)
+            elif fase == RANKING:
+                self.salvar_ranking(self.nome_jogador, self.jogo.pontos_usuario)
+                self.ranking = self.carregar_ranking()
+            elif fase == ENCERRADA:
+                self.gravador.concluir()
+                self.jogo.zerar_pontos()  # Zera o placar após o resultado final
+            if fase in (ESCOLHA, ENCERRADA) or duracao:
+                return
+
+    def desenhar_jogo(self) -> None:
+        """Desenha um quadro da partida conforme a fase atual."""
+        fase = self.maquina.fase
+        if fase == FINAL:
+            self.mostrar_resultado_final()
+            return
+        if fase == RANKING:
+            self.exibir_ranking()
+            return
+
+        revelada = fase in (RESULTADO, PONTUACAO, REINICIO)
+        self.desenhar_tabuleiro(
+            self.escolha_jogador,
+            self.escolha_computador if revelada else None,
+            self.resultado if fase in (PONTUACAO, REINICIO) else None,
+        )
+        if self.aguardando_oponente:
+            self.exibir_texto("Aguardando um oponente...", self.fonte_pequena, self.CINZA, self.LARGURA_TELA/2, 420)
+        elif self.cliente is not None and fase == ESCOLHA and self.escolha_jogador:
+            self.exibir_texto(f"Aguardando a jogada de {self.nome_oponente}...", self.fonte_pequena, self.CINZA, self.LARGURA_TELA/2, 420)
+        if self.aviso:
+            self.exibir_texto(self.aviso, self.fonte_pequena, self.VERMELHO, self.LARGURA_TELA/2, 165)
+
+        self.desenhar_widgets(self.camada_jogo)
+
+    def passo_jogo(self, eventos: List[pygame.event.Event]) -> bool:
+        """Trata os eventos de um quadro da partida e redesenha a tela, se preciso.
+
+        Parâmetros:
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+
+        Retorna:
+            bool: True se a partida terminou ou o jogador voltou ao menu.
+        """
+        for evento in eventos:
+            if self.maquina.terminou(evento):
+                self.avancar_fase()
+            elif evento.type == EVENTO_REDE:
+                self.tratar_mensagem(evento.mensagem)
+
+        # Os botões só aparecem no tabuleiro, e não nas telas de resultado final e de ranking
+        self.camada_jogo.mostrar(self.maquina.fase not in (FINAL, RANKING))
+        if self.botao_menu_jogo in self.tratar_cliques(self.camada_jogo, eventos):
+            self.maquina.cancelar()
+            self.gravador.concluir()
+            if self.cliente is not None:
+                self.cliente.sair()
+                self.jogo.zerar_pontos()
+            return True
+
+        if self.maquina.fase == ENCERRADA:
+            return True
+
+        if self.precisa_redesenhar(eventos, camada=self.camada_jogo):
+            self.desenhar_jogo()
+            self.apresentar()
+        return False
 
     def jogar(self) -> None:
-        """Função principal do jogo, gerencia a lógica e a interação do jogador."""
+        """Função principal do jogo, gerencia a lógica e a interação do jogador.
+
+        As pausas entre as fases da partida são eventos do temporizador tratados pela
+        `MaquinaRodada`, então a janela continua respondendo durante toda a partida.
+        """
         nome_jogador = self.solicitar_nome_jogador()
-        escolha_jogador, escolha_computador, resultado, mostrando_resultado, tempo_espera, pontuacao_atualizada, jogada_numero = self.inicializar_jogo()
-
-        # Abre o arquivo para registrar as jogadas em modo de escrita (limpa o conteúdo anterior)
-        with open("jogadas.txt", "w") as arquivo:
-            while True:
-                for evento in pygame.event.get():
-                    if evento.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-                
-                self.tela.fill(self.FUNDO)
-                
-                self.exibir_texto("JOKENPÔ DO SHELDON", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
-                self.exibir_texto(f"Você: {self.jogo.pontos_usuario}", self.fonte_media, self.VERDE, 150, 120, 'esquerda')
-                self.exibir_texto(f"Computador: {self.jogo.pontos_computador}", self.fonte_media, self.VERMELHO, self.LARGURA_TELA - 150, 120, 'direita')
-                
-                if escolha_jogador:
-                    self.exibir_escolhas(escolha_jogador, escolha_computador, tempo_espera)
-                    self.exibir_resultado(resultado, tempo_espera)
-                    
-                    if resultado and time.time() - tempo_espera > 2:
-                        if not mostrando_resultado:
-                            mostrando_resultado = True
-                            if resultado == "Vitória":
-                                self.tocar_som(self.sons["vitoria"])
-                            elif resultado == "Derrota":
-                                self.tocar_som(self.sons["derrota"])
-                            else:
-                                self.tocar_som(self.sons["empate"])
-                        if not pontuacao_atualizada and time.time() - tempo_espera > 3:
-                            pontuacao_atualizada = True
-                            jogada_numero = self.atualizar_pontuacao(arquivo, jogada_numero, escolha_jogador, escolha_computador, resultado)
-                
-                for i, item in enumerate(itens):
-                    if self.desenhar_botao(item, 50 + i*150, 500, 140, 50, self.VERDE, self.AZUL) and not escolha_jogador:
-                        escolha_jogador = item
-                        escolha_computador, resultado = self.jogo.escolher_jogada(escolha_jogador)
-                        tempo_espera = time.time()
-                        mostrando_resultado = False
-                        pontuacao_atualizada = False
-                
-                if self.desenhar_botao("Menu", 20, 20, 80, 30, self.AZUL, (100, 150, 255)):
-                    return
-                
-                if mostrando_resultado and time.time() - tempo_espera > 4:
-                    if self.jogo.pontos_usuario >= 10 or self.jogo.pontos_computador >= 10:
-                        self.mostrar_resultado_final()
-                        self.salvar_ranking(nome_jogador, self.jogo.pontos_usuario)
-                        self.exibir_ranking()
-                        self.jogo.zerar_pontos()  # Zera o placar após o resultado final
-                        return
-                    escolha_jogador = None
-                    escolha_computador = None
-                    resultado = None
-                    mostrando_resultado = False
-                
-                pygame.display.flip()
-                pygame.time.delay(50)  # Adiciona um pequeno atraso para controlar a taxa de atualização
+        self.iniciar_partida(nome_jogador)
+        self.invalidar_tela(self.camada_jogo)
+        while True:
+            eventos = self.obter_eventos()
+            for evento in eventos:
+                if evento.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+
+            if self.passo_jogo(eventos):
+                return
+            self.aguardar_quadro()
 
     def mostrar_resultado_final(self) -> None:
-        """Exibe o resultado final do jogo e aguarda um tempo antes de retornar ao menu.
+        """Desenha o resultado final do jogo.
 
         Esta função mostra se o jogador ganhou ou perdeu e exibe a imagem correspondente.
         """
         self.tela.fill(self.FUNDO)
-        if self.jogo.pontos_usuario >= 10:
-            self.tela.blit(self.imagens["vitoria"], (self.LARGURA_TELA/2 - 100, 100))
+        if self.jogo.pontos_usuario >= PONTOS_PARA_VENCER:
+            self.desenhar_imagem("vitoria", self.LARGURA_TELA/2 - 100, 100)
             self.exibir_texto("Parabéns, você ganhou!", self.fonte_grande, self.VERDE, self.LARGURA_TELA/2, 350)
         else:
-            self.tela.blit(self.imagens["derrota"], (self.LARGURA_TELA/2 - 100, 100))
+            self.desenhar_imagem("derrota", self.LARGURA_TELA/2 - 100, 100)
             self.exibir_texto("Decepcionante... Você perdeu!", self.fonte_grande, self.VERMELHO, self.LARGURA_TELA/2, 350)
-        
-        pygame.display.flip()
-        time.sleep(5)  # Mostra a tela de resultado por 5 segundos
+
+    def desenhar_regras(self) -> None:
+        """Desenha um quadro da tela de regras."""
+        self.tela.fill(self.FUNDO)
+        self.exibir_texto("REGRAS", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
+
+        for i, regra in enumerate(self.linhas_regras):
+            self.exibir_texto(regra, self.fonte_regras, self.PRETO, self.LARGURA_TELA/2, 120 + i*self.espacamento_regras)
+
+        self.desenhar_widgets(self.camada_regras)
+
+    def passo_regras(self, eventos: List[pygame.event.Event]) -> bool:
+        """Trata os eventos de um quadro da tela de regras e a redesenha, se preciso.
+
+        Parâmetros:
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+
+        Retorna:
+            bool: True se o botão de voltar ao menu foi clicado.
+        """
+        if self.tratar_cliques(self.camada_regras, eventos):
+            return True
+        if self.precisa_redesenhar(eventos, camada=self.camada_regras):
+            self.desenhar_regras()
+            self.apresentar()
+        return False
 
     def regras(self) -> None:
         """Exibe as regras do jogo em uma tela separada.
 
         Esta função apresenta as regras do jogo e aguarda a interação do usuário para retornar ao menu.
         """
+        self.invalidar_tela(self.camada_regras)
         while True:
-            for evento in pygame.event.get():
+            eventos = self.obter_eventos()
+            for evento in eventos:
                 if evento.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
             
-            self.tela.fill(self.FUNDO)
-            self.exibir_texto("REGRAS", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
-            
-            regras_texto: list[str] = [
-                "Pedra vence Tesoura e Lagarto",
-                "Papel vence Pedra e Spock",
-                "Tesoura vence Papel e Lagarto",
-                "Lagarto vence Papel e Spock",
-                "Spock vence Pedra e Tesoura",
-                "",
-                "Pesos dos itens:",
-                "Papel: 1, Tesoura: 2, Pedra: 3, Lagarto: 4, Spock: 5",
-                "",
-                "Ao vencer, você ganha pontos iguais ao peso do seu item",
-                "e o oponente perde pontos iguais ao peso do item dele.",
-                "",
-                "O jogo termina quando um jogador atinge 10 pontos.",
-            ]
-            
-            for i, regra in enumerate(regras_texto):
-                self.exibir_texto(regra, self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 120 + i*30)
-            
-            if self.desenhar_botao("Menu", 20, 20, 80, 30, self.AZUL, (100, 150, 255)):
+            if self.passo_regras(eventos):
                 return
-            
-            pygame.display.flip()
+            self.aguardar_quadro()
+
+    def desenhar_referencias(self) -> None:
+        """Desenha um quadro da tela de referências."""
+        self.tela.fill(self.FUNDO)
+        self.exibir_texto("REFERÊNCIAS", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
+
+        referencias_texto: list[str] = [
+            "Este jogo é baseado na versão de Pedra, Papel,",
+            "Tesoura, Lagarto, Spock criada por Sam Kass e",
+            "Karen Bryla, popularizada por Sheldon Cooper",
+            "na série de TV 'The Big Bang Theory'.",
+            "",
+            "Desenvolvido por: Eduardo Vinícius e Lucas Fernando",
+        ]
+
+        for i, referencia in enumerate(referencias_texto):
+            self.exibir_texto(referencia, self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 150 + i*35)
+
+        self.desenhar_widgets(self.camada_referencias)
+
+    def passo_referencias(self, eventos: List[pygame.event.Event]) -> bool:
+        """Trata os eventos de um quadro da tela de referências e a redesenha, se preciso.
+
+        Parâmetros:
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+
+        Retorna:
+            bool: True se o botão de voltar ao menu foi clicado.
+        """
+        if self.tratar_cliques(self.camada_referencias, eventos):
+            return True
+        if self.precisa_redesenhar(eventos, camada=self.camada_referencias):
+            self.desenhar_referencias()
+            self.apresentar()
+        return False
 
     def referencias(self) -> None:
         """Exibe as referências do jogo em uma tela separada.
 
         Esta função apresenta informações sobre a origem do jogo e aguarda a interação do usuário para retornar ao menu.
         """
+        self.invalidar_tela(self.camada_referencias)
         while True:
-            for evento in pygame.event.get():
+            eventos = self.obter_eventos()
+            for evento in eventos:
                 if evento.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
             
-            self.tela.fill(self.FUNDO)
-            self.exibir_texto("REFERÊNCIAS", self.fonte_grande, self.AZUL, self.LARGURA_TELA/2, 50)
-            
-            referencias_texto: list[str] = [
-                "Este jogo é baseado na versão de Pedra, Papel,",
-                "Tesoura, Lagarto, Spock criada por Sam Kass e",
-                "Karen Bryla, popularizada por Sheldon Cooper",
-                "na série de TV 'The Big Bang Theory'.",
-                "",
-                "Desenvolvido por: Eduardo Vinícius e Lucas Fernando",
-            ]
-            
-            for i, referencia in enumerate(referencias_texto):
-                self.exibir_texto(referencia, self.fonte_pequena, self.PRETO, self.LARGURA_TELA/2, 150 + i*35)
-            
-            if self.desenhar_botao("Menu", 20, 20, 80, 30, self.AZUL, (100, 150, 255)):
+            if self.passo_referencias(eventos):
                 return
-            
-            pygame.display.flip()
+            self.aguardar_quadro()
 
     def zerar_pontos(self) -> None:
         """Zera a pontuação do jogador e do computador.
 
         Esta função é chamada para reiniciar a pontuação durante o jogo.
         """
-        self.jogo.zerar_pontos()
\ No newline at end of file
+        self.jogo.zerar_pontos()
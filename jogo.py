@@ -1,66 +1,125 @@
-import random
-from typing import Tuple, Dict
-
-# Lista de itens do jogo com seus respectivos pesos
-itens: Dict[str, int] = {
-    "Papel": 1,
-    "Tesoura": 2,
-    "Pedra": 3,
-    "Lagarto": 4,
-    "Spock": 5
-}
-
-class JogoJokenpo:
-    def __init__(self) -> None:
-        """Inicializa o jogo Jokenpô, configurando a pontuação inicial."""
-        self.pontos_usuario: int = 0
-        self.pontos_computador: int = 0
-
-    def escolher_jogada(self, escolha_jogador: str) -> Tuple[str, str]:
-        """Determina a jogada do computador e o resultado da partida.
-
-        Parâmetros:
-            escolha_jogador (str): A escolha do jogador.
-
-        Retorna:
-            Tuple[str, str]: A escolha do computador e o resultado da partida.
-        """
-        escolha_computador = random.choice(list(itens.keys()))
-        resultado = self.determinar_vencedor(escolha_jogador, escolha_computador)
-        return escolha_computador, resultado
-
-    def determinar_vencedor(self, escolha_jogador: str, escolha_computador: str) -> str:
-        """Determina o vencedor da partida.
-
-        Parâmetros:
-            escolha_jogador (str): A escolha do jogador.
-            escolha_computador (str): A escolha do computador.
-
-        Retorna:
-            str: O resultado da partida ("Vitória", "Derrota" ou "Empate").
-        """
-        if escolha_jogador == escolha_computador:
-            return "Empate"
-
-        vitorias = {
-            "Pedra": ["Tesoura", "Lagarto"],
-            "Papel": ["Pedra", "Spock"],
-            "Tesoura": ["Papel", "Lagarto"],
-            "Lagarto": ["Papel", "Spock"],
-            "Spock": ["Pedra", "Tesoura"]
-        }
-
-        if escolha_computador in vitorias[escolha_jogador]:
-            self.pontos_usuario += itens[escolha_jogador]
-            self.pontos_computador = max(0, self.pontos_computador - itens[escolha_computador])
-            return "Vitória"
-        else:
-            self.pontos_usuario = max(0, self.pontos_usuario - itens[escolha_jogador])
-            self.pontos_computador += itens[escolha_computador]
-            return "Derrota"
-
-    def zerar_pontos(self) -> None:
-        """Zera a pontuação do jogador e do computador."""
-        self.pontos_usuario = 0
-        self.pontos_computador = 0
-        print("Placar zerado!")
\ No newline at end of file
+import random
+from typing import TYPE_CHECKING, Tuple, Dict, List, Optional
+
+import numpy as np
+
+from regras import DERROTA, EMPATE, VITORIA, ConjuntoRegras, carregar_regras
+
+if TYPE_CHECKING:
+    from estrategias import Estrategia
+
+# Conjunto de regras usado quando nenhum outro é informado (veja regras.py e a pasta conjuntos)
+REGRAS_PADRAO: ConjuntoRegras = carregar_regras("sheldon")
+
+# Lista de itens do jogo com seus respectivos pesos
+itens: Dict[str, int] = REGRAS_PADRAO.pesos_itens
+
+# Itens que cada item derrota
+vitorias: Dict[str, List[str]] = REGRAS_PADRAO.vitorias
+
+# Pontuação que encerra a partida
+PONTOS_PARA_VENCER: int = 10
+
+# Indexado pelo código de resultado (DERROTA = -1 cai no último elemento)
+nomes_resultados: Tuple[str, str, str] = ("Empate", "Vitória", "Derrota")
+
+# Codificação dos itens como inteiros pequenos, na ordem de `itens`
+nomes_itens: Tuple[str, ...] = REGRAS_PADRAO.nomes_itens
+indice_itens: Dict[str, int] = REGRAS_PADRAO.indice
+
+# Resultado e variação de pontos do jogador e do computador, indexados por [jogador, computador]
+TABELA_RESULTADOS: np.ndarray = REGRAS_PADRAO.resultados
+TABELA_DELTA_USUARIO: np.ndarray = REGRAS_PADRAO.delta_usuario
+TABELA_DELTA_COMPUTADOR: np.ndarray = REGRAS_PADRAO.delta_computador
+
+
+class JogoJokenpo:
+    def __init__(self, estrategia: Optional["Estrategia"] = None, regras: Optional[ConjuntoRegras] = None, rng: Optional[random.Random] = None, semente: Optional[int] = None) -> None:
+        """Inicializa o jogo Jokenpô, configurando a pontuação inicial.
+
+        Todas as escolhas do computador vêm de `rng`, então a mesma semente e as mesmas
+        jogadas do usuário reproduzem a partida (veja gravacao.py).
+
+        Parâmetros:
+            estrategia (Optional[Estrategia]): A estratégia do computador (padrão: escolha aleatória).
+            regras (Optional[ConjuntoRegras]): Os itens e quem vence quem (padrão: `REGRAS_PADRAO`).
+            rng (Optional[random.Random]): O gerador aleatório do computador (padrão: um novo, com `semente`).
+            semente (Optional[int]): A semente do gerador criado quando `rng` não é informado.
+        """
+        self.pontos_usuario: int = 0
+        self.pontos_computador: int = 0
+        self.estrategia = estrategia
+        self.regras = regras or REGRAS_PADRAO
+        self.rng = rng if rng is not None else random.Random(semente)
+
+    def semear(self, semente: int) -> None:
+        """Reinicia o gerador aleatório do computador com uma nova semente.
+
+        Parâmetros:
+            semente (int): A semente.
+        """
+        self.rng.seed(semente)
+
+    def escolher_jogada(self, escolha_jogador: str) -> Tuple[str, str]:
+        """Determina a jogada do computador e o resultado da partida.
+
+        Parâmetros:
+            escolha_jogador (str): A escolha do jogador.
+
+        Retorna:
+            Tuple[str, str]: A escolha do computador e o resultado da partida.
+        """
+        if self.estrategia is None:
+            escolha_computador = self.rng.choice(self.regras.nomes_itens)
+            return escolha_computador, self.determinar_vencedor(escolha_jogador, escolha_computador)
+
+        jogada = self.estrategia.escolher(self.rng, self.pontos_computador, self.pontos_usuario)
+        escolha_computador = self.regras.nomes_itens[jogada]
+        resultado = self.determinar_vencedor(escolha_jogador, escolha_computador)
+        self.estrategia.observar(jogada, self.regras.indice[escolha_jogador])
+        return escolha_computador, resultado
+
+    def determinar_vencedor(self, escolha_jogador: str, escolha_computador: str) -> str:
+        """Determina o vencedor da partida.
+
+        Parâmetros:
+            escolha_jogador (str): A escolha do jogador.
+            escolha_computador (str): A escolha do computador.
+
+        Retorna:
+            str: O resultado da partida ("Vitória", "Derrota" ou "Empate").
+        """
+        indice = self.regras.indice
+        resultado, delta_usuario, delta_computador = self.regras.jogadas[indice[escolha_jogador]][indice[escolha_computador]]
+        if resultado != EMPATE:
+            self.pontos_usuario = max(0, self.pontos_usuario + delta_usuario)
+            self.pontos_computador = max(0, self.pontos_computador + delta_computador)
+        return nomes_resultados[resultado]
+
+    @staticmethod
+    def determinar_vencedor_lote(escolhas_jogador: np.ndarray, escolhas_computador: np.ndarray, regras: Optional[ConjuntoRegras] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Resolve várias jogadas de uma vez usando as tabelas pré-calculadas.
+
+        As escolhas são codificadas como índices dos itens das regras. A pontuação do jogo
+        não é alterada e as variações não passam pelo `max(0, ...)`, pois o limite
+        depende do placar acumulado jogada a jogada.
+
+        Parâmetros:
+            escolhas_jogador (np.ndarray): Índices das escolhas do jogador.
+            escolhas_computador (np.ndarray): Índices das escolhas do computador.
+            regras (Optional[ConjuntoRegras]): O conjunto de regras (padrão: `REGRAS_PADRAO`).
+
+        Retorna:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Códigos de resultado (EMPATE,
+            VITORIA ou DERROTA) e as variações de pontos do jogador e do computador.
+        """
+        i = np.asarray(escolhas_jogador, dtype=np.intp)
+        j = np.asarray(escolhas_computador, dtype=np.intp)
+        regras = regras or REGRAS_PADRAO
+        return regras.resultados[i, j], regras.delta_usuario[i, j], regras.delta_computador[i, j]
+
+    def zerar_pontos(self) -> None:
+        """Zera a pontuação do jogador e do computador."""
+        self.pontos_usuario = 0
+        self.pontos_computador = 0
+        print("Placar zerado!")
@@ -1,51 +1,120 @@
+import atexit
+import os
 import pygame
 import sys
+from audio import TAMANHO_BUFFER_PADRAO
+from cliente_rede import ClienteRede
+from estrategias import criar_estrategia
 from interface import InterfaceJogo
+from perfil import PerfilQuadros
+from regras import carregar_regras
+from typing import List
+from widgets import CamadaWidgets
+
+def sair() -> None:
+    """Encerra o jogo."""
+    pygame.quit()
+    sys.exit()
+
+def criar_menu(interface: InterfaceJogo) -> CamadaWidgets:
+    """Monta os botões do menu principal, cada um com a sua opção.
+
+    Parâmetros:
+        interface (InterfaceJogo): A interface do jogo.
+
+    Retorna:
+        CamadaWidgets: Os botões do menu.
+    """
+    largura_botao: int = 300
+    altura_botao: int = 70
+    x = interface.LARGURA_TELA/2 - largura_botao/2
+
+    camada = CamadaWidgets()
+    camada.adicionar(interface.criar_botao("Jogar", x, 200, largura_botao, altura_botao, interface.VERDE, (0, 180, 0), interface.jogar))
+    camada.adicionar(interface.criar_botao("Regras", x, 300, largura_botao, altura_botao, interface.AZUL, (0, 150, 255), interface.regras))
+    camada.adicionar(interface.criar_botao("Referências", x, 400, largura_botao, altura_botao, interface.AZUL, (0, 150, 255), interface.referencias))
+    camada.adicionar(interface.criar_botao("Zerar Placar", x, 500, largura_botao, altura_botao, interface.VERMELHO, (255, 50, 50), interface.zerar_pontos))
+    camada.adicionar(interface.criar_botao("Sair", x, 600, largura_botao, altura_botao, interface.CINZA, (100, 100, 100), sair))
+    return camada
+
+def desenhar_menu(interface: InterfaceJogo, camada: CamadaWidgets) -> None:
+    """Desenha um quadro do menu principal.
+
+    Parâmetros:
+        interface (InterfaceJogo): A interface do jogo.
+        camada (CamadaWidgets): Os botões do menu, criados por `criar_menu`.
+    """
+    interface.tela.fill(interface.FUNDO)
+    interface.exibir_texto("JOKENPÔ DO SHELDON", interface.fonte_grande, interface.AZUL, interface.LARGURA_TELA/2, 100)
+    if interface.aviso:
+        # Por que a última partida pela rede terminou
+        interface.exibir_texto(interface.aviso, interface.fonte_pequena, interface.VERMELHO, interface.LARGURA_TELA/2, 155)
+    interface.desenhar_widgets(camada)
+    interface.exibir_texto(f"Você: {interface.jogo.pontos_usuario}", interface.fonte_media, interface.VERDE, 150, 30, 'esquerda')
+    interface.exibir_texto(f"Computador: {interface.jogo.pontos_computador}", interface.fonte_media, interface.VERMELHO, interface.LARGURA_TELA - 150, 30, 'direita')
+
+def passo_menu(interface: InterfaceJogo, camada: CamadaWidgets, eventos: List[pygame.event.Event]) -> None:
+    """Trata os eventos de um quadro do menu, executando a opção clicada, e o redesenha, se preciso.
+
+    Parâmetros:
+        interface (InterfaceJogo): A interface do jogo.
+        camada (CamadaWidgets): Os botões do menu.
+        eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+    """
+    if interface.tratar_cliques(camada, eventos):
+        # Voltou de outra tela ou mudou o placar: redesenha tudo
+        interface.invalidar_tela(camada)
+    if interface.precisa_redesenhar(eventos, camada=camada):
+        desenhar_menu(interface, camada)
+        interface.apresentar()
 
 def menu_principal(interface: InterfaceJogo) -> None:
     """Função do menu principal do jogo.
 
     Esta função exibe o menu inicial e gerencia a navegação entre as opções disponíveis.
     """
+    camada = criar_menu(interface)
+    interface.invalidar_tela(camada)
     while True:
-        for evento in pygame.event.get():
+        eventos = interface.obter_eventos()
+        for evento in eventos:
             if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-        
-        interface.tela.fill(interface.FUNDO)
-        interface.exibir_texto("JOKENPÔ DO SHELDON", interface.fonte_grande, interface.AZUL, interface.LARGURA_TELA/2, 100)
-        
-        largura_botao: int = 300
-        altura_botao: int = 70
+                sair()
         
-        if interface.desenhar_botao("Jogar", interface.LARGURA_TELA/2 - largura_botao/2, 200, largura_botao, altura_botao, interface.VERDE, (0, 180, 0)):
-            print("Botão Jogar pressionado")  # Depuração
-            interface.jogar()
-        if interface.desenhar_botao("Regras", interface.LARGURA_TELA/2 - largura_botao/2, 300, largura_botao, altura_botao, interface.AZUL, (0, 150, 255)):
-            interface.regras()
-        if interface.desenhar_botao("Referências", interface.LARGURA_TELA/2 - largura_botao/2, 400, largura_botao, altura_botao, interface.AZUL, (0, 150, 255)):
-            interface.referencias()
-        if interface.desenhar_botao("Zerar Placar", interface.LARGURA_TELA/2 - largura_botao/2, 500, largura_botao, altura_botao, interface.VERMELHO, (255, 50, 50)):
-            interface.zerar_pontos()
-        if interface.desenhar_botao("Sair", interface.LARGURA_TELA/2 - largura_botao/2, 600, largura_botao, altura_botao, interface.CINZA, (100, 100, 100)):
-            pygame.quit()
-            sys.exit()
-        
-        interface.exibir_texto(f"Você: {interface.jogo.pontos_usuario}", interface.fonte_media, interface.VERDE, 150, 30, 'esquerda')
-        interface.exibir_texto(f"Computador: {interface.jogo.pontos_computador}", interface.fonte_media, interface.VERMELHO, interface.LARGURA_TELA - 150, 30, 'direita')
-        
-        pygame.display.flip()
+        passo_menu(interface, camada, eventos)
+        interface.aguardar_quadro()
 
 def main() -> None:
-    """Função principal que inicia o menu principal."""
-    interface = InterfaceJogo()  # Instancia a interface do jogo
-    pygame.mixer.music.load("sons/musica_fundo.mp3")
-    pygame.mixer.music.set_volume(0.19)
-    pygame.mixer.music.play(-1)  # Inicia a música de fundo em loop
+    """Função principal que inicia o menu principal.
+
+    Com a variável de ambiente JOKENPO_PERFIL definida, os percentis do tempo de quadro
+    são exibidos na tela e os tempos são gravados em CSV no caminho indicado ao sair.
+    Com JOKENPO_SERVIDOR=host:porta, as partidas são jogadas contra outros jogadores
+    conectados ao mesmo servidor (veja servidor.py). JOKENPO_REGRAS escolhe o conjunto
+    de regras (p. ex. "classico" ou "rps15", da pasta conjuntos, ou o caminho de um JSON), e
+    JOKENPO_ESTRATEGIA a estratégia do computador (p. ex. "otima", veja estrategias.py).
+    JOKENPO_BUFFER_AUDIO muda o buffer do mixer, em amostras (veja audio.py); com
+    JOKENPO_PERFIL, o tempo dos sons até o mixer também é informado ao sair.
+    """
+    perfil = None
+    if os.environ.get("JOKENPO_PERFIL"):
+        perfil = PerfilQuadros(sobreposicao=True)
+        atexit.register(perfil.salvar_csv, os.environ["JOKENPO_PERFIL"])
+    cliente = None
+    if os.environ.get("JOKENPO_SERVIDOR"):
+        host, porta = os.environ["JOKENPO_SERVIDOR"].rsplit(":", 1)
+        cliente = ClienteRede(host, int(porta))
+        atexit.register(cliente.fechar)
+    conjunto_regras = carregar_regras(os.environ["JOKENPO_REGRAS"]) if os.environ.get("JOKENPO_REGRAS") else None
+    estrategia = criar_estrategia(os.environ["JOKENPO_ESTRATEGIA"], conjunto_regras) if os.environ.get("JOKENPO_ESTRATEGIA") else None
+    buffer_audio = int(os.environ.get("JOKENPO_BUFFER_AUDIO") or TAMANHO_BUFFER_PADRAO)
+    interface = InterfaceJogo(perfil=perfil, cliente=cliente, conjunto_regras=conjunto_regras, estrategia=estrategia, buffer_audio=buffer_audio)  # Instancia a interface do jogo
+    if perfil is not None:
+        atexit.register(lambda: print(interface.audio.resumo() or "áudio: nenhum som tocado"))
+    interface.recursos.tocar_musica_em_segundo_plano("sons/musica_fundo.mp3", 0.19)
 
     menu_principal(interface)
 
 # Ponto de entrada do programa
 if __name__ == "__main__":
-    main()  # Inicia o jogo chamando a função principal
\ No newline at end of file
+    main()  # Inicia o jogo chamando a função principal
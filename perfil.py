@@ -0,0 +1,139 @@
+import csv
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+# Seções medidas pela instrumentação da interface
+SECOES: Sequence[str] = ("eventos", "texto", "botao", "imagem", "apresentar")
+
+
+class PerfilQuadros:
+    """Mede quanto tempo cada quadro gasta em cada parte do desenho.
+
+    `instrumentar` troca, apenas na instância informada, os métodos medidos por versões
+    cronometradas; sem perfil, a interface não paga nenhum custo extra. O tempo de
+    chamadas aninhadas (p. ex. o texto de um botão) é descontado da seção externa; o
+    que não pertence a nenhuma seção, como preencher o fundo, aparece só no total.
+    """
+
+    def __init__(self, capacidade: int = 10_000, sobreposicao: bool = False) -> None:
+        """Inicializa o perfil.
+
+        Parâmetros:
+            capacidade (int): Quantos quadros recentes são guardados para percentis e CSV.
+            sobreposicao (bool): Se os percentis devem ser desenhados sobre a tela.
+        """
+        self.sobreposicao = sobreposicao
+        self.quadros: Deque[Dict[str, float]] = deque(maxlen=capacidade)
+        self._atual: Dict[str, float] = dict.fromkeys(SECOES, 0.0)
+        self._inicio_quadro = time.perf_counter()
+        self._pilha: List[List[float]] = []
+        self._desenhou = False
+        self._texto_sobreposicao = ""
+
+    def _cronometrar(self, secao: str, funcao):
+        """Envolve `funcao` para que o seu tempo exclusivo seja somado à `secao`."""
+        pilha = self._pilha
+
+        def cronometrada(*args, **kwargs):
+            registro = [time.perf_counter(), 0.0]
+            pilha.append(registro)
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                pilha.pop()
+                total = time.perf_counter() - registro[0]
+                self._atual[secao] += total - registro[1]
+                if pilha:
+                    pilha[-1][1] += total
+
+        return cronometrada
+
+    def instrumentar(self, interface) -> None:
+        """Instala a medição nos métodos de desenho de uma `InterfaceJogo`.
+
+        Parâmetros:
+            interface (InterfaceJogo): A interface a ser medida.
+        """
+        interface.obter_eventos = self._cronometrar("eventos", interface.obter_eventos)
+        interface.exibir_texto = self._cronometrar("texto", interface.exibir_texto)
+        interface.desenhar_widgets = self._cronometrar("botao", interface.desenhar_widgets)
+        interface.desenhar_imagem = self._cronometrar("imagem", interface.desenhar_imagem)
+
+        apresentar = self._cronometrar("apresentar", interface.apresentar)
+        aguardar_quadro = interface.aguardar_quadro
+
+        def apresentar_com_sobreposicao() -> None:
+            if self.sobreposicao:
+                self.desenhar_sobreposicao(interface)
+            self._desenhou = True
+            apresentar()
+
+        def aguardar_e_medir() -> None:
+            self.concluir_quadro()
+            aguardar_quadro()
+            self.iniciar_quadro()
+
+        interface.apresentar = apresentar_com_sobreposicao
+        interface.aguardar_quadro = aguardar_e_medir
+
+    def iniciar_quadro(self) -> None:
+        """Marca o início de um quadro."""
+        self._inicio_quadro = time.perf_counter()
+        self._atual = dict.fromkeys(SECOES, 0.0)
+        self._desenhou = False
+
+    def concluir_quadro(self) -> None:
+        """Encerra o quadro atual; só quadros que chegaram a ser apresentados são guardados."""
+        if not self._desenhou:
+            return
+        self._atual["total"] = time.perf_counter() - self._inicio_quadro
+        self.quadros.append(self._atual)
+        self._atual = dict.fromkeys(SECOES, 0.0)
+        self._desenhou = False
+
+    def percentis(self, secao: str = "total", pontos: Sequence[float] = (50, 95, 99)) -> Dict[float, float]:
+        """Calcula percentis do tempo de uma seção nos quadros guardados.
+
+        Parâmetros:
+            secao (str): A seção, ou "total" para o quadro inteiro.
+            pontos (Sequence[float]): Os percentis desejados.
+
+        Retorna:
+            Dict[float, float]: O tempo, em milissegundos, de cada percentil.
+        """
+        tempos = sorted(quadro[secao] for quadro in self.quadros)
+        if not tempos:
+            return {p: 0.0 for p in pontos}
+        return {p: tempos[min(len(tempos) - 1, int(len(tempos) * p / 100))] * 1000 for p in pontos}
+
+    def desenhar_sobreposicao(self, interface) -> None:
+        """Desenha os percentis do tempo de quadro no canto inferior esquerdo da tela.
+
+        O texto é atualizado a cada 30 quadros, para não invalidar o cache de textos a todo quadro.
+        """
+        if len(self.quadros) % 30 == 0 or not self._texto_sobreposicao:
+            p = self.percentis()
+            self._texto_sobreposicao = f"p50 {p[50]:.1f} ms  p95 {p[95]:.1f} ms  p99 {p[99]:.1f} ms"
+        interface.exibir_texto(self._texto_sobreposicao, interface.fonte_pequena, interface.CINZA, 10, interface.ALTURA_TELA - 15, 'esquerda')
+
+    def salvar_csv(self, caminho: str) -> None:
+        """Grava os tempos de cada quadro guardado, em milissegundos, em um arquivo CSV.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo.
+        """
+        colunas = ("total", *SECOES)
+        with open(caminho, "w", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(("quadro", *colunas))
+            for i, quadro in enumerate(self.quadros):
+                escritor.writerow((i, *(f"{quadro[coluna] * 1000:.4f}" for coluna in colunas)))
+
+    def resumo(self) -> Optional[str]:
+        """Retorna uma linha com os percentis do quadro e o tempo médio por seção."""
+        if not self.quadros:
+            return None
+        p = self.percentis()
+        medias = "  ".join(f"{secao} {sum(q[secao] for q in self.quadros) / len(self.quadros) * 1000:.3f}" for secao in SECOES)
+        return f"p50 {p[50]:.3f}  p95 {p[95]:.3f}  p99 {p[99]:.3f} ms | médias (ms): {medias}"
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+from typing import Iterable, List, Optional, Tuple
+
+
+class Ranking:
+    """Ranking dos jogadores guardado em um banco SQLite.
+
+    Cada partida encerrada vira uma linha em `partidas`, indexada por pontuação, e a
+    melhor pontuação de cada jogador é mantida em `melhores`. Inserções custam
+    O(log n) e as leituras do topo percorrem apenas as linhas pedidas no índice,
+    independentemente do tamanho do histórico.
+    """
+
+    def __init__(self, caminho: str = "ranking.db") -> None:
+        """Abre (ou cria) o banco do ranking.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo do banco (":memory:" para um banco temporário).
+        """
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS partidas (
+                id INTEGER PRIMARY KEY,
+                nome TEXT NOT NULL,
+                pontos INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS partidas_pontos ON partidas (pontos DESC, id);
+            CREATE TABLE IF NOT EXISTS melhores (
+                nome TEXT PRIMARY KEY,
+                pontos INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS melhores_pontos ON melhores (pontos DESC);
+            CREATE TABLE IF NOT EXISTS importacoes (
+                caminho TEXT PRIMARY KEY
+            );
+        """)
+
+    def inserir(self, nome: str, pontos: int) -> None:
+        """Registra a pontuação de uma partida.
+
+        Parâmetros:
+            nome (str): O nome do jogador.
+            pontos (int): A pontuação final do jogador.
+        """
+        self.inserir_varios([(nome, pontos)])
+
+    def inserir_varios(self, registros: Iterable[Tuple[str, int]]) -> None:
+        """Registra várias pontuações em uma única transação.
+
+        Parâmetros:
+            registros (Iterable[Tuple[str, int]]): Pares (nome, pontos).
+        """
+        with self.conexao:
+            self._inserir(list(registros))
+
+    def _inserir(self, registros: List[Tuple[str, int]]) -> None:
+        """Insere pontuações dentro da transação em andamento."""
+        self.conexao.executemany("INSERT INTO partidas (nome, pontos) VALUES (?, ?)", registros)
+        self.conexao.executemany(
+            "INSERT INTO melhores (nome, pontos) VALUES (?, ?) "
+            "ON CONFLICT (nome) DO UPDATE SET pontos = excluded.pontos WHERE excluded.pontos > melhores.pontos",
+            registros,
+        )
+
+    def topo(self, quantidade: int = 10) -> List[Tuple[str, int]]:
+        """Retorna as maiores pontuações, em ordem decrescente.
+
+        Em caso de empate, a partida mais antiga vem primeiro, como no ranking em texto.
+
+        Parâmetros:
+            quantidade (int): Quantas pontuações retornar.
+
+        Retorna:
+            List[Tuple[str, int]]: Pares (nome, pontos).
+        """
+        return self.conexao.execute(
+            "SELECT nome, pontos FROM partidas ORDER BY pontos DESC, id LIMIT ?", (quantidade,)
+        ).fetchall()
+
+    def topo_jogadores(self, quantidade: int = 10) -> List[Tuple[str, int]]:
+        """Retorna os jogadores com as maiores melhores pontuações, um por jogador.
+
+        Em caso de empate, vem primeiro o jogador que entrou antes no ranking.
+
+        Parâmetros:
+            quantidade (int): Quantos jogadores retornar.
+
+        Retorna:
+            List[Tuple[str, int]]: Pares (nome, melhor pontuação).
+        """
+        return self.conexao.execute(
+            "SELECT nome, pontos FROM melhores ORDER BY pontos DESC, rowid LIMIT ?", (quantidade,)
+        ).fetchall()
+
+    def melhor(self, nome: str) -> Optional[int]:
+        """Retorna a melhor pontuação de um jogador.
+
+        Parâmetros:
+            nome (str): O nome do jogador.
+
+        Retorna:
+            Optional[int]: A melhor pontuação, ou None se o jogador nunca jogou.
+        """
+        linha = self.conexao.execute("SELECT pontos FROM melhores WHERE nome = ?", (nome,)).fetchone()
+        return linha[0] if linha else None
+
+    def __len__(self) -> int:
+        return self.conexao.execute("SELECT COUNT(*) FROM partidas").fetchone()[0]
+
+    def importar_texto(self, caminho: str = "ranking.txt") -> int:
+        """Importa um ranking no formato antigo (`nome: pontos` por linha), uma única vez.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo de texto.
+
+        Retorna:
+            int: Quantas pontuações foram importadas (0 se o arquivo não existe ou já foi importado).
+        """
+        chave = os.path.abspath(caminho)
+        if not os.path.exists(caminho) or self.conexao.execute("SELECT 1 FROM importacoes WHERE caminho = ?", (chave,)).fetchone():
+            return 0
+
+        registros = []
+        with open(caminho, "r") as arquivo:
+            for linha in arquivo:
+                if not linha.strip():
+                    continue
+                nome, pontos = linha.strip().rsplit(": ", 1)
+                registros.append((nome, int(pontos)))
+        with self.conexao:
+            self._inserir(registros)
+            self.conexao.execute("INSERT INTO importacoes (caminho) VALUES (?)", (chave,))
+        return len(registros)
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco."""
+        self.conexao.close()
@@ -0,0 +1,108 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+class GerenciadorRecursos:
+    """Carrega imagens, sons e música do jogo.
+
+    As imagens redimensionadas ficam guardadas em disco, em um cache indexado pelo
+    conteúdo do arquivo original e pelo tamanho pedido, então a decodificação do PNG
+    em tamanho cheio e o redimensionamento só acontecem na primeira execução. Sons e
+    música são carregados em threads, enquanto a primeira tela já está visível.
+    """
+
+    def __init__(self, pasta_cache: Optional[str] = os.path.join(".cache", "imagens")) -> None:
+        """Inicializa o gerenciador.
+
+        Parâmetros:
+            pasta_cache (Optional[str]): A pasta do cache de imagens (None desativa o cache).
+        """
+        self.pasta_cache = pasta_cache
+        self._sons: Dict[str, pygame.mixer.Sound] = {}
+        self._thread_audio: Optional[threading.Thread] = None
+        self._erro_audio: Optional[BaseException] = None
+
+    def _converter(self, imagem: pygame.Surface) -> pygame.Surface:
+        """Converte a imagem para o formato de pixels da tela, se já houver uma."""
+        if pygame.display.get_surface() is None:
+            return imagem
+        return imagem.convert_alpha()
+
+    def carregar_imagem(self, caminho: str, tamanho: Tuple[int, int]) -> pygame.Surface:
+        """Carrega uma imagem já redimensionada e convertida para o formato da tela.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo de imagem original.
+            tamanho (Tuple[int, int]): A largura e a altura desejadas.
+
+        Retorna:
+            pygame.Surface: A imagem pronta para ser desenhada.
+        """
+        if self.pasta_cache is None:
+            return self._converter(pygame.transform.scale(pygame.image.load(caminho), tamanho))
+
+        with open(caminho, "rb") as arquivo:
+            conteudo = arquivo.read()
+        largura, altura = tamanho
+        resumo = hashlib.sha256(conteudo).hexdigest()[:32]
+        caminho_cache = os.path.join(self.pasta_cache, f"{resumo}_{largura}x{altura}.rgba")
+        try:
+            with open(caminho_cache, "rb") as arquivo:
+                return self._converter(pygame.image.frombytes(arquivo.read(), tamanho, "RGBA"))
+        except (FileNotFoundError, ValueError):
+            pass
+
+        imagem = pygame.transform.scale(pygame.image.load(caminho), tamanho)
+        os.makedirs(self.pasta_cache, exist_ok=True)
+        temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(pygame.image.tobytes(imagem, "RGBA"))
+        os.replace(temporario, caminho_cache)  # Outra instância nunca lê um arquivo pela metade
+        return self._converter(imagem)
+
+    def carregar_sons_em_segundo_plano(self, sons: Dict[str, str]) -> None:
+        """Começa a carregar os efeitos sonoros em uma thread separada.
+
+        Parâmetros:
+            sons (Dict[str, str]): O caminho de cada som, indexado pelo nome.
+        """
+        def carregar() -> None:
+            try:
+                for nome, caminho in sons.items():
+                    self._sons[nome] = pygame.mixer.Sound(caminho)
+            except BaseException as erro:
+                self._erro_audio = erro
+
+        self._thread_audio = threading.Thread(target=carregar, name="carregar-sons", daemon=True)
+        self._thread_audio.start()
+
+    def tocar_musica_em_segundo_plano(self, caminho: str, volume: float) -> None:
+        """Carrega a música de fundo em uma thread separada e a toca em loop assim que estiver pronta.
+
+        Parâmetros:
+            caminho (str): O caminho do arquivo de música.
+            volume (float): O volume da música, entre 0 e 1.
+        """
+        def carregar() -> None:
+            pygame.mixer.music.load(caminho)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)  # Inicia a música de fundo em loop
+
+        threading.Thread(target=carregar, name="carregar-musica", daemon=True).start()
+
+    def sons(self) -> Dict[str, pygame.mixer.Sound]:
+        """Retorna os sons carregados, aguardando o fim do carregamento se necessário.
+
+        Retorna:
+            Dict[str, pygame.mixer.Sound]: Os sons indexados pelo nome.
+        """
+        if self._thread_audio is not None:
+            self._thread_audio.join()
+            self._thread_audio = None
+            if self._erro_audio is not None:
+                raise self._erro_audio
+        return self._sons
@@ -0,0 +1,308 @@
+"""Registro das jogadas em arquivos binários de tamanho fixo, escritos em segundo plano.
+
+Cada jogada vira um registro de `TAMANHO_REGISTRO` bytes (veja `FORMATO_REGISTRO`),
+anexado a arquivos `partidas-NNNNNN.bin` que são trocados ao atingir um tamanho
+máximo. O laço de quadros só coloca a jogada em uma fila limitada; uma thread
+dedicada agrupa o que estiver na fila e grava no disco.
+
+Os itens são gravados como índices do conjunto de regras da partida. O conjunto de
+cada sessão fica em `sessoes.jsonl`, na mesma pasta, uma linha por sessão:
+    {"sessao": "…", "regras": "rps15"}
+com o nome ou caminho aceito por `carregar_regras`. Sessões sem linha, gravadas antes
+desse arquivo existir, são do conjunto padrão.
+
+Para ver um registro no formato de texto do antigo jogadas.txt:
+    python registro.py [--ultima] [--saida jogadas.txt] [arquivos ou pastas...]
+"""
+import argparse
+import atexit
+import glob
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from jogo import REGRAS_PADRAO, nomes_resultados
+from regras import ConjuntoRegras, carregar_regras
+
+# sessão (16 bytes), rodada, jogador, computador, resultado, preenchimento,
+# pontos do jogador, pontos do computador e instante (segundos desde a época)
+FORMATO_REGISTRO = struct.Struct("<16sIBBbxhhd")
+TAMANHO_REGISTRO: int = FORMATO_REGISTRO.size
+
+# O mesmo layout, para ler muitos registros de uma vez com NumPy
+DTYPE_REGISTRO = np.dtype([
+    ("sessao", "S16"),
+    ("rodada", "<u4"),
+    ("jogador", "u1"),
+    ("computador", "u1"),
+    ("resultado", "i1"),
+    ("_preenchimento", "V1"),
+    ("pontos_usuario", "<i2"),
+    ("pontos_computador", "<i2"),
+    ("instante", "<f8"),
+])
+assert DTYPE_REGISTRO.itemsize == TAMANHO_REGISTRO
+
+PREFIXO_ARQUIVO = "partidas-"
+EXTENSAO_ARQUIVO = ".bin"
+
+# Conjunto de regras de cada sessão, ao lado dos arquivos de registro
+ARQUIVO_SESSOES = "sessoes.jsonl"
+
+# O que fazer quando a fila da thread de escrita está cheia
+DESCARTAR = "descartar"  # Descarta a jogada e conta em `descartados`; o quadro nunca espera
+BLOQUEAR = "bloquear"  # Espera haver espaço na fila
+
+
+class Jogada(NamedTuple):
+    """Uma jogada lida do registro."""
+
+    sessao: bytes
+    rodada: int
+    jogador: int
+    computador: int
+    resultado: int
+    pontos_usuario: int
+    pontos_computador: int
+    instante: float
+
+
+def nova_sessao() -> bytes:
+    """Gera um identificador de sessão de 16 bytes."""
+    return uuid.uuid4().bytes
+
+
+def formatar_jogada(jogada: Jogada, regras: Optional[ConjuntoRegras] = None) -> str:
+    """Formata uma jogada como uma linha do antigo jogadas.txt.
+
+    Parâmetros:
+        jogada (Jogada): A jogada lida do registro.
+        regras (Optional[ConjuntoRegras]): O conjunto de regras da sessão (padrão: `REGRAS_PADRAO`).
+
+    Retorna:
+        str: A linha formatada, sem a quebra de linha.
+
+    Raises:
+        ValueError: Se algum item está fora do conjunto de regras.
+    """
+    nomes = (regras or REGRAS_PADRAO).nomes_itens
+    if max(jogada.jogador, jogada.computador) >= len(nomes):
+        raise ValueError(f"sessão {jogada.sessao.hex()}, jogada {jogada.rodada}: item fora do conjunto {(regras or REGRAS_PADRAO).nome!r}")
+    return (f"Jogada {jogada.rodada}: {nomes[jogada.jogador]} vs {nomes[jogada.computador]} - "
+            f"{nomes_resultados[jogada.resultado]} | Pontos: Você {jogada.pontos_usuario}, Computador {jogada.pontos_computador}")
+
+
+def regras_sessoes(pasta: str) -> Dict[bytes, str]:
+    """Lê o conjunto de regras de cada sessão registrada em uma pasta.
+
+    Parâmetros:
+        pasta (str): A pasta dos arquivos de registro.
+
+    Retorna:
+        Dict[bytes, str]: O nome ou caminho do conjunto, para `carregar_regras`, por sessão;
+        sessões ausentes são do conjunto padrão.
+    """
+    caminho = os.path.join(pasta, ARQUIVO_SESSOES)
+    if not os.path.exists(caminho):
+        return {}
+    regras = {}
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                dados = json.loads(linha)
+            except ValueError:
+                continue  # Uma última linha incompleta
+            regras[bytes.fromhex(dados["sessao"])] = dados["regras"]
+    return regras
+
+
+def arquivos_registro(pasta: str) -> List[str]:
+    """Lista os arquivos de registro de uma pasta, do mais antigo ao mais recente."""
+    return sorted(glob.glob(os.path.join(pasta, f"{PREFIXO_ARQUIVO}*{EXTENSAO_ARQUIVO}")))
+
+
+def ler_registro(caminho: str) -> Iterator[Jogada]:
+    """Lê as jogadas de um arquivo de registro, ignorando um registro final incompleto.
+
+    Parâmetros:
+        caminho (str): O caminho do arquivo.
+
+    Retorna:
+        Iterator[Jogada]: As jogadas, na ordem em que foram gravadas.
+    """
+    with open(caminho, "rb") as arquivo:
+        while True:
+            bloco = arquivo.read(TAMANHO_REGISTRO * 4096)
+            for campos in FORMATO_REGISTRO.iter_unpack(bloco[:len(bloco) - len(bloco) % TAMANHO_REGISTRO]):
+                yield Jogada(*campos)
+            if len(bloco) < TAMANHO_REGISTRO * 4096:
+                return
+
+
+class RegistroPartidas:
+    """Grava as jogadas em arquivos rotativos por meio de uma thread dedicada."""
+
+    def __init__(self, pasta: str = "registros", tamanho_maximo: int = 64 * 1024 * 1024, capacidade_fila: int = 4096, politica: str = DESCARTAR) -> None:
+        """Inicializa o registro e inicia a thread de escrita.
+
+        Parâmetros:
+            pasta (str): A pasta onde os arquivos de registro são criados.
+            tamanho_maximo (int): O tamanho, em bytes, a partir do qual um novo arquivo é iniciado.
+            capacidade_fila (int): Quantas jogadas podem aguardar a escrita.
+            politica (str): DESCARTAR ou BLOQUEAR, o que fazer quando a fila está cheia.
+        """
+        if politica not in (DESCARTAR, BLOQUEAR):
+            raise ValueError(f"Política de fila desconhecida: {politica!r}")
+        self.pasta = pasta
+        self.tamanho_maximo = max(tamanho_maximo, TAMANHO_REGISTRO)
+        self.politica = politica
+        self.descartados = 0
+        # Registros binários, linhas de `ARQUIVO_SESSOES` ou None para encerrar
+        self._fila: "queue.Queue[Union[bytes, str, None]]" = queue.Queue(capacidade_fila)
+        self._fechado = False
+
+        os.makedirs(pasta, exist_ok=True)
+        existentes = arquivos_registro(pasta)
+        self._numero = int(os.path.basename(existentes[-1])[len(PREFIXO_ARQUIVO):-len(EXTENSAO_ARQUIVO)]) if existentes else 1
+        self._arquivo = self._abrir()
+
+        self._thread = threading.Thread(target=self._escrever, name="registro-partidas", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    def _abrir(self):
+        """Abre o arquivo atual para anexar, descartando um registro final incompleto."""
+        caminho = os.path.join(self.pasta, f"{PREFIXO_ARQUIVO}{self._numero:06d}{EXTENSAO_ARQUIVO}")
+        arquivo = open(caminho, "ab")
+        tamanho = arquivo.tell()
+        if tamanho % TAMANHO_REGISTRO:
+            arquivo.truncate(tamanho - tamanho % TAMANHO_REGISTRO)
+        return arquivo
+
+    def iniciar_sessao(self, sessao: bytes, regras: ConjuntoRegras) -> None:
+        """Anota o conjunto de regras de uma sessão, antes das jogadas dela.
+
+        Nunca é descartada, mesmo com a política DESCARTAR, pois sem ela as jogadas da
+        sessão não podem ser lidas.
+
+        Parâmetros:
+            sessao (bytes): O identificador da sessão, de `nova_sessao`.
+            regras (ConjuntoRegras): O conjunto de regras, carregado com `carregar_regras`.
+
+        Raises:
+            ValueError: Se o conjunto não veio de `carregar_regras` e não poderia ser lido de novo.
+        """
+        if regras.origem is None:
+            raise ValueError(f"{regras.nome}: só conjuntos carregados com carregar_regras podem ser registrados")
+        self._fila.put(json.dumps({"sessao": sessao.hex(), "regras": regras.origem}, ensure_ascii=False) + "\n")
+
+    def registrar(self, sessao: bytes, rodada: int, jogador: int, computador: int, resultado: int, pontos_usuario: int, pontos_computador: int) -> bool:
+        """Enfileira uma jogada para ser gravada.
+
+        Parâmetros:
+            sessao (bytes): O identificador da sessão, de `nova_sessao`.
+            rodada (int): O número da jogada na sessão.
+            jogador (int): O índice do item escolhido pelo jogador.
+            computador (int): O índice do item escolhido pelo computador.
+            resultado (int): O código do resultado (EMPATE, VITORIA ou DERROTA).
+            pontos_usuario (int): A pontuação do jogador após a jogada.
+            pontos_computador (int): A pontuação do computador após a jogada.
+
+        Retorna:
+            bool: False se a jogada foi descartada porque a fila estava cheia.
+        """
+        dados = FORMATO_REGISTRO.pack(sessao, rodada, jogador, computador, resultado, pontos_usuario, pontos_computador, time.time())
+        if self.politica == BLOQUEAR:
+            self._fila.put(dados)
+            return True
+        try:
+            self._fila.put_nowait(dados)
+            return True
+        except queue.Full:
+            self.descartados += 1
+            return False
+
+    def _escrever(self) -> None:
+        """Laço da thread de escrita: agrupa as jogadas da fila e as grava no arquivo atual."""
+        while True:
+            lote = [self._fila.get()]
+            while True:
+                try:
+                    lote.append(self._fila.get_nowait())
+                except queue.Empty:
+                    break
+            encerrar = None in lote
+            sessoes = "".join(registro for registro in lote if isinstance(registro, str))
+            if sessoes:
+                with open(os.path.join(self.pasta, ARQUIVO_SESSOES), "a", encoding="utf-8") as arquivo:
+                    arquivo.write(sessoes)
+            dados = b"".join(registro for registro in lote if isinstance(registro, bytes))
+            while dados:
+                espaco = self.tamanho_maximo - self._arquivo.tell()
+                espaco -= espaco % TAMANHO_REGISTRO
+                if espaco <= 0:
+                    self._arquivo.close()
+                    self._numero += 1
+                    self._arquivo = self._abrir()
+                    continue
+                self._arquivo.write(dados[:espaco])
+                dados = dados[espaco:]
+            self._arquivo.flush()
+            if encerrar:
+                self._arquivo.close()
+                return
+
+    def fechar(self) -> None:
+        """Grava tudo o que está na fila e encerra a thread de escrita."""
+        if self._fechado:
+            return
+        self._fechado = True
+        self._fila.put(None)
+        self._thread.join()
+
+
+def main() -> None:
+    """Converte registros binários para o formato de texto do antigo jogadas.txt."""
+    parser = argparse.ArgumentParser(description="Exibe o registro de jogadas no formato de texto.")
+    parser.add_argument("caminhos", nargs="*", default=["registros"], help="Arquivos ou pastas de registro (padrão: registros).")
+    parser.add_argument("--ultima", action="store_true", help="Exibe apenas a última sessão, como o antigo jogadas.txt.")
+    parser.add_argument("--saida", help="Grava o texto neste arquivo em vez de exibi-lo.")
+    args = parser.parse_args()
+
+    arquivos: List[str] = []
+    for caminho in args.caminhos:
+        arquivos.extend(arquivos_registro(caminho) if os.path.isdir(caminho) else [caminho])
+
+    # O conjunto de regras de cada sessão, pelo arquivo de sessões da pasta de cada registro
+    sessoes: Dict[bytes, str] = {}
+    for pasta in {os.path.dirname(arquivo) for arquivo in arquivos}:
+        sessoes.update(regras_sessoes(pasta))
+    jogadas = (jogada for arquivo in arquivos for jogada in ler_registro(arquivo))
+    if args.ultima:
+        ultima: List[Jogada] = []
+        for jogada in jogadas:
+            if ultima and jogada.sessao != ultima[-1].sessao:
+                ultima = []
+            ultima.append(jogada)
+        jogadas = iter(ultima)
+
+    saida = open(args.saida, "w") if args.saida else sys.stdout
+    try:
+        for jogada in jogadas:
+            origem = sessoes.get(jogada.sessao)
+            saida.write(formatar_jogada(jogada, carregar_regras(origem) if origem else None) + "\n")
+    finally:
+        if args.saida:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Conjuntos de regras do jogo, carregados de arquivos JSON da pasta `conjuntos`.
+
+Cada arquivo descreve os itens, na ordem em que são codificados, e quem vence quem:
+    {
+        "nome": "Jokenpô do Sheldon",
+        "itens": [{"nome": "Papel", "peso": 1, "imagem": "imagens/papel.png"}, ...],
+        "vitorias": {"Pedra": ["Tesoura", "Lagarto"], ...}
+    }
+Com "vitorias": "ciclica" (só para um número ímpar de itens), cada item vence os
+(n - 1) / 2 itens seguintes da lista, voltando ao início, como nas variantes RPS-15,
+RPS-25 e RPS-101. A imagem é opcional; sem ela, a interface desenha o nome do item.
+
+Ao ser carregado, o conjunto é validado (cada par de itens distintos tem exatamente
+um vencedor) e compilado em tabelas indexadas por [jogador, oponente], então
+resolver uma jogada custa O(1) qualquer que seja o número de itens.
+"""
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Códigos de resultado, do ponto de vista do jogador
+EMPATE: int = 0
+VITORIA: int = 1
+DERROTA: int = -1
+
+PASTA_CONJUNTOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conjuntos")
+
+# Conjuntos já carregados, pelo caminho absoluto do arquivo
+_carregados: Dict[str, "ConjuntoRegras"] = {}
+
+
+class ConjuntoRegras:
+    """Um conjunto de itens com seus pesos e a relação de quem vence quem, já compilado."""
+
+    def __init__(self, nome: str, itens: Sequence[Tuple[str, int]], vitorias: Dict[str, Sequence[str]], imagens: Optional[Dict[str, str]] = None) -> None:
+        """Valida e compila o conjunto de regras.
+
+        Parâmetros:
+            nome (str): O nome exibido do conjunto.
+            itens (Sequence[Tuple[str, int]]): Pares (item, peso), na ordem de codificação.
+            vitorias (Dict[str, Sequence[str]]): Os itens que cada item vence.
+            imagens (Optional[Dict[str, str]]): O caminho da imagem de cada item, se houver.
+
+        Raises:
+            ValueError: Se algum item é repetido ou desconhecido, ou se algum par de itens
+                não tem exatamente um vencedor.
+        """
+        self.nome = nome
+        # O nome ou caminho com que `carregar_regras` encontra o conjunto de novo, se veio de um arquivo
+        self.origem: Optional[str] = None
+        self.nomes_itens: Tuple[str, ...] = tuple(item for item, _ in itens)
+        self.indice: Dict[str, int] = {item: i for i, item in enumerate(self.nomes_itens)}
+        if len(self.indice) != len(self.nomes_itens):
+            raise ValueError(f"{nome}: itens repetidos")
+        if len(self.nomes_itens) < 2:
+            raise ValueError(f"{nome}: são necessários ao menos dois itens")
+        self.vitorias: Dict[str, List[str]] = {item: list(vencidos) for item, vencidos in vitorias.items()}
+        self.imagens: Dict[str, str] = dict(imagens or {})
+
+        n = len(self.nomes_itens)
+        dominancia = np.zeros((n, n), dtype=bool)
+        for item, vencidos in self.vitorias.items():
+            for vencido in (item, *vencidos):
+                if vencido not in self.indice:
+                    raise ValueError(f"{nome}: item desconhecido {vencido!r}")
+            dominancia[self.indice[item], [self.indice[vencido] for vencido in vencidos]] = True
+        self._validar(dominancia)
+
+        pesos = np.array([peso for _, peso in itens], dtype=np.int16)
+        if (pesos <= 0).any():
+            raise ValueError(f"{nome}: os pesos devem ser positivos")
+        resultados = dominancia.astype(np.int8) - dominancia.T.astype(np.int8)
+        self.pesos = pesos
+        self.dominancia = dominancia
+        self.resultados = resultados
+        # Ganho do jogador: +peso do próprio item na vitória, -peso na derrota; o oponente, o inverso com o peso dele
+        self.delta_usuario = (resultados * pesos[:, None]).astype(np.int16)
+        self.delta_computador = (-resultados * pesos[None, :]).astype(np.int16)
+        for tabela in (pesos, dominancia, resultados, self.delta_usuario, self.delta_computador):
+            tabela.setflags(write=False)
+
+        # (resultado, variação do jogador, variação do oponente) em tuplas, mais rápido que indexar arrays
+        self.jogadas: Tuple[Tuple[Tuple[int, int, int], ...], ...] = tuple(
+            tuple(zip(*linhas)) for linhas in zip(resultados.tolist(), self.delta_usuario.tolist(), self.delta_computador.tolist())
+        )
+        # Saldo de pontos (ganho próprio menos ganho do oponente) de cada resposta [i] à jogada [j] do oponente, indexado por [j][i]
+        self.saldo_contra: List[List[int]] = (self.delta_usuario - self.delta_computador).T.tolist()
+        # Itens que vencem cada item, do mais pesado para o mais leve
+        self.vencedores: List[List[int]] = [sorted(np.flatnonzero(dominancia[:, j]).tolist(), key=lambda i: -pesos[i]) for j in range(n)]
+
+    def _validar(self, dominancia: np.ndarray) -> None:
+        """Confere que nenhum item vence a si mesmo e que cada par tem exatamente um vencedor."""
+        for i in np.flatnonzero(np.diagonal(dominancia)):
+            raise ValueError(f"{self.nome}: {self.nomes_itens[i]} vence a si mesmo")
+        for i, j in zip(*np.nonzero(np.triu(dominancia & dominancia.T))):
+            raise ValueError(f"{self.nome}: {self.nomes_itens[i]} e {self.nomes_itens[j]} vencem um ao outro")
+        sem_vencedor = ~(dominancia | dominancia.T) & ~np.eye(len(dominancia), dtype=bool)
+        for i, j in zip(*np.nonzero(np.triu(sem_vencedor))):
+            raise ValueError(f"{self.nome}: o par {self.nomes_itens[i]} e {self.nomes_itens[j]} não tem vencedor")
+
+    def __len__(self) -> int:
+        return len(self.nomes_itens)
+
+    @property
+    def pesos_itens(self) -> Dict[str, int]:
+        """O peso de cada item, pelo nome."""
+        return dict(zip(self.nomes_itens, self.pesos.tolist()))
+
+    def linhas_texto(self, pontos_para_vencer: int) -> List[str]:
+        """Gera o texto da tela de regras.
+
+        Parâmetros:
+            pontos_para_vencer (int): A pontuação que encerra a partida.
+
+        Retorna:
+            List[str]: As linhas do texto, sem quebra por largura.
+        """
+        linhas = []
+        for item, vencidos in self.vitorias.items():
+            if vencidos:
+                lista = vencidos[0] if len(vencidos) == 1 else f"{', '.join(vencidos[:-1])} e {vencidos[-1]}"
+                linhas.append(f"{item} vence {lista}")
+        linhas += [
+            "",
+            "Pesos dos itens:",
+            ", ".join(f"{item}: {peso}" for item, peso in self.pesos_itens.items()),
+            "",
+            "Ao vencer, você ganha pontos iguais ao peso do seu item",
+            "e o oponente perde pontos iguais ao peso do item dele.",
+            "",
+            f"O jogo termina quando um jogador atinge {pontos_para_vencer} pontos.",
+        ]
+        return linhas
+
+
+def vitorias_ciclicas(nomes_itens: Sequence[str]) -> Dict[str, List[str]]:
+    """Monta a relação em que cada item vence os (n - 1) / 2 itens seguintes da lista.
+
+    Parâmetros:
+        nomes_itens (Sequence[str]): Os itens, em número ímpar.
+
+    Retorna:
+        Dict[str, List[str]]: Os itens que cada item vence.
+    """
+    n = len(nomes_itens)
+    if n % 2 == 0:
+        raise ValueError("a relação cíclica exige um número ímpar de itens")
+    return {item: [nomes_itens[(i + k) % n] for k in range(1, (n - 1) // 2 + 1)] for i, item in enumerate(nomes_itens)}
+
+
+def conjuntos_disponiveis() -> List[str]:
+    """Lista os nomes dos conjuntos de regras da pasta `conjuntos`."""
+    return sorted(arquivo[:-5] for arquivo in os.listdir(PASTA_CONJUNTOS) if arquivo.endswith(".json"))
+
+
+def carregar_regras(nome: str) -> ConjuntoRegras:
+    """Carrega e compila um conjunto de regras, uma única vez por arquivo.
+
+    Parâmetros:
+        nome (str): O nome de um conjunto da pasta `conjuntos` (p. ex. "sheldon") ou o caminho de um arquivo JSON.
+
+    Retorna:
+        ConjuntoRegras: O conjunto compilado.
+
+    Raises:
+        ValueError: Se o arquivo descreve regras inválidas.
+    """
+    caminho = nome if nome.endswith(".json") else os.path.join(PASTA_CONJUNTOS, f"{nome}.json")
+    caminho = os.path.abspath(caminho)
+    if caminho not in _carregados:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        itens = [(item["nome"], int(item.get("peso", 1))) for item in dados["itens"]]
+        vitorias = dados["vitorias"]
+        if vitorias == "ciclica":
+            vitorias = vitorias_ciclicas([item for item, _ in itens])
+        imagens = {item["nome"]: item["imagem"] for item in dados["itens"] if "imagem" in item}
+        conjunto = ConjuntoRegras(dados.get("nome", nome), itens, vitorias, imagens)
+        conjunto.origem = caminho if nome.endswith(".json") else nome
+        _carregados[caminho] = conjunto
+    return _carregados[caminho]
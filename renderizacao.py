@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import pygame
+
+# Ponto de ancoragem do retângulo do texto para cada alinhamento aceito por `exibir_texto`
+ANCORAS: Dict[str, str] = {
+    "esquerda": "midleft",
+    "direita": "midright",
+    "centro": "center",
+}
+
+
+def posicionar(superficie: pygame.Surface, alinhamento: str, x: float, y: float) -> pygame.Rect:
+    """Calcula onde desenhar um texto renderizado.
+
+    Parâmetros:
+        superficie (pygame.Surface): O texto renderizado.
+        alinhamento (str): O alinhamento do texto ('centro', 'esquerda', 'direita').
+        x (float): A posição x do ponto de ancoragem.
+        y (float): A posição y do ponto de ancoragem.
+
+    Retorna:
+        pygame.Rect: O retângulo da superfície, ancorado em (x, y).
+    """
+    return superficie.get_rect(**{ANCORAS.get(alinhamento, "center"): (x, y)})
+
+
+class CacheTexto:
+    """Cache LRU de textos já renderizados.
+
+    Cada entrada é identificada por (texto, fonte, cor, antialias), o que define os
+    pixels da superfície; a posição e o alinhamento só entram ao desenhar, então o mesmo
+    texto em outro lugar da tela reaproveita a superfície. Textos estáticos são
+    renderizados uma única vez e apenas os que mudam, como o placar, passam por
+    `fonte.render` novamente.
+    """
+
+    def __init__(self, capacidade: int = 256) -> None:
+        """Inicializa o cache.
+
+        Parâmetros:
+            capacidade (int): O número máximo de textos guardados (0 desativa o cache).
+        """
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def obter(self, texto: str, fonte: pygame.font.Font, cor: Tuple[int, int, int], antialias: bool) -> pygame.Surface:
+        """Retorna o texto renderizado, renderizando-o se necessário.
+
+        Parâmetros:
+            texto (str): O texto a ser renderizado.
+            fonte (pygame.font.Font): A fonte do texto.
+            cor (Tuple[int, int, int]): A cor do texto em formato RGB.
+            antialias (bool): Se o texto deve ser suavizado.
+
+        Retorna:
+            pygame.Surface: A superfície renderizada (veja `posicionar`).
+        """
+        chave = (texto, fonte, cor, antialias)
+        superficie = self._entradas.get(chave)
+        if superficie is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return superficie
+
+        self.falhas += 1
+        superficie = fonte.render(texto, antialias, cor)
+        if self.capacidade > 0:
+            self._entradas[chave] = superficie
+            if len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+        return superficie
+
+    @property
+    def taxa_acertos(self) -> float:
+        """A fração de consultas atendidas pelo cache."""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def limpar(self) -> None:
+        """Descarta todos os textos guardados e zera os contadores."""
+        self._entradas.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+
+class RastreadorSujo:
+    """Descobre quais regiões da tela mudaram entre dois quadros.
+
+    A cada quadro, tudo o que é desenhado é registrado com uma chave que descreve o
+    seu conteúdo e posição. Ao concluir o quadro, os retângulos das chaves que
+    surgiram ou sumiram em relação ao quadro anterior são os únicos que precisam ser
+    enviados à tela; o restante tem exatamente os mesmos pixels.
+    """
+
+    def __init__(self, area_total: pygame.Rect) -> None:
+        """Inicializa o rastreador.
+
+        Parâmetros:
+            area_total (pygame.Rect): O retângulo da tela inteira.
+        """
+        self.area_total = area_total
+        self._anterior: Dict[tuple, pygame.Rect] = {}
+        self._atual: Dict[tuple, pygame.Rect] = {}
+        self._tudo_sujo = True
+
+    def registrar(self, chave: tuple, rect: pygame.Rect) -> None:
+        """Registra um elemento desenhado no quadro atual.
+
+        Parâmetros:
+            chave (tuple): Identifica o conteúdo e a posição do elemento.
+            rect (pygame.Rect): A região ocupada pelo elemento.
+        """
+        self._atual[chave] = rect
+
+    def invalidar(self) -> None:
+        """Marca a tela inteira como suja no próximo quadro (p. ex. ao trocar de tela)."""
+        self._tudo_sujo = True
+
+    def concluir(self) -> List[pygame.Rect]:
+        """Encerra o quadro atual e retorna as regiões que mudaram.
+
+        Retorna:
+            List[pygame.Rect]: Os retângulos a serem atualizados na tela.
+        """
+        anterior, atual = self._anterior, self._atual
+        self._anterior, self._atual = atual, {}
+        if self._tudo_sujo:
+            self._tudo_sujo = False
+            return [self.area_total]
+        sujos = [rect for chave, rect in atual.items() if chave not in anterior]
+        sujos.extend(rect for chave, rect in anterior.items() if chave not in atual)
+        return sujos
@@ -0,0 +1,112 @@
+from typing import Dict, Optional
+
+import pygame
+
+# Fases de uma partida. Depois da escolha do jogador, cada fase dura o tempo
+# configurado em `duracoes` e então dá lugar à seguinte:
+#   ESCOLHA    aguardando o jogador escolher um item (sem duração)
+#   REVELACAO  só a escolha do jogador aparece, suspense antes de mostrar a do computador
+#   RESULTADO  as duas escolhas aparecem
+#   PONTUACAO  o resultado aparece e o som correspondente toca
+#   REINICIO   a jogada é registrada; em seguida volta a ESCOLHA ou, se alguém
+#              atingiu a pontuação final, segue para FINAL
+#   FINAL      tela de vitória ou derrota
+#   RANKING    ranking dos jogadores
+#   ENCERRADA  a partida acabou e o jogo volta ao menu
+ESCOLHA = "escolha"
+REVELACAO = "revelacao"
+RESULTADO = "resultado"
+PONTUACAO = "pontuacao"
+REINICIO = "reinicio"
+FINAL = "final"
+RANKING = "ranking"
+ENCERRADA = "encerrada"
+
+# Duração padrão de cada fase, em segundos
+DURACOES_PADRAO: Dict[str, float] = {
+    REVELACAO: 1.0,
+    RESULTADO: 1.0,
+    PONTUACAO: 1.0,
+    REINICIO: 1.0,
+    FINAL: 5.0,
+    RANKING: 5.0,
+}
+
+# Evento disparado pelo temporizador quando a fase atual termina
+EVENTO_FASE: int = pygame.event.custom_type()
+
+
+class MaquinaRodada:
+    """Máquina de estados de uma partida, avançada pelos eventos do temporizador.
+
+    Cada fase com duração agenda um único evento `EVENTO_FASE` com o `pygame.time.set_timer`;
+    o laço da tela só precisa repassar esse evento para `tratar_evento`. Eventos de uma
+    fase que já terminou são ignorados pelo número de sequência que carregam.
+
+    O pygame guarda um temporizador por tipo de evento, então várias partidas simultâneas
+    no mesmo processo precisam, cada uma, do seu próprio `tipo_evento`.
+    """
+
+    def __init__(self, duracoes: Optional[Dict[str, float]] = None, tipo_evento: int = EVENTO_FASE) -> None:
+        """Inicializa a máquina na fase de escolha.
+
+        Parâmetros:
+            duracoes (Optional[Dict[str, float]]): Durações que substituem as de `DURACOES_PADRAO`.
+            tipo_evento (int): O tipo do evento agendado no temporizador (padrão: `EVENTO_FASE`).
+        """
+        self.duracoes = {**DURACOES_PADRAO, **(duracoes or {})}
+        self.tipo_evento = tipo_evento
+        self.fase = ESCOLHA
+        self.sequencia = 0
+
+    def proxima_fase(self, fim_de_jogo: bool) -> str:
+        """Retorna a fase que sucede a atual.
+
+        Parâmetros:
+            fim_de_jogo (bool): Se algum jogador já atingiu a pontuação final.
+
+        Retorna:
+            str: A próxima fase.
+        """
+        if self.fase == REINICIO:
+            return FINAL if fim_de_jogo else ESCOLHA
+        return {
+            ESCOLHA: REVELACAO,
+            REVELACAO: RESULTADO,
+            RESULTADO: PONTUACAO,
+            PONTUACAO: REINICIO,
+            FINAL: RANKING,
+            RANKING: ENCERRADA,
+        }[self.fase]
+
+    def entrar(self, fase: str) -> Optional[float]:
+        """Muda para a fase indicada e agenda o seu término.
+
+        Parâmetros:
+            fase (str): A nova fase.
+
+        Retorna:
+            Optional[float]: A duração da fase, ou None se ela não termina sozinha.
+        """
+        self.fase = fase
+        self.sequencia += 1
+        duracao = self.duracoes.get(fase)
+        if duracao:
+            pygame.time.set_timer(pygame.event.Event(self.tipo_evento, sequencia=self.sequencia), max(1, round(duracao * 1000)), loops=1)
+        return duracao
+
+    def terminou(self, evento: pygame.event.Event) -> bool:
+        """Indica se o evento marca o fim da fase atual.
+
+        Parâmetros:
+            evento (pygame.event.Event): Um evento recebido pelo laço da tela.
+
+        Retorna:
+            bool: True se é o evento do temporizador da fase atual.
+        """
+        return evento.type == self.tipo_evento and evento.sequencia == self.sequencia
+
+    def cancelar(self) -> None:
+        """Cancela o temporizador pendente, ao sair da partida antes do fim."""
+        pygame.time.set_timer(self.tipo_evento, 0)
+        self.sequencia += 1
@@ -0,0 +1,280 @@
+"""Servidor de partidas em rede entre dois jogadores, com asyncio.
+
+O protocolo usa uma mensagem JSON por linha, em UTF-8. O cliente envia:
+    {"tipo": "entrar", "nome": "Ana"}     entra na fila e é pareado com o próximo jogador
+    {"tipo": "jogada", "item": "Pedra"}   jogada lacrada da rodada atual
+    {"tipo": "sair"}                      abandona a partida ou a fila, sem desconectar
+e o servidor responde com:
+    {"tipo": "aguardando"}                                         na fila, sem oponente
+    {"tipo": "inicio", "oponente": "Bia", "pontos_para_vencer": 10,
+     "regras": "Jokenpô do Sheldon", "itens": ["Papel", "Tesoura", ...]}
+    {"tipo": "rodada", "rodada": 1, "jogada": "Pedra", "oponente": "Spock",
+     "resultado": "Derrota", "pontos": 0, "pontos_oponente": 5}
+    {"tipo": "fim", "resultado": "Vitória"}                       depois da última rodada
+    {"tipo": "abandono"}                                           o oponente saiu
+    {"tipo": "erro", "mensagem": "..."}
+
+A jogada de um lado só é revelada depois que os dois jogaram, e as rodadas são
+resolvidas pelo `JogoJokenpo`, com os pesos e as regras do conjunto do servidor; os
+itens desse conjunto vão na mensagem de início, para o cliente conferir que usa os mesmos. Cada
+conexão tem memória limitada: as linhas recebidas têm tamanho máximo e um cliente
+que não lê as respostas é desconectado quando o buffer de saída passa de um limite.
+
+Uso:
+    python servidor.py [--host 127.0.0.1] [--porta 5050] [--regras sheldon]
+"""
+import argparse
+import asyncio
+import json
+from typing import Callable, Dict, List, Optional
+
+from jogo import DERROTA, PONTOS_PARA_VENCER, REGRAS_PADRAO, VITORIA, JogoJokenpo, nomes_resultados
+from regras import ConjuntoRegras, carregar_regras
+
+# Tipos de mensagem do protocolo
+ENTRAR = "entrar"
+JOGADA = "jogada"
+SAIR = "sair"
+AGUARDANDO = "aguardando"
+INICIO = "inicio"
+RODADA = "rodada"
+FIM = "fim"
+ABANDONO = "abandono"
+ERRO = "erro"
+
+PORTA_PADRAO = 5050
+
+# Tamanho máximo, em bytes, de uma linha recebida
+LIMITE_LINHA = 1024
+# Bytes que podem aguardar envio para um cliente antes que ele seja desconectado
+LIMITE_ESCRITA = 64 * 1024
+
+# Resultado visto pelo segundo jogador, a partir do resultado do primeiro
+_resultado_oposto: Dict[str, str] = {"Vitória": "Derrota", "Derrota": "Vitória", "Empate": "Empate"}
+
+
+def codificar(mensagem: dict) -> bytes:
+    """Codifica uma mensagem como uma linha do protocolo."""
+    return json.dumps(mensagem, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def decodificar(linha: bytes) -> dict:
+    """Decodifica uma linha do protocolo.
+
+    Raises:
+        ValueError: Se a linha não contém um objeto JSON.
+    """
+    mensagem = json.loads(linha)
+    if not isinstance(mensagem, dict):
+        raise ValueError("a mensagem deve ser um objeto JSON")
+    return mensagem
+
+
+class Conexao:
+    """Um cliente conectado."""
+
+    __slots__ = ("escritor", "nome", "partida", "lado")
+
+    def __init__(self, escritor: asyncio.StreamWriter) -> None:
+        self.escritor = escritor
+        self.nome = ""
+        self.partida: Optional["Partida"] = None
+        self.lado = 0
+
+    def enviar(self, mensagem: dict) -> None:
+        """Enfileira uma mensagem para o cliente, desconectando-o se ele não estiver lendo."""
+        if self.escritor.is_closing():
+            return
+        self.escritor.write(codificar(mensagem))
+        if self.escritor.transport.get_write_buffer_size() > LIMITE_ESCRITA:
+            self.escritor.close()
+
+
+class Partida:
+    """Uma partida entre duas conexões; o primeiro jogador ocupa o lugar do "usuário" no `JogoJokenpo`."""
+
+    __slots__ = ("jogadores", "jogo", "jogadas", "rodada")
+
+    def __init__(self, primeiro: Conexao, segundo: Conexao, regras: ConjuntoRegras) -> None:
+        self.jogadores = (primeiro, segundo)
+        self.jogo = JogoJokenpo(regras=regras)
+        self.jogadas: List[Optional[str]] = [None, None]
+        self.rodada = 1
+
+
+class ServidorJokenpo:
+    """Pareia jogadores e arbitra as partidas, todas em um único laço de eventos."""
+
+    def __init__(self, regras: Optional[ConjuntoRegras] = None) -> None:
+        """Inicializa o servidor.
+
+        Parâmetros:
+            regras (Optional[ConjuntoRegras]): O conjunto de regras das partidas (padrão: `REGRAS_PADRAO`).
+        """
+        self.regras = regras or REGRAS_PADRAO
+        self.servidor: Optional[asyncio.AbstractServer] = None
+        self._aguardando: Optional[Conexao] = None
+        self.conexoes = 0
+        self.partidas_ativas = 0
+        self.rodadas_resolvidas = 0
+
+    async def iniciar(self, host: str = "127.0.0.1", porta: int = PORTA_PADRAO) -> int:
+        """Começa a aceitar conexões.
+
+        Parâmetros:
+            host (str): O endereço de escuta.
+            porta (int): A porta de escuta (0 escolhe uma porta livre).
+
+        Retorna:
+            int: A porta em uso.
+        """
+        self.servidor = await asyncio.start_server(self._atender, host, porta, limit=LIMITE_LINHA, backlog=4096)
+        return self.servidor.sockets[0].getsockname()[1]
+
+    async def encerrar(self) -> None:
+        """Para de aceitar conexões."""
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Lê as mensagens de um cliente até ele se desconectar."""
+        conexao = Conexao(escritor)
+        self.conexoes += 1
+        try:
+            while not escritor.is_closing():
+                try:
+                    linha = await leitor.readline()
+                except ValueError:  # Linha maior que LIMITE_LINHA
+                    conexao.enviar({"tipo": ERRO, "mensagem": "mensagem muito longa"})
+                    break
+                if not linha:
+                    break
+                try:
+                    mensagem = decodificar(linha)
+                except ValueError:
+                    conexao.enviar({"tipo": ERRO, "mensagem": "JSON inválido"})
+                    continue
+                self._tratar(conexao, mensagem)
+        except ConnectionError:
+            pass
+        finally:
+            self._sair(conexao)
+            self.conexoes -= 1
+            escritor.close()
+
+    def _tratar(self, conexao: Conexao, mensagem: dict) -> None:
+        """Executa uma mensagem do cliente."""
+        tipo = mensagem.get("tipo")
+        if tipo == JOGADA:
+            self._jogar(conexao, mensagem.get("item"))
+        elif tipo == ENTRAR:
+            self._entrar(conexao, str(mensagem.get("nome", ""))[:32])
+        elif tipo == SAIR:
+            self._sair(conexao)
+        else:
+            conexao.enviar({"tipo": ERRO, "mensagem": f"tipo de mensagem desconhecido: {tipo!r}"})
+
+    def _entrar(self, conexao: Conexao, nome: str) -> None:
+        """Coloca o jogador na fila ou o pareia com quem está esperando."""
+        if conexao.partida is not None or self._aguardando is conexao:
+            conexao.enviar({"tipo": ERRO, "mensagem": "já está em uma partida ou na fila"})
+            return
+        conexao.nome = nome or "Anônimo"
+        oponente = self._aguardando
+        if oponente is None:
+            self._aguardando = conexao
+            conexao.enviar({"tipo": AGUARDANDO})
+            return
+
+        self._aguardando = None
+        partida = Partida(oponente, conexao, self.regras)
+        for lado, jogador in enumerate(partida.jogadores):
+            jogador.partida = partida
+            jogador.lado = lado
+            jogador.enviar({"tipo": INICIO, "oponente": partida.jogadores[1 - lado].nome, "pontos_para_vencer": PONTOS_PARA_VENCER,
+                            "regras": self.regras.nome, "itens": list(self.regras.nomes_itens)})
+        self.partidas_ativas += 1
+
+    def _jogar(self, conexao: Conexao, item: object) -> None:
+        """Lacra a jogada do jogador e resolve a rodada quando os dois já jogaram."""
+        partida = conexao.partida
+        if partida is None:
+            conexao.enviar({"tipo": ERRO, "mensagem": "não está em uma partida"})
+            return
+        if not isinstance(item, str) or item not in self.regras.indice:
+            conexao.enviar({"tipo": ERRO, "mensagem": f"item inválido: {item!r}"})
+            return
+        if partida.jogadas[conexao.lado] is not None:
+            conexao.enviar({"tipo": ERRO, "mensagem": "jogada já enviada nesta rodada"})
+            return
+        partida.jogadas[conexao.lado] = item
+        primeira, segunda = partida.jogadas
+        if primeira is None or segunda is None:
+            return
+
+        jogo = partida.jogo
+        resultado = jogo.determinar_vencedor(primeira, segunda)
+        primeiro, segundo = partida.jogadores
+        primeiro.enviar({"tipo": RODADA, "rodada": partida.rodada, "jogada": primeira, "oponente": segunda,
+                         "resultado": resultado, "pontos": jogo.pontos_usuario, "pontos_oponente": jogo.pontos_computador})
+        segundo.enviar({"tipo": RODADA, "rodada": partida.rodada, "jogada": segunda, "oponente": primeira,
+                        "resultado": _resultado_oposto[resultado], "pontos": jogo.pontos_computador, "pontos_oponente": jogo.pontos_usuario})
+        partida.jogadas = [None, None]
+        partida.rodada += 1
+        self.rodadas_resolvidas += 1
+
+        if jogo.pontos_usuario >= PONTOS_PARA_VENCER or jogo.pontos_computador >= PONTOS_PARA_VENCER:
+            vencedor = nomes_resultados[VITORIA if jogo.pontos_usuario >= PONTOS_PARA_VENCER else DERROTA]
+            primeiro.enviar({"tipo": FIM, "resultado": vencedor})
+            segundo.enviar({"tipo": FIM, "resultado": _resultado_oposto[vencedor]})
+            self._desfazer(partida)
+
+    def _desfazer(self, partida: Partida) -> None:
+        """Libera os dois jogadores da partida, que podem voltar à fila."""
+        for jogador in partida.jogadores:
+            jogador.partida = None
+        self.partidas_ativas -= 1
+
+    def _sair(self, conexao: Conexao) -> None:
+        """Retira o jogador da fila ou da partida, avisando o oponente."""
+        if self._aguardando is conexao:
+            self._aguardando = None
+        partida = conexao.partida
+        if partida is not None:
+            self._desfazer(partida)
+            partida.jogadores[1 - conexao.lado].enviar({"tipo": ABANDONO})
+
+
+async def servir(host: str = "127.0.0.1", porta: int = PORTA_PADRAO, ao_iniciar: Optional[Callable[[int], None]] = None, regras: Optional[ConjuntoRegras] = None) -> None:
+    """Executa o servidor até o processo ser interrompido.
+
+    Parâmetros:
+        host (str): O endereço de escuta.
+        porta (int): A porta de escuta (0 escolhe uma porta livre).
+        ao_iniciar (Optional[Callable[[int], None]]): Chamada com a porta em uso assim que o servidor começa a escutar.
+        regras (Optional[ConjuntoRegras]): O conjunto de regras das partidas (padrão: `REGRAS_PADRAO`).
+    """
+    servidor = ServidorJokenpo(regras)
+    porta = await servidor.iniciar(host, porta)
+    if ao_iniciar is not None:
+        ao_iniciar(porta)
+    async with servidor.servidor:
+        await servidor.servidor.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor de partidas de Jokenpô em rede.")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1).")
+    parser.add_argument("--porta", type=int, default=PORTA_PADRAO, help=f"Porta de escuta (padrão: {PORTA_PADRAO}).")
+    parser.add_argument("--regras", default="sheldon", help="O conjunto de regras das partidas (padrão: sheldon).")
+    args = parser.parse_args()
+    regras = carregar_regras(args.regras)
+    try:
+        asyncio.run(servir(args.host, args.porta, lambda porta: print(f"Servidor escutando em {args.host}:{porta} ({regras.nome})"), regras))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
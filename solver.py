@@ -0,0 +1,311 @@
+"""Estratégia ótima para a corrida até `PONTOS_PARA_VENCER` com pesos e placar limitado a zero.
+
+Como o ganho depende do peso do item e o placar não fica negativo, a melhor jogada
+depende do placar, e não é simplesmente a escolha uniforme. Para cada placar
+(pontos próprios, pontos do oponente) abaixo da pontuação final, a rodada é um jogo
+de soma zero em que o pagamento de cada par de jogadas é a probabilidade de vencer a
+partida a partir do placar seguinte. A probabilidade de vitória de cada placar é o
+valor desse jogo, calculado por iteração de valores: todos os placares são
+atualizados juntos a cada varredura, resolvendo o jogo de cada um por programação
+linear (simplex) ou por jogo fictício, até as probabilidades convergirem.
+
+O jogo é simétrico, então uma única tabela serve aos dois lados. As políticas
+calculadas ficam em .cache/solver, indexadas pelas regras e pelo método.
+
+Uso:
+    python solver.py [--regras sheldon] [--pontos 10] [--metodo simplex|ficticio] [--sem-cache]
+"""
+import argparse
+import bisect
+import hashlib
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from jogo import PONTOS_PARA_VENCER, REGRAS_PADRAO
+from regras import ConjuntoRegras, carregar_regras
+
+SIMPLEX = "simplex"
+FICTICIO = "ficticio"
+
+PASTA_CACHE = os.path.join(".cache", "solver")
+
+# Maior razão entre variações sucessivas usada para estimar o quanto os valores ainda mudariam
+TAXA_MAXIMA = 0.95
+# Varreduras seguidas com a variação dentro do ruído do jogo fictício após as quais a iteração para
+VARREDURAS_RUIDOSAS = 5
+
+# Iterações do jogo fictício por varredura, em cada placar
+ITERACOES_FICTICIO = 2000
+
+
+def resolver_jogo_matricial(matriz: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Resolve um jogo de soma zero pelo método simplex.
+
+    O jogador das linhas maximiza e o das colunas minimiza. A matriz é deslocada para
+    ter só valores positivos, e o problema do jogador das colunas,
+    max 1ᵀz sujeito a Az ≤ 1 e z ≥ 0, é resolvido por um tableau denso; as variáveis
+    duais das folgas dão a estratégia do jogador das linhas. A regra de Bland evita
+    ciclos nas matrizes degeneradas, comuns aqui.
+
+    Parâmetros:
+        matriz (np.ndarray): Os pagamentos ao jogador das linhas, de forma (m, n).
+
+    Retorna:
+        Tuple[float, np.ndarray, np.ndarray]: O valor do jogo e as estratégias mistas
+        ótimas do jogador das linhas e do jogador das colunas.
+    """
+    m, n = matriz.shape
+    deslocamento = 1.0 - matriz.min()
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = matriz + deslocamento
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = 1.0
+    tableau[m, :n] = -1.0
+    base = list(range(n, n + m))
+
+    while True:
+        negativas = np.flatnonzero(tableau[m, :-1] < -1e-12)
+        if not len(negativas):
+            break
+        coluna = negativas[0]
+        elementos = tableau[:m, coluna]
+        candidatas = np.flatnonzero(elementos > 1e-12)
+        razoes = tableau[candidatas, -1] / elementos[candidatas]
+        empatadas = candidatas[razoes <= razoes.min() + 1e-12]
+        linha = min(empatadas, key=lambda r: base[r])
+        tableau[linha] /= tableau[linha, coluna]
+        outras = np.arange(m + 1) != linha
+        tableau[outras] -= np.outer(tableau[outras, coluna], tableau[linha])
+        base[linha] = coluna
+
+    valor = 1.0 / tableau[m, -1]
+    colunas = np.zeros(n)
+    for linha, variavel in enumerate(base):
+        if variavel < n:
+            colunas[variavel] = tableau[linha, -1]
+    linhas = tableau[m, n:n + m]
+    return valor - deslocamento, linhas * valor, colunas * valor
+
+
+def jogo_ficticio(matrizes: np.ndarray, iteracoes: int = ITERACOES_FICTICIO) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Aproxima a solução de vários jogos de soma zero ao mesmo tempo por jogo fictício.
+
+    A cada iteração, cada jogador responde da melhor forma à frequência das jogadas
+    anteriores do outro, em todos os jogos de uma vez.
+
+    Parâmetros:
+        matrizes (np.ndarray): Os pagamentos ao jogador das linhas, de forma (k, m, n).
+        iteracoes (int): O número de iterações.
+
+    Retorna:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: O valor aproximado de cada jogo, de forma (k,),
+        a frequência das jogadas do jogador das linhas, de forma (k, m), e a distância máxima
+        entre o valor aproximado e o valor exato de cada jogo, de forma (k,).
+    """
+    k, m, n = matrizes.shape
+    jogos = np.arange(k)
+    contagem_linhas = np.zeros((k, m))
+    contagem_colunas = np.zeros((k, n))
+    ganho_linhas = np.zeros((k, m))  # Pagamento acumulado de cada linha contra as colunas jogadas
+    perda_colunas = np.zeros((k, n))  # Pagamento acumulado de cada coluna contra as linhas jogadas
+    linha = np.zeros(k, dtype=np.intp)
+    coluna = np.zeros(k, dtype=np.intp)
+    for _ in range(iteracoes):
+        contagem_linhas[jogos, linha] += 1
+        contagem_colunas[jogos, coluna] += 1
+        ganho_linhas += matrizes[jogos, :, coluna]
+        perda_colunas += matrizes[jogos, linha, :]
+        linha = ganho_linhas.argmax(axis=1)
+        coluna = perda_colunas.argmin(axis=1)
+    # O valor exato fica entre o que as frequências garantem a cada lado
+    superior = ganho_linhas.max(axis=1) / iteracoes
+    inferior = perda_colunas.min(axis=1) / iteracoes
+    return (superior + inferior) / 2, contagem_linhas / iteracoes, (superior - inferior) / 2
+
+
+@dataclass
+class PoliticaOtima:
+    """A probabilidade de vitória e a estratégia mista ótima de cada placar."""
+
+    pontos_para_vencer: int
+    # valores[p, o]: probabilidade de vencer com p pontos contra o pontos, com os dois jogando bem
+    valores: np.ndarray
+    # estrategias[p, o, i]: probabilidade de jogar o item i nesse placar
+    estrategias: np.ndarray
+    iteracoes: int = 0
+    # Estimativa da maior distância entre `valores` e os valores exatos (veja `resolver`)
+    erro: float = 0.0
+    _acumuladas: List[List[List[float]]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        acumuladas = np.cumsum(np.clip(self.estrategias, 0.0, None), axis=2)
+        acumuladas /= acumuladas[:, :, -1:]
+        self._acumuladas = acumuladas.tolist()
+
+    def sortear(self, rng: random.Random, pontos_proprios: int, pontos_oponente: int) -> int:
+        """Sorteia uma jogada da estratégia ótima do placar, consultando a tabela pré-calculada.
+
+        Parâmetros:
+            rng (random.Random): O gerador aleatório da partida.
+            pontos_proprios (int): A pontuação de quem joga.
+            pontos_oponente (int): A pontuação do oponente.
+
+        Retorna:
+            int: O índice do item sorteado.
+        """
+        limite = self.pontos_para_vencer - 1
+        acumuladas = self._acumuladas[min(pontos_proprios, limite)][min(pontos_oponente, limite)]
+        return bisect.bisect_right(acumuladas, rng.random())
+
+
+def _transicoes(regras: ConjuntoRegras, pontos_para_vencer: int) -> np.ndarray:
+    """Calcula o placar seguinte de cada placar e par de jogadas.
+
+    Retorna:
+        np.ndarray: De forma (P, P, n, n), o índice do placar seguinte no vetor de valores
+        achatado, em que P * P representa a derrota e P * P + 1 a vitória.
+    """
+    p = np.arange(pontos_para_vencer)[:, None, None, None]
+    o = np.arange(pontos_para_vencer)[None, :, None, None]
+    proprios = np.maximum(0, p + regras.delta_usuario.astype(np.intp))
+    oponente = np.maximum(0, o + regras.delta_computador.astype(np.intp))
+    derrota = pontos_para_vencer * pontos_para_vencer
+    return np.where(proprios >= pontos_para_vencer, derrota + 1,
+                    np.where(oponente >= pontos_para_vencer, derrota, proprios * pontos_para_vencer + oponente))
+
+
+def resolver(regras: Optional[ConjuntoRegras] = None, pontos_para_vencer: int = PONTOS_PARA_VENCER, metodo: str = SIMPLEX,
+             tolerancia: float = 1e-10, max_iteracoes: int = 10_000) -> PoliticaOtima:
+    """Calcula a política ótima por iteração de valores.
+
+    A iteração para quando a variação entre duas varreduras fica abaixo de `tolerancia`.
+    Como a variação encolhe mais ou menos à mesma taxa r a cada varredura, os valores
+    ainda mudariam até variação * r / (1 - r); essa estimativa vai para
+    `PoliticaOtima.erro`. Com FICTICIO, o valor do jogo de cada placar só é conhecido
+    com a precisão do jogo fictício (o ruído), então a variação não chega a uma
+    tolerância pequena: a iteração para também quando o que falta mudar fica abaixo
+    do ruído, ou após `VARREDURAS_RUIDOSAS` varreduras seguidas em que a variação não
+    o supera, e o ruído é somado ao erro.
+
+    Parâmetros:
+        regras (Optional[ConjuntoRegras]): O conjunto de regras (padrão: `REGRAS_PADRAO`).
+        pontos_para_vencer (int): A pontuação que encerra a partida.
+        metodo (str): SIMPLEX (exato) ou FICTICIO (aproximado) para o jogo de cada placar.
+        tolerancia (float): A maior variação de probabilidade aceita entre varreduras para parar.
+        max_iteracoes (int): O número máximo de varreduras.
+
+    Retorna:
+        PoliticaOtima: As probabilidades de vitória, as estratégias de cada placar e o erro estimado.
+    """
+    if metodo not in (SIMPLEX, FICTICIO):
+        raise ValueError(f"Método desconhecido: {metodo!r}")
+    regras = regras or REGRAS_PADRAO
+    n = len(regras)
+    estados = pontos_para_vencer * pontos_para_vencer
+    transicoes = _transicoes(regras, pontos_para_vencer).reshape(estados, n, n)
+
+    valores = np.full(estados + 2, 0.5)
+    valores[estados:] = (0.0, 1.0)
+    estrategias = np.full((estados, n), 1.0 / n)
+    taxa: Optional[float] = None  # A maior razão entre variações sucessivas acima do ruído
+    anterior: Optional[float] = None
+    ruidosas = 0
+    for iteracao in range(1, max_iteracoes + 1):
+        matrizes = valores[transicoes]
+        ruido = 0.0
+        if metodo == SIMPLEX:
+            novos = np.empty(estados)
+            for estado in range(estados):
+                novos[estado], estrategias[estado], _ = resolver_jogo_matricial(matrizes[estado])
+        else:
+            novos, estrategias, erro_jogos = jogo_ficticio(matrizes)
+            ruido = float(erro_jogos.max())
+        variacao = float(np.abs(novos - valores[:estados]).max())
+        valores[:estados] = novos
+        # Variações dentro do ruído não dizem nada sobre a taxa de convergência
+        if anterior is not None and variacao > 2 * ruido:
+            taxa = max(taxa or 0.0, variacao / anterior)
+        anterior = variacao
+        ruidosas = ruidosas + 1 if variacao <= 2 * ruido else 0
+        razao = min(TAXA_MAXIMA if taxa is None else taxa, TAXA_MAXIMA)
+        restante = variacao * razao / (1 - razao)
+        if variacao < tolerancia or restante < ruido or ruidosas >= VARREDURAS_RUIDOSAS:
+            break
+
+    forma = (pontos_para_vencer, pontos_para_vencer)
+    return PoliticaOtima(pontos_para_vencer, valores[:estados].reshape(forma), estrategias.reshape(*forma, n), iteracao, restante + ruido)
+
+
+def _chave_cache(regras: ConjuntoRegras, pontos_para_vencer: int, metodo: str) -> str:
+    """Identifica a política pelas tabelas das regras, e não pelo nome do conjunto."""
+    resumo = hashlib.sha256()
+    for tabela in (regras.resultados, regras.delta_usuario, regras.delta_computador):
+        resumo.update(np.ascontiguousarray(tabela).tobytes())
+    resumo.update(f"{len(regras)}:{pontos_para_vencer}:{metodo}".encode())
+    return resumo.hexdigest()[:32]
+
+
+def carregar_politica(regras: Optional[ConjuntoRegras] = None, pontos_para_vencer: int = PONTOS_PARA_VENCER, metodo: str = SIMPLEX,
+                      pasta_cache: Optional[str] = PASTA_CACHE) -> PoliticaOtima:
+    """Lê a política ótima do cache em disco, calculando-a e gravando-a se ainda não existir.
+
+    Parâmetros:
+        regras (Optional[ConjuntoRegras]): O conjunto de regras (padrão: `REGRAS_PADRAO`).
+        pontos_para_vencer (int): A pontuação que encerra a partida.
+        metodo (str): SIMPLEX ou FICTICIO.
+        pasta_cache (Optional[str]): A pasta do cache (None desativa o cache).
+
+    Retorna:
+        PoliticaOtima: A política do conjunto de regras.
+    """
+    regras = regras or REGRAS_PADRAO
+    if pasta_cache is None:
+        return resolver(regras, pontos_para_vencer, metodo)
+
+    caminho = os.path.join(pasta_cache, f"{_chave_cache(regras, pontos_para_vencer, metodo)}.npz")
+    try:
+        with np.load(caminho) as dados:
+            return PoliticaOtima(pontos_para_vencer, dados["valores"], dados["estrategias"], int(dados["iteracoes"]), float(dados["erro"]))
+    except (FileNotFoundError, KeyError, ValueError):
+        pass
+
+    politica = resolver(regras, pontos_para_vencer, metodo)
+    os.makedirs(pasta_cache, exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp.npz"
+    np.savez(temporario, valores=politica.valores, estrategias=politica.estrategias, iteracoes=politica.iteracoes, erro=politica.erro)
+    os.replace(temporario, caminho)  # Outro processo nunca lê um arquivo pela metade
+    return politica
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calcula a estratégia ótima de cada placar.")
+    parser.add_argument("--regras", default="sheldon", help="Conjunto de regras (padrão: sheldon).")
+    parser.add_argument("--pontos", type=int, default=PONTOS_PARA_VENCER, help="Pontuação que encerra a partida.")
+    parser.add_argument("--metodo", choices=(SIMPLEX, FICTICIO), default=SIMPLEX)
+    parser.add_argument("--sem-cache", action="store_true", help="Recalcula sem ler nem gravar o cache.")
+    args = parser.parse_args()
+
+    regras = carregar_regras(args.regras)
+    inicio = time.perf_counter()
+    politica = carregar_politica(regras, args.pontos, args.metodo, None if args.sem_cache else PASTA_CACHE)
+    print(f"{regras.nome}: {politica.iteracoes} varreduras, {time.perf_counter() - inicio:.2f}s, erro estimado {politica.erro:.1e}")
+
+    print("\nProbabilidade de vitória (linhas: pontos próprios, colunas: pontos do oponente)")
+    print("    " + "".join(f"{o:>6}" for o in range(args.pontos)))
+    for p in range(args.pontos):
+        print(f"{p:>4}" + "".join(f"{v:>6.3f}" for v in politica.valores[p]))
+    simetria = np.abs(politica.valores + politica.valores.T - 1).max()
+    print(f"\nMaior desvio de V(p, o) + V(o, p) = 1: {simetria:.2e}")
+
+    print("\nEstratégia no placar 0 x 0:")
+    for item, probabilidade in zip(regras.nomes_itens, politica.estrategias[0, 0]):
+        print(f"  {item:<10} {probabilidade:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Os módulos do jogo ficam na raiz do projeto, sem pacote; o SDL roda sem janela e sem som
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
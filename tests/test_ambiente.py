@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from ambiente import SEM_JOGADA, AmbienteVetorizado
+from jogo import JogoJokenpo, nomes_resultados
+from regras import ConjuntoRegras, carregar_regras, conjuntos_disponiveis, vitorias_ciclicas
+from solver import resolver
+
+
+@pytest.mark.parametrize("nome", conjuntos_disponiveis())
+def test_passos_iguais_ao_jogo_escalar(nome):
+    """Cada partida do ambiente segue, rodada a rodada, um `JogoJokenpo` com as mesmas jogadas."""
+    regras = carregar_regras(nome)
+    jogos, pontos, limite = 8, 10, 4
+    ambiente = AmbienteVetorizado(jogos, regras, pontos_para_vencer=pontos, janela_historico=2, limite_rodadas=limite, semente=0)
+    ambiente.reiniciar()
+    escalares = [JogoJokenpo(regras=regras) for _ in range(jogos)]
+    rodadas = [0] * jogos
+    rng = np.random.default_rng(1)
+    terminadas = truncadas = 0
+    for _ in range(300):
+        acoes, acoes_oponente = rng.integers(0, len(regras), (2, jogos))
+        observacao, recompensas, terminados, truncados, info = ambiente.passo(acoes, acoes_oponente)
+        for k, jogo in enumerate(escalares):
+            resultado = jogo.determinar_vencedor(regras.nomes_itens[acoes[k]], regras.nomes_itens[acoes_oponente[k]])
+            rodadas[k] += 1
+            assert nomes_resultados[info["resultados"][k]] == resultado
+            assert tuple(info["pontos_finais"][k]) == (jogo.pontos_usuario, jogo.pontos_computador)
+            venceu, perdeu = jogo.pontos_usuario >= pontos, jogo.pontos_computador >= pontos
+            assert terminados[k] == (venceu or perdeu)
+            assert truncados[k] == (not (venceu or perdeu) and rodadas[k] >= limite)
+            assert recompensas[k] == int(venceu) - int(perdeu)
+            if terminados[k] or truncados[k]:
+                jogo.pontos_usuario = jogo.pontos_computador = rodadas[k] = 0
+                assert (observacao["historico"][k] == SEM_JOGADA).all()
+            else:
+                assert tuple(observacao["historico"][k, -1]) == (acoes[k], acoes_oponente[k])
+            assert (observacao["pontos_proprios"][k], observacao["pontos_oponente"][k], observacao["rodada"][k]) == \
+                (jogo.pontos_usuario, jogo.pontos_computador, rodadas[k])
+        terminadas += int(terminados.sum())
+        truncadas += int(truncados.sum())
+    assert terminadas and truncadas
+
+
+def test_historico_guarda_indices_acima_de_127():
+    nomes = [f"item{i}" for i in range(201)]
+    regras = ConjuntoRegras("grande", [(nome, 1) for nome in nomes], vitorias_ciclicas(nomes))
+    ambiente = AmbienteVetorizado(2, regras, janela_historico=1, semente=0)
+    ambiente.reiniciar()
+    observacao, _, _, _, _ = ambiente.passo(np.array([200, 150]), np.array([128, 0]))
+    assert observacao["historico"][:, -1].tolist() == [[200, 128], [150, 0]]
+
+
+def test_politica_de_outra_pontuacao_e_recusada():
+    regras = carregar_regras("sheldon")
+    politica = resolver(regras, 3)
+    AmbienteVetorizado(4, regras, pontos_para_vencer=3, oponente=politica)
+    with pytest.raises(ValueError, match="3 pontos"):
+        AmbienteVetorizado(4, regras, pontos_para_vencer=5, oponente=politica)
+    with pytest.raises(ValueError, match="itens"):
+        AmbienteVetorizado(4, carregar_regras("classico"), pontos_para_vencer=3, oponente=politica)
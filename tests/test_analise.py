@@ -0,0 +1,132 @@
+import random
+from collections import Counter
+
+import pytest
+
+from analise import AnalisadorHistorico
+from jogo import PONTOS_PARA_VENCER, REGRAS_PADRAO, JogoJokenpo
+from regras import DERROTA, VITORIA, carregar_regras
+from registro import RegistroPartidas, arquivos_registro, nova_sessao
+
+NOMES = list(REGRAS_PADRAO.nomes_itens)
+
+
+@pytest.fixture
+def pasta_registros(tmp_path):
+    """Uma pasta com uma sessão do conjunto padrão e outra do rps15, com itens de índice alto."""
+    gravador = RegistroPartidas(str(tmp_path))
+    sessao_padrao, sessao_rps15 = nova_sessao(), nova_sessao()
+    gravador.iniciar_sessao(sessao_padrao, REGRAS_PADRAO)
+    gravador.registrar(sessao_padrao, 1, 4, 2, VITORIA, 5, 0)
+    gravador.iniciar_sessao(sessao_rps15, carregar_regras("rps15"))
+    gravador.registrar(sessao_rps15, 1, 12, 14, DERROTA, 0, 1)
+    gravador.registrar(sessao_rps15, 2, 13, 9, VITORIA, 1, 0)
+    gravador.fechar()
+    return tmp_path
+
+
+@pytest.mark.parametrize("nome, jogadas, ignoradas", [("sheldon", 1, 2), ("rps15", 2, 1), ("classico", 0, 3)])
+def test_analise_separa_as_sessoes_por_conjunto(pasta_registros, nome, jogadas, ignoradas):
+    analisador = AnalisadorHistorico(carregar_regras(nome))
+    lidas = sum(analisador.processar(arquivo) for arquivo in arquivos_registro(str(pasta_registros)))
+    assert (lidas, analisador.estatisticas.jogadas, analisador.ignoradas) == (jogadas, jogadas, ignoradas)
+
+
+def test_registros_sem_arquivo_de_sessoes_sao_do_conjunto_padrao(tmp_path):
+    gravador = RegistroPartidas(str(tmp_path))
+    gravador.registrar(nova_sessao(), 1, 0, 2, VITORIA, 1, 0)
+    gravador.fechar()
+    (arquivo,) = arquivos_registro(str(tmp_path))
+    assert AnalisadorHistorico().processar(arquivo) == 1
+    assert AnalisadorHistorico(carregar_regras("rps15")).processar(arquivo) == 0
+
+
+def linhas_texto(quantidade, semente):
+    """Linhas no formato do antigo jogadas.txt, em partidas completas contra o computador."""
+    jogo = JogoJokenpo(semente=semente)
+    rng = random.Random(semente)
+    linhas, rodada = [], 0
+    for _ in range(quantidade):
+        if max(jogo.pontos_usuario, jogo.pontos_computador) >= PONTOS_PARA_VENCER:
+            jogo.pontos_usuario = jogo.pontos_computador = rodada = 0
+        rodada += 1
+        jogador = rng.choice(NOMES)
+        computador, resultado = jogo.escolher_jogada(jogador)
+        linhas.append(f"Jogada {rodada}: {jogador} vs {computador} - {resultado} | "
+                      f"Pontos: Você {jogo.pontos_usuario}, Computador {jogo.pontos_computador}\n")
+    return linhas
+
+
+def resumo_de(caminho):
+    analisador = AnalisadorHistorico()
+    analisador.processar(str(caminho))
+    return analisador.estatisticas.para_dict(NOMES)
+
+
+def test_texto_incremental_le_so_o_que_foi_anexado(tmp_path):
+    linhas = linhas_texto(60, 3)
+    arquivo, estado = tmp_path / "jogadas.txt", str(tmp_path / "estado.npz")
+    arquivo.write_text("".join(linhas[:40]), encoding="utf-8")
+    analisador = AnalisadorHistorico(caminho_estado=estado)
+    assert analisador.processar(str(arquivo)) == 40
+    analisador.salvar_estado()
+
+    # A última linha ainda sem quebra de linha fica para a próxima leitura
+    with open(arquivo, "a", encoding="utf-8") as saida:
+        saida.write("".join(linhas[40:]).rstrip("\n"))
+    analisador = AnalisadorHistorico(caminho_estado=estado)
+    assert analisador.processar(str(arquivo)) == 19
+    with open(arquivo, "a", encoding="utf-8") as saida:
+        saida.write("\n")
+    assert analisador.processar(str(arquivo)) == 1
+    assert analisador.processar(str(arquivo)) == 0
+
+    (tmp_path / "completo.txt").write_text("".join(linhas), encoding="utf-8")
+    assert analisador.estatisticas.para_dict(NOMES) == resumo_de(tmp_path / "completo.txt")
+
+
+def test_texto_reescrito_e_lido_desde_o_inicio(tmp_path):
+    arquivo = tmp_path / "jogadas.txt"
+    arquivo.write_text("".join(linhas_texto(30, 4)), encoding="utf-8")
+    analisador = AnalisadorHistorico()
+    assert analisador.processar(str(arquivo)) == 30
+    arquivo.write_text("".join(linhas_texto(10, 5)), encoding="utf-8")
+    assert analisador.processar(str(arquivo)) == 10
+    assert analisador.estatisticas.jogadas == 40
+
+
+def test_leitura_vetorizada_igual_a_expressao_regular(tmp_path):
+    linhas = linhas_texto(200, 6)
+    (tmp_path / "regular.txt").write_text("".join(linhas), encoding="utf-8")
+    # Uma linha vazia e uma linha estranha fazem o bloco ser lido pela expressão regular
+    (tmp_path / "irregular.txt").write_text("".join(linhas[:100]) + "\nlinha estranha\n" + "".join(linhas[100:]), encoding="utf-8")
+    regular = resumo_de(tmp_path / "regular.txt")
+    assert regular["jogadas"] == 200
+    contagem = Counter(linha.split()[2] for linha in linhas)
+    assert regular["frequencia_jogador"] == {item: contagem[item] for item in NOMES}
+    assert resumo_de(tmp_path / "irregular.txt") == regular
+
+
+def test_registro_binario_incremental(tmp_path):
+    sessao = nova_sessao()
+    gravador = RegistroPartidas(str(tmp_path))
+    for rodada in range(1, 6):
+        gravador.registrar(sessao, rodada, 0, 2, VITORIA, rodada, 0)
+    gravador.fechar()
+    (arquivo,) = arquivos_registro(str(tmp_path))
+    estado = str(tmp_path / "estado.npz")
+    analisador = AnalisadorHistorico(caminho_estado=estado)
+    assert analisador.processar(arquivo) == 5
+    analisador.salvar_estado()
+
+    gravador = RegistroPartidas(str(tmp_path))
+    for rodada in range(6, 9):
+        gravador.registrar(sessao, rodada, 2, 1, VITORIA, rodada, 0)
+    gravador.fechar()
+    analisador = AnalisadorHistorico(caminho_estado=estado)
+    assert analisador.processar(arquivo) == 3
+    estatisticas = analisador.estatisticas
+    assert estatisticas.jogadas == 8
+    assert (estatisticas.frequencia_jogador[0], estatisticas.frequencia_jogador[2]) == (5, 3)
+    # A sequência de vitórias continua de uma leitura para a outra, na mesma sessão
+    assert estatisticas.maior_sequencia_vitorias == 8
@@ -0,0 +1,31 @@
+import time
+
+import pygame
+import pytest
+
+from audio import CLIQUE, SistemaAudio, pre_inicializar
+from recursos import GerenciadorRecursos
+
+
+@pytest.fixture
+def audio():
+    pre_inicializar(4096)
+    pygame.mixer.init()
+    recursos = GerenciadorRecursos(pasta_cache=None)
+    recursos.carregar_sons_em_segundo_plano({CLIQUE: "sons/clique.wav", "vitoria": "sons/vitoria.wav"})
+    yield SistemaAudio(recursos, 4096)
+    pygame.mixer.quit()
+
+
+def test_medicao_nao_inclui_a_estimativa_do_buffer(audio):
+    instante = time.perf_counter()
+    assert audio.tocar("vitoria", instante)
+    assert 0 <= audio.latencias[-1] <= time.perf_counter() - instante
+    assert audio.atraso_buffer == pytest.approx(4096 / pygame.mixer.get_init()[0])
+    assert "estimativa" in audio.resumo()
+
+
+def test_cliques_sobrepostos_sao_descartados(audio):
+    assert audio.tocar(CLIQUE)
+    assert not audio.tocar(CLIQUE)
+    assert (len(audio.latencias), audio.cliques_descartados) == (1, 1)
@@ -0,0 +1,58 @@
+import socket
+import time
+
+import pytest
+
+from cliente_rede import DESCONECTADO, ClienteRede
+from servidor import decodificar
+
+
+@pytest.fixture
+def escuta():
+    servidor = socket.create_server(("127.0.0.1", 0))
+    yield servidor
+    servidor.close()
+
+
+def aguardar_mensagens(cliente, quantidade, tempo_limite=2.0):
+    recebidas = []
+    limite = time.monotonic() + tempo_limite
+    while len(recebidas) < quantidade and time.monotonic() < limite:
+        recebidas += cliente.mensagens()
+        time.sleep(0.01)
+    return recebidas
+
+
+def test_envios_chegam_ao_servidor(escuta):
+    cliente = ClienteRede(*escuta.getsockname())
+    conexao, _ = escuta.accept()
+    cliente.entrar("ana")
+    cliente.jogar("Spock")
+    with conexao, conexao.makefile("rb") as arquivo:
+        assert [decodificar(arquivo.readline())["tipo"] for _ in range(2)] == ["entrar", "jogada"]
+    cliente.fechar()
+
+
+def test_enviar_depois_da_queda_nao_levanta_erro(escuta):
+    cliente = ClienteRede(*escuta.getsockname())
+    conexao, _ = escuta.accept()
+    conexao.close()
+    assert aguardar_mensagens(cliente, 1) == [{"tipo": DESCONECTADO}]
+
+    # Antes, o sendall na thread da interface levantava BrokenPipeError aqui
+    for _ in range(50):
+        cliente.jogar("Pedra")
+    assert all(mensagem == {"tipo": DESCONECTADO} for mensagem in aguardar_mensagens(cliente, 50))
+    cliente.fechar()
+
+
+def test_enviar_nao_espera_pela_rede(escuta):
+    cliente = ClienteRede(*escuta.getsockname())
+    conexao, _ = escuta.accept()
+    # O servidor nunca lê: os envios enchem o buffer do socket, mas `enviar` não bloqueia
+    inicio = time.perf_counter()
+    for _ in range(20_000):
+        cliente.entrar("x" * 200)
+    assert time.perf_counter() - inicio < 1.0
+    conexao.close()
+    cliente.fechar()
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from estrategias import ESTRATEGIAS, Estrategia, EstrategiaFrequencia, criar_estrategia
+from gravacao import GravadorSessoes, Sessao, arquivos_sessoes, ler_sessoes, reproduzir, reproduzir_em_lote
+from jogo import JogoJokenpo, PONTOS_PARA_VENCER, nomes_resultados
+from regras import DERROTA, EMPATE, VITORIA, carregar_regras
+
+_codigos = {nomes_resultados[codigo]: codigo for codigo in (EMPATE, VITORIA, DERROTA)}
+
+
+def gravar_partida(gravador, regras, estrategia, semente, rng):
+    """Joga uma partida completa como a interface, gravando-a com o `GravadorSessoes`."""
+    jogo = JogoJokenpo(estrategia, regras, semente=semente)
+    gravador.iniciar(rng.randbytes(16), semente, regras, estrategia)
+    while max(jogo.pontos_usuario, jogo.pontos_computador) < PONTOS_PARA_VENCER:
+        jogador = rng.randrange(len(regras))
+        computador, resultado = jogo.escolher_jogada(regras.nomes_itens[jogador])
+        gravador.registrar(jogador, regras.indice[computador], _codigos[resultado], jogo.pontos_usuario, jogo.pontos_computador)
+    gravador.concluir()
+
+
+@pytest.mark.parametrize("nome", [*ESTRATEGIAS, None])
+def test_gravar_e_reproduzir(tmp_path, nome):
+    regras = carregar_regras("sheldon")
+    rng = random.Random(nome)
+    gravador = GravadorSessoes(str(tmp_path))
+    for semente in range(5):
+        estrategia = criar_estrategia(nome, regras) if nome else None
+        gravar_partida(gravador, regras, estrategia, semente, rng)
+
+    sessoes = [Sessao.de_json(linha) for caminho in arquivos_sessoes(str(tmp_path)) for linha in ler_sessoes(caminho)]
+    assert len(sessoes) == 5
+    for sessao in sessoes:
+        assert sessao.estrategia == nome
+        assert reproduzir(sessao) is None
+
+
+def test_nomes_das_estrategias_sao_unicos():
+    assert all(criar_estrategia(nome).nome == nome for nome in ESTRATEGIAS)
+
+
+def test_reproducao_acusa_divergencia(tmp_path):
+    regras = carregar_regras("sheldon")
+    gravador = GravadorSessoes(str(tmp_path))
+    gravar_partida(gravador, regras, criar_estrategia("contra_frequente", regras), 7, random.Random(0))
+    sessao = Sessao.de_json(next(ler_sessoes(arquivos_sessoes(str(tmp_path))[0])))
+    sessao.estrategia = "frequencia_20"
+    assert reproduzir(sessao) is not None
+
+
+class SempreAPrimeira(Estrategia):
+    def escolher(self, rng, pontos_proprios, pontos_oponente):
+        return 0
+
+
+def test_estrategia_fora_do_registro_e_recusada_na_reproducao(tmp_path):
+    regras = carregar_regras("sheldon")
+    gravador = GravadorSessoes(str(tmp_path))
+    gravar_partida(gravador, regras, SempreAPrimeira(regras), 1, random.Random(1))
+    gravar_partida(gravador, regras, EstrategiaFrequencia(janela=7, regras=regras), 2, random.Random(2))
+    gravar_partida(gravador, regras, criar_estrategia("markov1", regras), 3, random.Random(3))
+    linhas = list(ler_sessoes(arquivos_sessoes(str(tmp_path))[0]))
+    assert [Sessao.de_json(linha).estrategia for linha in linhas] == ["estrategia", "frequencia_7", "markov1"]
+
+    sessoes, _, divergencias = reproduzir_em_lote(iter(linhas), processos=1)
+    assert sessoes == 3
+    assert [divergencia for _, divergencia in divergencias] == [
+        "estratégia 'estrategia' não registrada; a sessão não pode ser reproduzida",
+        "estratégia 'frequencia_7' não registrada; a sessão não pode ser reproduzida",
+    ]
@@ -0,0 +1,65 @@
+import pygame
+import pytest
+
+from gravacao import GravadorSessoes
+from interface import InterfaceJogo
+from ranking import Ranking
+from registro import RegistroPartidas
+from rodada import ENCERRADA
+from servidor import ABANDONO, ERRO
+
+
+@pytest.fixture
+def interface(tmp_path):
+    """Uma interface sem janela, com ranking em memória e registros em uma pasta temporária."""
+    registro = RegistroPartidas(str(tmp_path / "registros"))
+    interface = InterfaceJogo(fps_alvo=0, ranking=Ranking(":memory:"), registro=registro,
+                              gravador=GravadorSessoes(str(tmp_path / "gravacoes")), tela=pygame.Surface((800, 600)))
+    yield interface
+    registro.fechar()
+
+
+def tecla(tecla, texto=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=tecla, unicode=texto, mod=0)
+
+
+def test_nome_digitado_aparece_no_mesmo_quadro(interface, monkeypatch):
+    quadros = iter([[tecla(pygame.K_a, "a")], [tecla(pygame.K_BACKSPACE, "\b")], [tecla(pygame.K_b, "b")], [tecla(pygame.K_RETURN, "\r")]])
+    desenhados = []
+    exibir_texto = interface.exibir_texto
+
+    def registrar_texto(texto, fonte, cor, *args, **kwargs):
+        if cor == interface.PRETO:
+            desenhados.append(texto)
+        return exibir_texto(texto, fonte, cor, *args, **kwargs)
+
+    monkeypatch.setattr(interface, "obter_eventos", lambda: next(quadros))
+    monkeypatch.setattr(interface, "exibir_texto", registrar_texto)
+    assert interface.solicitar_nome_jogador() == "b"
+    assert desenhados == ["a", "", "b", "b"]
+
+
+def test_sem_janela_exige_um_registro_compartilhado(tmp_path):
+    with pytest.raises(ValueError, match="registro"):
+        InterfaceJogo(ranking=Ranking(":memory:"), gravador=GravadorSessoes(str(tmp_path)), tela=pygame.Surface((800, 600)))
+
+
+def test_avisos_do_servidor_aparecem_na_tela(interface, monkeypatch, capsys):
+    desenhados = []
+    exibir_texto = interface.exibir_texto
+
+    def registrar_texto(texto, *args, **kwargs):
+        desenhados.append(texto)
+        return exibir_texto(texto, *args, **kwargs)
+
+    monkeypatch.setattr(interface, "exibir_texto", registrar_texto)
+    interface.iniciar_partida("Ana")
+    interface.tratar_mensagem({"tipo": ERRO, "mensagem": "jogada inválida"})
+    interface.desenhar_jogo()
+    assert "Servidor: jogada inválida" in desenhados
+    assert capsys.readouterr().out == ""
+
+    interface.tratar_mensagem({"tipo": ABANDONO})
+    assert (interface.maquina.fase, interface.aviso) == (ENCERRADA, "O oponente saiu da partida.")
+    interface.iniciar_partida("Ana")
+    assert interface.aviso is None
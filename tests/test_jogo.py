@@ -0,0 +1,69 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from jogo import JogoJokenpo, REGRAS_PADRAO, nomes_resultados
+from regras import carregar_regras, conjuntos_disponiveis
+
+# As regras e a pontuação do jogo original, antes das tabelas pré-calculadas
+PESOS_ORIGINAIS = {"Papel": 1, "Tesoura": 2, "Pedra": 3, "Lagarto": 4, "Spock": 5}
+VITORIAS_ORIGINAIS = {
+    "Pedra": ["Tesoura", "Lagarto"],
+    "Papel": ["Pedra", "Spock"],
+    "Tesoura": ["Papel", "Lagarto"],
+    "Lagarto": ["Papel", "Spock"],
+    "Spock": ["Pedra", "Tesoura"],
+}
+
+
+def vencedor_original(pontos_usuario, pontos_computador, jogador, computador):
+    """A lógica com if/elif do jogo original; retorna o resultado e o placar seguinte."""
+    if jogador == computador:
+        return "Empate", pontos_usuario, pontos_computador
+    if computador in VITORIAS_ORIGINAIS[jogador]:
+        return "Vitória", pontos_usuario + PESOS_ORIGINAIS[jogador], max(0, pontos_computador - PESOS_ORIGINAIS[computador])
+    return "Derrota", max(0, pontos_usuario - PESOS_ORIGINAIS[jogador]), pontos_computador + PESOS_ORIGINAIS[computador]
+
+
+@pytest.mark.parametrize("pontos_usuario, pontos_computador", [(0, 0), (2, 1), (4, 9), (9, 3)])
+def test_determinar_vencedor_igual_ao_original(pontos_usuario, pontos_computador):
+    for jogador, computador in itertools.product(PESOS_ORIGINAIS, repeat=2):
+        jogo = JogoJokenpo()
+        jogo.pontos_usuario, jogo.pontos_computador = pontos_usuario, pontos_computador
+        resultado = jogo.determinar_vencedor(jogador, computador)
+        assert (resultado, jogo.pontos_usuario, jogo.pontos_computador) == vencedor_original(pontos_usuario, pontos_computador, jogador, computador)
+
+
+def test_sequencia_de_jogadas_igual_a_original():
+    rng = np.random.default_rng(0)
+    jogo = JogoJokenpo()
+    pontos = (0, 0)
+    nomes = list(PESOS_ORIGINAIS)
+    for jogador, computador in rng.integers(0, len(nomes), (2000, 2)):
+        resultado = jogo.determinar_vencedor(nomes[jogador], nomes[computador])
+        esperado, *pontos = vencedor_original(*pontos, nomes[jogador], nomes[computador])
+        assert (resultado, jogo.pontos_usuario, jogo.pontos_computador) == (esperado, *pontos)
+
+
+@pytest.mark.parametrize("nome", conjuntos_disponiveis())
+def test_lote_igual_ao_escalar(nome):
+    regras = carregar_regras(nome)
+    pares = np.array(list(itertools.product(range(len(regras)), repeat=2)))
+    resultados, delta_usuario, delta_computador = JogoJokenpo.determinar_vencedor_lote(pares[:, 0], pares[:, 1], regras)
+    for (jogador, computador), resultado, du, dc in zip(pares, resultados, delta_usuario, delta_computador):
+        # Placar alto o bastante para o limite em zero não interferir nas variações
+        jogo = JogoJokenpo(regras=regras)
+        jogo.pontos_usuario = jogo.pontos_computador = 100
+        obtido = jogo.determinar_vencedor(regras.nomes_itens[jogador], regras.nomes_itens[computador])
+        assert obtido == nomes_resultados[resultado]
+        assert (jogo.pontos_usuario - 100, jogo.pontos_computador - 100) == (du, dc)
+
+
+def test_lote_usa_regras_padrao():
+    jogador = np.array([0, 1, 2])
+    computador = np.array([2, 2, 2])
+    padrao = JogoJokenpo.determinar_vencedor_lote(jogador, computador)
+    explicito = JogoJokenpo.determinar_vencedor_lote(jogador, computador, REGRAS_PADRAO)
+    for a, b in zip(padrao, explicito):
+        np.testing.assert_array_equal(a, b)
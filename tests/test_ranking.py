@@ -0,0 +1,42 @@
+import pytest
+
+from ranking import Ranking
+
+
+@pytest.fixture
+def ranking():
+    ranking = Ranking(":memory:")
+    yield ranking
+    ranking.fechar()
+
+
+def test_topo_ordena_por_pontos_e_empates_pela_partida_mais_antiga(ranking):
+    ranking.inserir_varios([("Ana", 5), ("Bia", 9), ("Caio", 5), ("Ana", 9), ("Davi", 7)])
+    assert ranking.topo(10) == [("Bia", 9), ("Ana", 9), ("Davi", 7), ("Ana", 5), ("Caio", 5)]
+    assert ranking.topo(2) == [("Bia", 9), ("Ana", 9)]
+    assert len(ranking) == 5
+
+
+def test_topo_jogadores_guarda_a_melhor_pontuacao_de_cada_um(ranking):
+    ranking.inserir("Ana", 3)
+    ranking.inserir("Bia", 8)
+    ranking.inserir("Caio", 8)
+    ranking.inserir("Ana", 8)
+    ranking.inserir("Bia", 2)
+    assert ranking.topo_jogadores(10) == [("Ana", 8), ("Bia", 8), ("Caio", 8)]
+    assert ranking.topo_jogadores(1) == [("Ana", 8)]
+    assert (ranking.melhor("Bia"), ranking.melhor("Zeca")) == (8, None)
+
+
+def test_importa_o_ranking_em_texto_uma_unica_vez(ranking, tmp_path):
+    caminho = tmp_path / "ranking.txt"
+    caminho.write_text("Ana: 4\n\nJosé: da Silva: 10\nAna: 7\n", encoding="utf-8")
+    assert ranking.importar_texto(str(caminho)) == 3
+    assert ranking.importar_texto(str(caminho)) == 0
+    assert ranking.topo(10) == [("José: da Silva", 10), ("Ana", 7), ("Ana", 4)]
+    assert ranking.melhor("Ana") == 7
+
+
+def test_importacao_de_arquivo_inexistente_nao_faz_nada(ranking, tmp_path):
+    assert ranking.importar_texto(str(tmp_path / "nao_existe.txt")) == 0
+    assert len(ranking) == 0
@@ -0,0 +1,62 @@
+import sys
+
+import pytest
+
+import registro
+from jogo import REGRAS_PADRAO
+from regras import DERROTA, VITORIA, ConjuntoRegras, carregar_regras
+from registro import Jogada, RegistroPartidas, arquivos_registro, formatar_jogada, ler_registro, nova_sessao, regras_sessoes
+
+
+@pytest.fixture
+def pasta_registros(tmp_path):
+    """Uma pasta com uma sessão do conjunto padrão e outra do rps15, com itens de índice alto."""
+    rps15 = carregar_regras("rps15")
+    sessao_padrao, sessao_rps15 = nova_sessao(), nova_sessao()
+    gravador = RegistroPartidas(str(tmp_path))
+    gravador.iniciar_sessao(sessao_padrao, REGRAS_PADRAO)
+    gravador.registrar(sessao_padrao, 1, 4, 2, VITORIA, 5, 0)
+    gravador.iniciar_sessao(sessao_rps15, rps15)
+    gravador.registrar(sessao_rps15, 1, 12, 14, DERROTA, 0, 1)
+    gravador.registrar(sessao_rps15, 2, 13, 9, VITORIA, 1, 0)
+    gravador.fechar()
+    return tmp_path, sessao_padrao, sessao_rps15
+
+
+def test_sessoes_guardam_o_conjunto_de_regras(pasta_registros):
+    pasta, sessao_padrao, sessao_rps15 = pasta_registros
+    assert regras_sessoes(str(pasta)) == {sessao_padrao: "sheldon", sessao_rps15: "rps15"}
+
+
+def test_converte_para_texto_com_as_regras_de_cada_sessao(pasta_registros, monkeypatch, capsys):
+    pasta, _, _ = pasta_registros
+    monkeypatch.setattr(sys, "argv", ["registro.py", str(pasta)])
+    registro.main()
+    assert capsys.readouterr().out.splitlines() == [
+        "Jogada 1: Spock vs Pedra - Vitória | Pontos: Você 5, Computador 0",
+        "Jogada 1: Diabo vs Arma - Derrota | Pontos: Você 0, Computador 1",
+        "Jogada 2: Raio vs Ar - Vitória | Pontos: Você 1, Computador 0",
+    ]
+
+
+def test_item_fora_do_conjunto_e_recusado():
+    with pytest.raises(ValueError, match="fora do conjunto"):
+        formatar_jogada(Jogada(b"\0" * 16, 1, 12, 0, VITORIA, 3, 0, 0.0))
+
+
+def test_conjunto_sem_origem_nao_e_registrado(tmp_path):
+    gravador = RegistroPartidas(str(tmp_path))
+    try:
+        with pytest.raises(ValueError):
+            gravador.iniciar_sessao(nova_sessao(), ConjuntoRegras("avulso", [("A", 1), ("B", 1), ("C", 1)], {"A": ["B"], "B": ["C"], "C": ["A"]}))
+    finally:
+        gravador.fechar()
+
+
+def test_registros_sem_arquivo_de_sessoes_usam_o_conjunto_padrao(tmp_path):
+    gravador = RegistroPartidas(str(tmp_path))
+    gravador.registrar(nova_sessao(), 1, 0, 2, VITORIA, 1, 0)
+    gravador.fechar()
+    (arquivo,) = arquivos_registro(str(tmp_path))
+    assert regras_sessoes(str(tmp_path)) == {}
+    assert [formatar_jogada(j) for j in ler_registro(arquivo)] == ["Jogada 1: Papel vs Pedra - Vitória | Pontos: Você 1, Computador 0"]
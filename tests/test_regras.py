@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from regras import ConjuntoRegras, carregar_regras, conjuntos_disponiveis
+
+
+def gravar(pasta, nome, dados):
+    caminho = pasta / f"{nome}.json"
+    caminho.write_text(dados if isinstance(dados, str) else json.dumps(dados), encoding="utf-8")
+    return str(caminho)
+
+
+@pytest.mark.parametrize("nome", conjuntos_disponiveis())
+def test_conjuntos_da_pasta_sao_validos(nome):
+    regras = carregar_regras(nome)
+    assert regras.origem == nome
+    assert (regras.resultados == -regras.resultados.T).all()
+
+
+def test_carrega_arquivo_valido(tmp_path):
+    caminho = gravar(tmp_path, "trio", {"nome": "Trio", "itens": [{"nome": "A"}, {"nome": "B", "peso": 2}, {"nome": "C"}], "vitorias": "ciclica"})
+    regras = carregar_regras(caminho)
+    assert regras.nomes_itens == ("A", "B", "C")
+    assert regras.vitorias == {"A": ["B"], "B": ["C"], "C": ["A"]}
+    assert regras.origem == caminho
+
+
+@pytest.mark.parametrize("dados", [
+    "{\"nome\": \"quebrado\", ",
+    {"itens": [{"nome": "A"}, {"nome": "B"}], "vitorias": "ciclica"},
+    {"itens": [{"nome": "A"}, {"nome": "A"}, {"nome": "B"}], "vitorias": {"A": ["B"]}},
+    {"itens": [{"nome": "A"}], "vitorias": {}},
+    {"itens": [{"nome": "A"}, {"nome": "B"}], "vitorias": {"A": ["A"]}},
+    {"itens": [{"nome": "A"}, {"nome": "B"}], "vitorias": {"A": ["B"], "B": ["A"]}},
+    {"itens": [{"nome": "A"}, {"nome": "B"}, {"nome": "C"}], "vitorias": {"A": ["B"], "B": ["C"]}},
+    {"itens": [{"nome": "A"}, {"nome": "B"}], "vitorias": {"A": ["Z"]}},
+    {"itens": [{"nome": "A", "peso": 0}, {"nome": "B"}], "vitorias": {"A": ["B"]}},
+], ids=["sintaxe", "ciclica_par", "repetido", "um_item", "vence_a_si", "vencem_um_ao_outro", "par_sem_vencedor", "desconhecido", "peso_zero"])
+def test_rejeita_regras_invalidas(tmp_path, dados):
+    with pytest.raises(ValueError):
+        carregar_regras(gravar(tmp_path, "invalido", dados))
+
+
+def test_construtor_rejeita_par_sem_vencedor():
+    with pytest.raises(ValueError, match="não tem vencedor"):
+        ConjuntoRegras("x", [("A", 1), ("B", 1), ("C", 1)], {"A": ["B"], "C": ["A"]})
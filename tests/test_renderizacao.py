@@ -0,0 +1,37 @@
+import pygame
+import pytest
+
+from renderizacao import CacheTexto, posicionar
+
+
+@pytest.fixture(scope="module")
+def fonte():
+    pygame.font.init()
+    return pygame.font.Font(None, 32)
+
+
+def test_mesmo_texto_em_outra_posicao_reaproveita_a_superficie(fonte):
+    cache = CacheTexto()
+    superficie = cache.obter("Placar", fonte, (0, 0, 0), True)
+    assert cache.obter("Placar", fonte, (0, 0, 0), True) is superficie
+    assert (cache.falhas, cache.acertos, len(cache)) == (1, 1, 1)
+    assert posicionar(superficie, "esquerda", 10, 50).midleft == (10, 50)
+    assert posicionar(superficie, "centro", 400, 300).center == (400, 300)
+
+
+def test_cor_diferente_e_renderizada_de_novo(fonte):
+    cache = CacheTexto()
+    cache.obter("Placar", fonte, (0, 0, 0), True)
+    cache.obter("Placar", fonte, (255, 0, 0), True)
+    assert (cache.falhas, cache.acertos) == (2, 0)
+
+
+def test_capacidade_descarta_o_menos_usado(fonte):
+    cache = CacheTexto(capacidade=2)
+    primeiro = cache.obter("a", fonte, (0, 0, 0), True)
+    cache.obter("b", fonte, (0, 0, 0), True)
+    assert cache.obter("a", fonte, (0, 0, 0), True) is primeiro
+    cache.obter("c", fonte, (0, 0, 0), True)
+    assert len(cache) == 2
+    cache.obter("b", fonte, (0, 0, 0), True)
+    assert cache.falhas == 4
@@ -0,0 +1,60 @@
+import pygame
+import pytest
+
+from rodada import DURACOES_PADRAO, ENCERRADA, ESCOLHA, FINAL, PONTUACAO, RANKING, REINICIO, RESULTADO, REVELACAO, MaquinaRodada
+
+
+@pytest.fixture(autouse=True)
+def pygame_iniciado():
+    pygame.init()
+    pygame.event.clear()
+    yield
+    pygame.quit()
+
+
+def percorrer(maquina, fim_de_jogo):
+    """Avança a máquina enquanto as fases não têm duração, como `InterfaceJogo.avancar_fase`."""
+    fases = []
+    while True:
+        fase = maquina.proxima_fase(fim_de_jogo)
+        duracao = maquina.entrar(fase)
+        fases.append(fase)
+        if fase in (ESCOLHA, ENCERRADA) or duracao:
+            return fases
+
+
+def test_fases_de_duracao_zero_avancam_sem_temporizador():
+    maquina = MaquinaRodada(dict.fromkeys(DURACOES_PADRAO, 0))
+    assert maquina.fase == ESCOLHA
+    assert percorrer(maquina, False) == [REVELACAO, RESULTADO, PONTUACAO, REINICIO, ESCOLHA]
+    assert percorrer(maquina, True) == [REVELACAO, RESULTADO, PONTUACAO, REINICIO, FINAL, RANKING, ENCERRADA]
+    pygame.time.wait(20)
+    assert not any(maquina.terminou(evento) for evento in pygame.event.get())
+
+
+def test_duracao_zero_em_uma_unica_fase():
+    maquina = MaquinaRodada({REVELACAO: 0, RESULTADO: 0.01})
+    assert percorrer(maquina, False) == [REVELACAO, RESULTADO]
+    pygame.time.wait(50)
+    assert sum(maquina.terminou(evento) for evento in pygame.event.get()) == 1
+
+
+def test_evento_de_fase_cancelada_e_ignorado():
+    maquina = MaquinaRodada({REVELACAO: 0.01})
+    maquina.entrar(REVELACAO)
+    antigo = pygame.event.Event(maquina.tipo_evento, sequencia=maquina.sequencia)
+    maquina.cancelar()
+    assert not maquina.terminou(antigo)
+    pygame.time.wait(30)
+    assert not any(maquina.terminou(evento) for evento in pygame.event.get())
+
+
+def test_maquinas_com_tipos_proprios_nao_se_confundem():
+    a = MaquinaRodada({REVELACAO: 0.01})
+    b = MaquinaRodada({REVELACAO: 0.01}, pygame.event.custom_type())
+    a.entrar(REVELACAO)
+    b.entrar(REVELACAO)
+    pygame.time.wait(50)
+    eventos = pygame.event.get()
+    assert sum(map(a.terminou, eventos)) == 1
+    assert sum(map(b.terminou, eventos)) == 1
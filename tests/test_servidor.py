@@ -0,0 +1,59 @@
+import asyncio
+
+from regras import carregar_regras
+from servidor import ENTRAR, ERRO, INICIO, JOGADA, RODADA, ServidorJokenpo, codificar, decodificar
+
+
+async def partida(regras, itens, antes=()):
+    """Pareia dois clientes em um servidor com `regras` e envia as jogadas; retorna o que cada um recebeu.
+
+    Um item None não é enviado, e quem não jogou não espera resposta. Os itens de `antes`
+    são enviados pelo primeiro cliente antes da jogada, cada um esperando uma resposta.
+    """
+    servidor = ServidorJokenpo(regras)
+    porta = await servidor.iniciar("127.0.0.1", 0)
+    conexoes = [await asyncio.open_connection("127.0.0.1", porta) for _ in range(2)]
+    recebidas = [[], []]
+    try:
+        for k, (_, escritor) in enumerate(conexoes):
+            escritor.write(codificar({"tipo": ENTRAR, "nome": f"j{k}"}))
+            await escritor.drain()
+        for k, (leitor, _) in enumerate(conexoes):
+            while not recebidas[k] or recebidas[k][-1]["tipo"] != INICIO:
+                recebidas[k].append(decodificar(await asyncio.wait_for(leitor.readline(), 2)))
+        leitor, escritor = conexoes[0]
+        for item in antes:
+            escritor.write(codificar({"tipo": JOGADA, "item": item}))
+            await escritor.drain()
+            recebidas[0].append(decodificar(await asyncio.wait_for(leitor.readline(), 2)))
+        for (_, escritor), item in zip(conexoes, itens):
+            if item is not None:
+                escritor.write(codificar({"tipo": JOGADA, "item": item}))
+                await escritor.drain()
+        for k, (leitor, _) in enumerate(conexoes):
+            if itens[k] is not None:
+                recebidas[k].append(decodificar(await asyncio.wait_for(leitor.readline(), 2)))
+    finally:
+        for _, escritor in conexoes:
+            escritor.close()
+        await servidor.encerrar()
+    return recebidas
+
+
+def test_servidor_usa_o_conjunto_informado():
+    rps15 = carregar_regras("rps15")
+    primeiro, segundo = asyncio.run(partida(rps15, ["Diabo", "Arma"]))
+    assert primeiro[-2]["itens"] == list(rps15.nomes_itens)
+    assert primeiro[-1]["tipo"] == segundo[-1]["tipo"] == RODADA
+    assert (primeiro[-1]["jogada"], primeiro[-1]["oponente"]) == ("Diabo", "Arma")
+
+
+def test_servidor_padrao_recusa_itens_de_outro_conjunto():
+    primeiro, _ = asyncio.run(partida(None, ["Diabo", None]))
+    assert primeiro[-1]["tipo"] == ERRO
+
+
+def test_item_que_nao_e_texto_recebe_erro_sem_derrubar_a_conexao():
+    primeiro, segundo = asyncio.run(partida(None, ["Pedra", "Tesoura"], antes=[[1], {"item": "Pedra"}, 3, None]))
+    assert [mensagem["tipo"] for mensagem in primeiro[-5:]] == [ERRO, ERRO, ERRO, ERRO, RODADA]
+    assert segundo[-1]["tipo"] == RODADA
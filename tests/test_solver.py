@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from regras import carregar_regras, conjuntos_disponiveis
+from solver import FICTICIO, SIMPLEX, jogo_ficticio, resolver, resolver_jogo_matricial
+
+PEDRA_PAPEL_TESOURA = np.array([[0.0, -1.0, 1.0], [1.0, 0.0, -1.0], [-1.0, 1.0, 0.0]])
+# Sem ponto de sela: valor 1/7, com as linhas jogadas em 3/7 e 4/7 e as colunas em 2/7 e 5/7
+SEM_SELA = np.array([[3.0, -1.0], [-2.0, 1.0]])
+# Com ponto de sela na linha 1, coluna 0: valor 2, estratégias puras
+COM_SELA = np.array([[1.0, 4.0], [2.0, 3.0]])
+
+JOGOS_CONHECIDOS = [
+    (PEDRA_PAPEL_TESOURA, 0.0, [1 / 3] * 3, [1 / 3] * 3),
+    (SEM_SELA, 1 / 7, [3 / 7, 4 / 7], [2 / 7, 5 / 7]),
+    (COM_SELA, 2.0, [0.0, 1.0], [1.0, 0.0]),
+]
+
+
+@pytest.mark.parametrize("matriz, valor, linhas, colunas", JOGOS_CONHECIDOS)
+def test_simplex_resolve_jogos_conhecidos(matriz, valor, linhas, colunas):
+    obtido, estrategia_linhas, estrategia_colunas = resolver_jogo_matricial(matriz)
+    assert obtido == pytest.approx(valor, abs=1e-12)
+    np.testing.assert_allclose(estrategia_linhas, linhas, atol=1e-12)
+    np.testing.assert_allclose(estrategia_colunas, colunas, atol=1e-12)
+
+
+@pytest.mark.parametrize("matriz, valor, linhas, colunas", JOGOS_CONHECIDOS)
+def test_jogo_ficticio_aproxima_jogos_conhecidos(matriz, valor, linhas, colunas):
+    valores, frequencias, erros = jogo_ficticio(matriz[None], 20_000)
+    assert abs(valores[0] - valor) <= erros[0] < 0.01
+    np.testing.assert_allclose(frequencias[0], linhas, atol=0.02)
+
+
+@pytest.mark.parametrize("metodo", [SIMPLEX, FICTICIO])
+def test_placares_iguais_valem_meio(metodo):
+    politica = resolver(carregar_regras("sheldon"), 5, metodo)
+    assert np.abs(np.diag(politica.valores) - 0.5).max() <= politica.erro
+    assert np.abs(politica.valores + politica.valores.T - 1).max() <= 2 * politica.erro
+
+
+@pytest.mark.parametrize("nome", conjuntos_disponiveis())
+@pytest.mark.parametrize("pontos", [3, 10])
+def test_ficticio_fica_dentro_do_erro_informado(nome, pontos):
+    regras = carregar_regras(nome)
+    exata = resolver(regras, pontos, SIMPLEX)
+    aproximada = resolver(regras, pontos, FICTICIO)
+    assert exata.erro < 1e-8
+    assert np.abs(aproximada.valores - exata.valores).max() <= aproximada.erro < 0.25
@@ -0,0 +1,57 @@
+import pygame
+import pytest
+
+from widgets import Botao, CamadaWidgets
+
+
+@pytest.fixture
+def tela():
+    """Uma camada com um botão em (100, 100, 200, 50) e a lista das ações executadas."""
+    pygame.font.init()
+    camada, cliques = CamadaWidgets(), []
+    botao = camada.adicionar(Botao("Jogar", pygame.Rect(100, 100, 200, 50), pygame.font.Font(None, 24),
+                                   (0, 0, 255), (100, 150, 255), acao=lambda: cliques.append("Jogar")))
+    return camada, botao, cliques
+
+
+def mouse(tipo, posicao, botao=1):
+    return pygame.event.Event(tipo, pos=posicao, button=botao)
+
+
+def tratar(camada, *eventos):
+    """Repassa os eventos à camada e executa as ações dos botões clicados, como `InterfaceJogo.tratar_cliques`."""
+    clicados = camada.tratar_eventos(list(eventos))
+    for botao in clicados:
+        botao.acao()
+    return clicados
+
+
+def test_clique_dispara_uma_vez_ao_soltar(tela):
+    camada, botao, cliques = tela
+    assert tratar(camada, mouse(pygame.MOUSEMOTION, (150, 120)), mouse(pygame.MOUSEBUTTONDOWN, (150, 120))) == []
+    assert cliques == []
+    assert tratar(camada, mouse(pygame.MOUSEBUTTONUP, (160, 125))) == [botao]
+    assert cliques == ["Jogar"]
+    # Um segundo MOUSEBUTTONUP sem novo MOUSEBUTTONDOWN não é outro clique
+    assert tratar(camada, mouse(pygame.MOUSEBUTTONUP, (160, 125))) == []
+    assert cliques == ["Jogar"]
+
+
+def test_pressionar_dentro_e_soltar_fora_nao_dispara(tela):
+    camada, botao, cliques = tela
+    tratar(camada, mouse(pygame.MOUSEBUTTONDOWN, (150, 120)), mouse(pygame.MOUSEMOTION, (500, 400)),
+           mouse(pygame.MOUSEBUTTONUP, (500, 400)))
+    assert cliques == []
+    assert not botao.destacado
+
+
+def test_pressionar_fora_e_soltar_dentro_nao_dispara(tela):
+    camada, _, cliques = tela
+    tratar(camada, mouse(pygame.MOUSEBUTTONDOWN, (500, 400)), mouse(pygame.MOUSEBUTTONUP, (150, 120)))
+    assert cliques == []
+
+
+def test_outros_botoes_do_mouse_nao_clicam(tela):
+    camada, _, cliques = tela
+    tratar(camada, mouse(pygame.MOUSEBUTTONDOWN, (150, 120), 3), mouse(pygame.MOUSEBUTTONUP, (150, 120), 3))
+    assert cliques == []
@@ -0,0 +1,205 @@
+"""Torneio sem interface gráfica entre estratégias do computador.
+
+Cada par de estratégias disputa partidas completas até `PONTOS_PARA_VENCER`, com as
+mesmas regras de pontuação de `JogoJokenpo`. As partidas são distribuídas em lotes
+entre processos, cada lote com sua própria semente determinística.
+
+Uso:
+    python torneio.py --jogos 1000 --processos 4 --semente 42 aleatoria ciclica imitadora
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from estrategias import ESTRATEGIAS, Estrategia, criar_estrategia
+from jogo import JogoJokenpo, PONTOS_PARA_VENCER, nomes_itens
+
+# Partidas que passam disso sem vencedor (p. ex. duas estratégias fixas iguais) são empates
+LIMITE_RODADAS: int = 1000
+
+# Resultado de uma partida do ponto de vista da primeira estratégia do par
+VENCEU_A: int = 0
+VENCEU_B: int = 1
+EMPATOU: int = 2
+
+
+def jogar_partida(a: Estrategia, b: Estrategia, rng: random.Random, limite_rodadas: int = LIMITE_RODADAS) -> Tuple[int, int]:
+    """Joga uma partida completa, com `a` no lugar do jogador e `b` no do computador.
+
+    Parâmetros:
+        a (Estrategia): A estratégia que joga como usuário.
+        b (Estrategia): A estratégia que joga como computador.
+        rng (random.Random): O gerador aleatório compartilhado pela partida.
+        limite_rodadas (int): O número máximo de rodadas antes de declarar empate.
+
+    Retorna:
+        Tuple[int, int]: O resultado (VENCEU_A, VENCEU_B ou EMPATOU) e o número de rodadas.
+    """
+    jogo = JogoJokenpo()
+    a.reiniciar()
+    b.reiniciar()
+    for rodada in range(1, limite_rodadas + 1):
+        jogada_a = a.escolher(rng, jogo.pontos_usuario, jogo.pontos_computador)
+        jogada_b = b.escolher(rng, jogo.pontos_computador, jogo.pontos_usuario)
+        jogo.determinar_vencedor(nomes_itens[jogada_a], nomes_itens[jogada_b])
+        a.observar(jogada_a, jogada_b)
+        b.observar(jogada_b, jogada_a)
+        if jogo.pontos_usuario >= PONTOS_PARA_VENCER:
+            return VENCEU_A, rodada
+        if jogo.pontos_computador >= PONTOS_PARA_VENCER:
+            return VENCEU_B, rodada
+    return EMPATOU, limite_rodadas
+
+
+def _jogar_lote(tarefa: Tuple[str, str, int, int]) -> Tuple[bytes, int]:
+    """Executa, em um processo do pool, um lote de partidas entre duas estratégias.
+
+    Os lados se alternam a cada partida e os resultados são sempre devolvidos do
+    ponto de vista da primeira estratégia.
+
+    Parâmetros:
+        tarefa (Tuple[str, str, int, int]): Nomes das estratégias, semente e quantidade de partidas.
+
+    Retorna:
+        Tuple[bytes, int]: O resultado de cada partida, em ordem, e o total de rodadas jogadas.
+    """
+    nome_a, nome_b, semente, quantidade = tarefa
+    rng = random.Random(semente)
+    a, b = criar_estrategia(nome_a), criar_estrategia(nome_b)
+    resultados = bytearray(quantidade)
+    total_rodadas = 0
+    for k in range(quantidade):
+        if k % 2 == 0:
+            resultado, rodadas = jogar_partida(a, b, rng)
+        else:
+            resultado, rodadas = jogar_partida(b, a, rng)
+            if resultado != EMPATOU:
+                resultado = VENCEU_B if resultado == VENCEU_A else VENCEU_A
+        resultados[k] = resultado
+        total_rodadas += rodadas
+    return bytes(resultados), total_rodadas
+
+
+@dataclass
+class Classificacao:
+    """Estatísticas acumuladas de uma estratégia ao longo do torneio."""
+
+    nome: str
+    elo: float = 1500.0
+    vitorias: int = 0
+    derrotas: int = 0
+    empates: int = 0
+    rodadas: int = 0
+    partidas: int = 0
+
+    @property
+    def taxa_vitorias(self) -> float:
+        return self.vitorias / self.partidas if self.partidas else 0.0
+
+    @property
+    def media_rodadas(self) -> float:
+        return self.rodadas / self.partidas if self.partidas else 0.0
+
+
+def atualizar_elo(a: Classificacao, b: Classificacao, pontuacao_a: float, k: float) -> None:
+    """Atualiza o Elo de duas estratégias após uma partida.
+
+    Parâmetros:
+        a (Classificacao): A primeira estratégia.
+        b (Classificacao): A segunda estratégia.
+        pontuacao_a (float): 1 se `a` venceu, 0 se perdeu e 0.5 em caso de empate.
+        k (float): O fator K do Elo.
+    """
+    esperado_a = 1.0 / (1.0 + 10 ** ((b.elo - a.elo) / 400.0))
+    variacao = k * (pontuacao_a - esperado_a)
+    a.elo += variacao
+    b.elo -= variacao
+
+
+def executar_torneio(nomes: Sequence[str], jogos_por_par: int, processos: Optional[int] = None, semente: int = 0, tamanho_lote: int = 250, fator_k: float = 16.0) -> List[Classificacao]:
+    """Executa um torneio todos-contra-todos entre as estratégias informadas.
+
+    O Elo é calculado partida a partida, intercalando os pares, sempre na mesma ordem,
+    então o resultado é o mesmo para qualquer número de processos.
+
+    Parâmetros:
+        nomes (Sequence[str]): Os nomes das estratégias participantes.
+        jogos_por_par (int): Quantas partidas cada par disputa.
+        processos (Optional[int]): O número de processos (padrão: núcleos disponíveis).
+        semente (int): A semente base do torneio.
+        tamanho_lote (int): Quantas partidas cada tarefa enviada a um processo contém.
+        fator_k (float): O fator K do Elo.
+
+    Retorna:
+        List[Classificacao]: As estratégias ordenadas por Elo decrescente.
+    """
+    for nome in nomes:
+        criar_estrategia(nome)  # Valida os nomes antes de iniciar os processos
+
+    pares: List[Tuple[str, str]] = []
+    tarefas: List[Tuple[str, str, int, int]] = []
+    for nome_a, nome_b in itertools.combinations(nomes, 2):
+        for inicio in range(0, jogos_por_par, tamanho_lote):
+            quantidade = min(tamanho_lote, jogos_por_par - inicio)
+            semente_lote = random.Random(f"{semente}:{nome_a}:{nome_b}:{inicio}").getrandbits(64)
+            pares.append((nome_a, nome_b))
+            tarefas.append((nome_a, nome_b, semente_lote, quantidade))
+
+    classificacao: Dict[str, Classificacao] = {nome: Classificacao(nome) for nome in nomes}
+    resultados_por_par: Dict[Tuple[str, str], bytearray] = {}
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for par, (resultados, rodadas) in zip(pares, executor.map(_jogar_lote, tarefas)):
+            resultados_por_par.setdefault(par, bytearray()).extend(resultados)
+            for nome in par:
+                classificacao[nome].partidas += len(resultados)
+                classificacao[nome].rodadas += rodadas
+
+    # Intercala as partidas dos pares para que o Elo não dependa da ordem dos pares
+    for k in range(jogos_por_par):
+        for (nome_a, nome_b), resultados in resultados_por_par.items():
+            a, b = classificacao[nome_a], classificacao[nome_b]
+            resultado = resultados[k]
+            if resultado == VENCEU_A:
+                a.vitorias += 1
+                b.derrotas += 1
+                atualizar_elo(a, b, 1.0, fator_k)
+            elif resultado == VENCEU_B:
+                a.derrotas += 1
+                b.vitorias += 1
+                atualizar_elo(a, b, 0.0, fator_k)
+            else:
+                a.empates += 1
+                b.empates += 1
+                atualizar_elo(a, b, 0.5, fator_k)
+
+    return sorted(classificacao.values(), key=lambda c: c.elo, reverse=True)
+
+
+def main() -> None:
+    """Lê os argumentos da linha de comando, executa o torneio e exibe a classificação."""
+    parser = argparse.ArgumentParser(description="Torneio entre estratégias do Jokenpô do Sheldon.")
+    parser.add_argument("estrategias", nargs="*", default=list(ESTRATEGIAS), help="Estratégias participantes (padrão: todas).")
+    parser.add_argument("--jogos", type=int, default=1000, help="Partidas por par de estratégias.")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="Número de processos.")
+    parser.add_argument("--semente", type=int, default=0, help="Semente base do torneio.")
+    parser.add_argument("--lote", type=int, default=250, help="Partidas por tarefa enviada a um processo.")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    classificacao = executar_torneio(args.estrategias, args.jogos, args.processos, args.semente, args.lote)
+    duracao = time.perf_counter() - inicio
+
+    print(f"{'Estratégia':<20} {'Elo':>8} {'Vitórias':>9} {'Derrotas':>9} {'Empates':>8} {'Taxa':>7} {'Rodadas':>8}")
+    for c in classificacao:
+        print(f"{c.nome:<20} {c.elo:>8.1f} {c.vitorias:>9} {c.derrotas:>9} {c.empates:>8} {c.taxa_vitorias:>7.1%} {c.media_rodadas:>8.1f}")
+    total = sum(c.partidas for c in classificacao) // 2
+    print(f"\n{total} partidas em {duracao:.2f}s ({total / duracao:,.0f} partidas/s)")
+
+
+if __name__ == "__main__":
+    main()
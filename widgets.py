@@ -0,0 +1,151 @@
+"""Camada retida de botões, com estado de destaque e cliques tratados a partir dos eventos.
+
+Cada botão é montado uma única vez, com as superfícies normal e destacada já
+renderizadas. A camada recebe os eventos do mouse, descobre o botão sob o ponteiro
+por uma grade espacial e registra a mudança de estado, então uma tela só precisa
+ser redesenhada quando algum botão mudou. O clique acontece ao soltar o botão do
+mouse sobre o mesmo botão em que ele foi pressionado, uma única vez por clique.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+# Eventos tratados pela camada; sozinhos, não exigem redesenhar a tela
+EVENTOS_PONTEIRO = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL))
+
+
+class Botao:
+    """Um botão retangular com cantos arredondados e um rótulo centralizado."""
+
+    __slots__ = ("texto", "rect", "acao", "normal", "destaque", "destacado", "visivel")
+
+    def __init__(self, texto: str, rect: pygame.Rect, fonte: pygame.font.Font, cor_inativa: Tuple[int, int, int], cor_ativa: Tuple[int, int, int],
+                 cor_texto: Tuple[int, int, int] = (255, 255, 255), acao: Optional[Callable[[], None]] = None) -> None:
+        """Monta o botão e renderiza as suas duas aparências.
+
+        Parâmetros:
+            texto (str): O rótulo do botão.
+            rect (pygame.Rect): A posição e o tamanho do botão.
+            fonte (pygame.font.Font): A fonte do rótulo.
+            cor_inativa (Tuple[int, int, int]): A cor do botão sem o ponteiro sobre ele.
+            cor_ativa (Tuple[int, int, int]): A cor do botão com o ponteiro sobre ele.
+            cor_texto (Tuple[int, int, int]): A cor do rótulo.
+            acao (Optional[Callable[[], None]]): Chamada quando o botão é clicado.
+        """
+        self.texto = texto
+        self.rect = pygame.Rect(rect)
+        self.acao = acao
+        self.normal = self._renderizar(fonte, cor_inativa, cor_texto)
+        self.destaque = self._renderizar(fonte, cor_ativa, cor_texto)
+        self.destacado = False
+        self.visivel = True
+
+    def _renderizar(self, fonte: pygame.font.Font, cor: Tuple[int, int, int], cor_texto: Tuple[int, int, int]) -> pygame.Surface:
+        superficie = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(superficie, cor, superficie.get_rect(), border_radius=15)
+        rotulo = fonte.render(self.texto, True, cor_texto)
+        superficie.blit(rotulo, rotulo.get_rect(center=superficie.get_rect().center))
+        if pygame.display.get_surface() is not None:
+            superficie = superficie.convert_alpha()
+        return superficie
+
+
+class CamadaWidgets:
+    """Os botões de uma tela e o estado do ponteiro sobre eles."""
+
+    def __init__(self, tamanho_celula: int = 64) -> None:
+        """Inicializa uma camada vazia.
+
+        Parâmetros:
+            tamanho_celula (int): O lado, em pixels, das células da grade espacial.
+        """
+        self.tamanho_celula = tamanho_celula
+        self.botoes: List[Botao] = []
+        self._grade: Dict[Tuple[int, int], List[Botao]] = {}
+        self._sob_ponteiro: Optional[Botao] = None
+        self._pressionado: Optional[Botao] = None
+        self.alterada = True
+
+    def adicionar(self, botao: Botao) -> Botao:
+        """Adiciona um botão à camada; botões adicionados depois ficam por cima.
+
+        Parâmetros:
+            botao (Botao): O botão.
+
+        Retorna:
+            Botao: O próprio botão, para ser guardado por quem o criou.
+        """
+        self.botoes.append(botao)
+        c = self.tamanho_celula
+        for cx in range(botao.rect.left // c, (botao.rect.right - 1) // c + 1):
+            for cy in range(botao.rect.top // c, (botao.rect.bottom - 1) // c + 1):
+                self._grade.setdefault((cx, cy), []).append(botao)
+        self.alterada = True
+        return botao
+
+    def botao_em(self, posicao: Tuple[int, int]) -> Optional[Botao]:
+        """Retorna o botão visível sob a posição, consultando só a célula da grade que a contém."""
+        for botao in reversed(self._grade.get((posicao[0] // self.tamanho_celula, posicao[1] // self.tamanho_celula), ())):
+            if botao.visivel and botao.rect.collidepoint(posicao):
+                return botao
+        return None
+
+    def apontar(self, posicao: Tuple[int, int]) -> None:
+        """Atualiza o destaque para o ponteiro na posição indicada (p. ex. ao entrar na tela)."""
+        botao = self.botao_em(posicao)
+        if botao is not self._sob_ponteiro:
+            if self._sob_ponteiro is not None:
+                self._sob_ponteiro.destacado = False
+            if botao is not None:
+                botao.destacado = True
+            self._sob_ponteiro = botao
+            self.alterada = True
+
+    def mostrar(self, visivel: bool) -> None:
+        """Mostra ou esconde todos os botões da camada; botões escondidos não recebem cliques."""
+        for botao in self.botoes:
+            if botao.visivel != visivel:
+                botao.visivel = visivel
+                self.alterada = True
+        if not visivel:
+            self.apontar((-1, -1))
+            self._pressionado = None
+
+    def tratar_eventos(self, eventos: List[pygame.event.Event]) -> List[Botao]:
+        """Atualiza o destaque e detecta cliques a partir dos eventos do mouse.
+
+        Parâmetros:
+            eventos (List[pygame.event.Event]): Os eventos recebidos neste quadro.
+
+        Retorna:
+            List[Botao]: Os botões clicados, na ordem dos cliques.
+        """
+        clicados = []
+        for evento in eventos:
+            if evento.type == pygame.MOUSEMOTION:
+                self.apontar(evento.pos)
+            elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+                self.apontar(evento.pos)
+                self._pressionado = self._sob_ponteiro
+            elif evento.type == pygame.MOUSEBUTTONUP and evento.button == 1:
+                self.apontar(evento.pos)
+                if self._pressionado is not None and self._pressionado is self._sob_ponteiro:
+                    clicados.append(self._pressionado)
+                    self.alterada = True
+                self._pressionado = None
+        return clicados
+
+    def desenhar(self, tela: pygame.Surface, rastreador=None) -> None:
+        """Desenha os botões visíveis, registrando-os no rastreador de regiões sujas, se houver.
+
+        Parâmetros:
+            tela (pygame.Surface): Onde desenhar.
+            rastreador (Optional[RastreadorSujo]): O rastreador do quadro atual.
+        """
+        for botao in self.botoes:
+            if not botao.visivel:
+                continue
+            rect = tela.blit(botao.destaque if botao.destacado else botao.normal, botao.rect)
+            if rastreador is not None:
+                rastreador.registrar(("botao", id(botao), botao.destacado), rect)
+        self.alterada = False